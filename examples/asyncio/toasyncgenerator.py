@@ -1,68 +1,18 @@
 import asyncio
-from asyncio import Future
 
 import rx
 from rx import operators as ops
 from rx.scheduler.eventloop import AsyncIOScheduler
-from rx.core import Observable
 
 
-def to_async_generator(sentinel=None):
-    loop = asyncio.get_event_loop()
-    future = Future()
-    notifications = []
-
-    def _to_async_generator(source: Observable):
-
-        def feeder():
-            nonlocal future
-
-            if not notifications or future.done():
-                return
-
-            notification = notifications.pop(0)
-
-            if notification.kind == "E":
-                future.set_exception(notification.exception)
-            elif notification.kind == "C":
-                future.set_result(sentinel)
-            else:
-                future.set_result(notification.value)
-
-        def on_next(value):
-            """Takes on_next values and appends them to the notification queue"""
-
-            notifications.append(value)
-            loop.call_soon(feeder)
-
-        source.pipe(ops.materialize()).subscribe(on_next)
-
-        @asyncio.coroutine
-        def gen():
-            """Generator producing futures"""
-            nonlocal future
-
-            loop.call_soon(feeder)
-            future = Future()
-
-            return future
-        return gen
-    return _to_async_generator
-
-
-@asyncio.coroutine
-def go(loop):
+async def go(loop):
     scheduler = AsyncIOScheduler(loop)
 
-    xs = rx.from_([x for x in range(10)], scheduler=scheduler)
-    gen = xs.pipe(to_async_generator())
+    xs = rx.interval(0.1, scheduler=scheduler).pipe(ops.take(10))
 
-    # Wish we could write something like:
-    # ys = (x for x in yield from gen())
-    while True:
-        x = yield from gen()
-        if x is None:
-            break
+    # Items are buffered until consumed, and the subscription is disposed
+    # when the loop ends.
+    async for x in xs.pipe(ops.to_async_iterable(maxsize=100)):
         print(x)
 
 
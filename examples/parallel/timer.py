@@ -1,4 +1,3 @@
-import concurrent.futures
 import time
 
 import rx
@@ -15,10 +14,12 @@ def sleep(tm):
 def output(result):
     print('%d seconds' % result)
 
-with concurrent.futures.ProcessPoolExecutor(5) as executor:
+
+if __name__ == '__main__':
     rx.from_(seconds).pipe(
-        ops.flat_map(lambda s: executor.submit(sleep, s))
-    ).subscribe(output)
+        ops.map_parallel(sleep, workers=5, ordered=False),
+        ops.do_action(output)
+    ).run()
 
 # 1 seconds
 # 2 seconds
@@ -533,7 +533,8 @@ def generate_with_relative_time(initial_state: Any,
 
 def generate(initial_state: Any,
              condition: typing.Predicate,
-             iterate: typing.Mapper
+             iterate: typing.Mapper,
+             yield_every: Optional[int] = None
              ) -> Observable:
     """Generates an observable sequence by running a state-driven loop
     producing the sequence's elements.
@@ -552,12 +553,16 @@ def generate(initial_state: Any,
         condition: Condition to terminate generation (upon returning
             :code:`False`).
         iterate: Iteration step function.
+        yield_every: [Optional] Number of elements to send out before
+            yielding back to the scheduler, so that other scheduled work
+            gets a chance to run. By default the whole sequence is sent
+            out in a single scheduled action.
 
     Returns:
         The generated sequence.
     """
     from .core.observable.generate import _generate
-    return _generate(initial_state, condition, iterate)
+    return _generate(initial_state, condition, iterate, yield_every)
 
 
 def hot(string: str,
@@ -795,7 +800,8 @@ def on_error_resume_next(*sources: Union[Observable, _Future]) -> Observable:
 def range(start: int,
           stop: Optional[int] = None,
           step: Optional[int] = None,
-          scheduler: Optional[typing.Scheduler] = None
+          scheduler: Optional[typing.Scheduler] = None,
+          yield_every: Optional[int] = None
           ) -> Observable:
     """Generates an observable sequence of integral numbers within a
     specified range, using the specified scheduler to send out observer
@@ -818,13 +824,17 @@ def range(start: int,
         scheduler: [Optional] The scheduler to schedule the values on. If not
             specified, the default is to use an instance of
             :class:`CurrentThreadScheduler <rx.scheduler.CurrentThreadScheduler>`.
+        yield_every: [Optional] Number of values to send out before
+            yielding back to the scheduler, so that other scheduled work
+            gets a chance to run. By default all values are sent out in
+            a single scheduled action.
 
     Returns:
         An observable sequence that contains a range of sequential
         integral numbers.
     """
     from .core.observable.range import _range
-    return _range(start, stop, step, scheduler)
+    return _range(start, stop, step, scheduler, yield_every)
 
 
 def return_value(value: Any, scheduler: Optional[typing.Scheduler] = None) -> Observable:
@@ -0,0 +1,208 @@
+# pylint: disable=redefined-builtin
+"""Asynchronous observable sequences for asyncio.
+
+The sequences in this module notify their observers with coroutines,
+and every notification is awaited before the producer continues, so a
+slow observer naturally holds back its producer. Producers run as tasks
+on the current asyncio event loop; disposing a subscription cancels
+them.
+"""
+
+import asyncio
+import builtins
+from typing import Any, AsyncIterable, Callable, Iterable, Optional
+
+from rx.core import AsyncObservable, AsyncObserver, abc, typing
+from rx.disposable import Disposable
+from rx.subject import AsyncStream
+
+
+def create(subscribe_async: Callable[[abc.AsyncObserver], Any]) -> AsyncObservable:
+    """Creates an asynchronous observable sequence from a subscription
+    coroutine function.
+
+    Args:
+        subscribe_async: Coroutine function which is given the observer
+            and returns a disposable, or a dispose function.
+
+    Returns:
+        The asynchronous observable sequence with the specified
+        implementation for the subscribe_async method.
+    """
+
+    return AsyncObservable(subscribe_async)
+
+
+def _from_worker(worker: Callable[[abc.AsyncObserver], Any]) -> AsyncObservable:
+    """Creates a sequence which runs the worker coroutine function as a
+    task for every subscription, and cancels the task on dispose."""
+
+    async def subscribe_async(observer: abc.AsyncObserver) -> typing.Disposable:
+        task = asyncio.ensure_future(worker(observer))
+        return Disposable(task.cancel)
+    return AsyncObservable(subscribe_async)
+
+
+def from_iterable(iterable: Iterable) -> AsyncObservable:
+    """Converts an iterable to an asynchronous observable sequence. The
+    next element is not taken from the iterable before the observer is
+    done with the previous one.
+
+    Example:
+        >>> source = rx.aio.from_iterable([1, 2, 3])
+
+    Args:
+        iterable: An iterable sequence of elements.
+
+    Returns:
+        The asynchronous observable sequence whose elements are pulled
+        from the given iterable.
+    """
+
+    async def worker(observer: abc.AsyncObserver) -> None:
+        try:
+            for value in iterable:
+                await observer.on_next_async(value)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            await observer.on_error_async(error)
+        else:
+            await observer.on_completed_async()
+    return _from_worker(worker)
+
+
+from_ = from_iterable
+
+
+def from_async_iterable(iterable: AsyncIterable) -> AsyncObservable:
+    """Converts an asynchronous iterable to an asynchronous observable
+    sequence.
+
+    Since observables are asynchronous iterables, this can also be used
+    to bridge an :class:`Observable <rx.Observable>` into the
+    asynchronous family.
+
+    Example:
+        >>> source = rx.aio.from_async_iterable(rx.interval(1.0))
+
+    Args:
+        iterable: An asynchronous iterable sequence of elements.
+
+    Returns:
+        The asynchronous observable sequence whose elements are pulled
+        from the given asynchronous iterable.
+    """
+
+    async def worker(observer: abc.AsyncObserver) -> None:
+        try:
+            async for value in iterable:
+                await observer.on_next_async(value)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:  # pylint: disable=broad-except
+            await observer.on_error_async(error)
+        else:
+            await observer.on_completed_async()
+    return _from_worker(worker)
+
+
+def return_value(value: Any) -> AsyncObservable:
+    """Returns an asynchronous observable sequence that contains a
+    single element.
+
+    Args:
+        value: Single element in the resulting sequence.
+
+    Returns:
+        An asynchronous observable sequence containing the single
+        specified element.
+    """
+
+    return from_iterable([value])
+
+
+just = return_value
+
+
+def empty() -> AsyncObservable:
+    """Returns an empty asynchronous observable sequence.
+
+    Returns:
+        An asynchronous observable sequence with no elements.
+    """
+
+    return from_iterable([])
+
+
+def never() -> AsyncObservable:
+    """Returns a non-terminating asynchronous observable sequence.
+
+    Returns:
+        An asynchronous observable sequence whose observers will never
+        get called.
+    """
+
+    return AsyncObservable()
+
+
+def throw(exception: Exception) -> AsyncObservable:
+    """Returns an asynchronous observable sequence that terminates with
+    an exception.
+
+    Args:
+        exception: An object used for the sequence's termination.
+
+    Returns:
+        The asynchronous observable sequence that terminates
+        exceptionally with the specified exception object.
+    """
+
+    exception = exception if isinstance(exception, Exception) else Exception(exception)
+
+    async def worker(observer: abc.AsyncObserver) -> None:
+        await observer.on_error_async(exception)
+    return _from_worker(worker)
+
+
+def range(start: int, stop: Optional[int] = None, step: Optional[int] = None) -> AsyncObservable:
+    """Generates an asynchronous observable sequence of integral
+    numbers within a specified range, like the built-in range.
+
+    Example:
+        >>> res = rx.aio.range(10)
+        >>> res = rx.aio.range(0, 10, 2)
+
+    Args:
+        start: The value of the first integer in the sequence, or the
+            stop value if no stop is given.
+        stop: [Optional] Generated numbers will be less than this value.
+        step: [Optional] Increment value.
+
+    Returns:
+        An asynchronous observable sequence that contains a range of
+        sequential integral numbers.
+    """
+
+    if stop is None:
+        start, stop = 0, start
+    return from_iterable(builtins.range(start, stop, step or 1))
+
+
+def merge(*sources: AsyncObservable) -> AsyncObservable:
+    """Merges all the asynchronous observable sequences into a single
+    asynchronous observable sequence.
+
+    Example:
+        >>> res = rx.aio.merge(xs, ys, zs)
+
+    Args:
+        sources: Sequences to merge.
+
+    Returns:
+        The asynchronous observable sequence that merges the elements
+        of the given sequences.
+    """
+
+    from .operators import merge_all
+    return merge_all()(from_iterable(sources))
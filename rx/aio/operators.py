@@ -0,0 +1,196 @@
+# pylint: disable=redefined-builtin
+"""Operators for asynchronous observable sequences.
+
+Mappers and predicates may be plain functions or coroutine functions;
+results that are awaitable are awaited before they are used.
+"""
+
+import asyncio
+import inspect
+from typing import Any, Callable
+
+from rx.core import AsyncObservable, AsyncObserver, abc, typing
+from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
+
+
+async def _call(func: Callable, value: Any) -> Any:
+    result = func(value)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+def map(mapper: Callable[[Any], Any]) -> Callable[[AsyncObservable], AsyncObservable]:
+    """Project each element of an asynchronous observable sequence into
+    a new form.
+
+    Example:
+        >>> map(lambda value: value * 10)
+        >>> map(fetch_async)
+
+    Args:
+        mapper: A function or coroutine function to apply to each
+            element.
+
+    Returns:
+        An operator function that takes an asynchronous observable
+        source and returns a sequence whose elements are the result of
+        invoking the mapper on each element of the source.
+    """
+
+    def _map(source: AsyncObservable) -> AsyncObservable:
+        async def subscribe_async(observer: abc.AsyncObserver) -> typing.Disposable:
+            async def on_next_async(value: Any) -> None:
+                try:
+                    result = await _call(mapper, value)
+                except Exception as err:  # pylint: disable=broad-except
+                    await observer.on_error_async(err)
+                else:
+                    await observer.on_next_async(result)
+
+            return await source.subscribe_async(
+                AsyncObserver(on_next_async, observer.on_error_async, observer.on_completed_async))
+        return AsyncObservable(subscribe_async)
+    return _map
+
+
+def filter(predicate: Callable[[Any], Any]) -> Callable[[AsyncObservable], AsyncObservable]:
+    """Filters the elements of an asynchronous observable sequence based
+    on a predicate.
+
+    Example:
+        >>> filter(lambda value: value < 10)
+
+    Args:
+        predicate: A function or coroutine function to test each
+            element for a condition.
+
+    Returns:
+        An operator function that takes an asynchronous observable
+        source and returns a sequence that contains the elements of the
+        source that satisfy the condition.
+    """
+
+    def _filter(source: AsyncObservable) -> AsyncObservable:
+        async def subscribe_async(observer: abc.AsyncObserver) -> typing.Disposable:
+            async def on_next_async(value: Any) -> None:
+                try:
+                    should_run = await _call(predicate, value)
+                except Exception as err:  # pylint: disable=broad-except
+                    await observer.on_error_async(err)
+                    return
+
+                if should_run:
+                    await observer.on_next_async(value)
+
+            return await source.subscribe_async(
+                AsyncObserver(on_next_async, observer.on_error_async, observer.on_completed_async))
+        return AsyncObservable(subscribe_async)
+    return _filter
+
+
+def flat_map(mapper: Callable[[Any], Any]) -> Callable[[AsyncObservable], AsyncObservable]:
+    """Projects each element of an asynchronous observable sequence to
+    an asynchronous observable sequence and merges the resulting
+    sequences into one sequence.
+
+    Inner sequences run concurrently. Their notifications are passed to
+    the observer one at a time, so an inner sequence waits while the
+    observer handles an element of another one.
+
+    Example:
+        >>> flat_map(lambda value: rx.aio.range(value))
+
+    Args:
+        mapper: A function or coroutine function returning an
+            asynchronous observable sequence for each element.
+
+    Returns:
+        An operator function that takes an asynchronous observable
+        source and returns a sequence whose elements are those of the
+        inner sequences.
+    """
+
+    def _flat_map(source: AsyncObservable) -> AsyncObservable:
+        async def subscribe_async(observer: abc.AsyncObserver) -> typing.Disposable:
+            group = CompositeDisposable()
+            gate = asyncio.Lock()
+            active = 1
+
+            async def forward_next(value: Any) -> None:
+                async with gate:
+                    await observer.on_next_async(value)
+
+            async def forward_error(error: Exception) -> None:
+                async with gate:
+                    await observer.on_error_async(error)
+                group.dispose()
+
+            async def complete() -> None:
+                nonlocal active
+                active -= 1
+                if not active:
+                    async with gate:
+                        await observer.on_completed_async()
+
+            async def on_next_async(value: Any) -> None:
+                nonlocal active
+                try:
+                    inner = await _call(mapper, value)
+                except Exception as err:  # pylint: disable=broad-except
+                    await forward_error(err)
+                    return
+
+                active += 1
+                inner_subscription = SingleAssignmentDisposable()
+                group.add(inner_subscription)
+
+                async def on_completed_async() -> None:
+                    # Removing the inner subscription cancels the task it
+                    # runs in, which is the one running this handler, so
+                    # only do so once the observer is done with it.
+                    await complete()
+                    group.remove(inner_subscription)
+
+                inner_subscription.disposable = await inner.subscribe_async(
+                    AsyncObserver(forward_next, forward_error, on_completed_async))
+
+            group.add(await source.subscribe_async(AsyncObserver(on_next_async, forward_error, complete)))
+            return group
+        return AsyncObservable(subscribe_async)
+    return _flat_map
+
+
+def merge_all() -> Callable[[AsyncObservable], AsyncObservable]:
+    """Merges an asynchronous observable sequence of asynchronous
+    observable sequences into a single sequence.
+
+    Returns:
+        An operator function that takes an asynchronous observable
+        sequence of sequences and returns the sequence that merges the
+        elements of the inner sequences.
+    """
+
+    return flat_map(lambda inner: inner)
+
+
+def merge(*sources: AsyncObservable) -> Callable[[AsyncObservable], AsyncObservable]:
+    """Merges the source with the given asynchronous observable
+    sequences into a single sequence.
+
+    Example:
+        >>> merge(ys, zs)
+
+    Args:
+        sources: Sequences to merge with the source.
+
+    Returns:
+        An operator function that takes an asynchronous observable
+        source and returns the sequence that merges the elements of the
+        source and the given sequences.
+    """
+
+    def _merge(source: AsyncObservable) -> AsyncObservable:
+        from . import merge as merge_
+        return merge_(source, *sources)
+    return _merge
@@ -3,4 +3,6 @@ from .pipe import pipe
 
 from .observable import Observable, ConnectableObservable
 from .observable import GroupedObservable
-from .observer import Observer
+from .observable import IterableObservable, ControlledObservable
+from .observable import AsyncObservable
+from .observer import Observer, AsyncObserver
@@ -5,3 +5,5 @@ from .scheduler import Scheduler
 from .periodicscheduler import PeriodicScheduler
 from .startable import Startable
 from .subject import Subject
+from .asyncobservable import AsyncObservable
+from .asyncobserver import AsyncObserver
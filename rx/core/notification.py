@@ -9,6 +9,8 @@ from .observable import Observable
 class Notification:
     """Represents a notification to an observer."""
 
+    __slots__ = ('has_value', 'value', 'kind')
+
     def __init__(self) -> None:
         """Default constructor used by derived types."""
         self.has_value = False
@@ -84,6 +86,8 @@ class Notification:
 class OnNext(Notification):
     """Represents an OnNext notification to an observer."""
 
+    __slots__ = ()
+
     def __init__(self, value):
         """Constructs a notification of a new value."""
 
@@ -105,6 +109,8 @@ class OnNext(Notification):
 class OnError(Notification):
     """Represents an OnError notification to an observer."""
 
+    __slots__ = ('exception',)
+
     def __init__(self, exception):
         """Constructs a notification of an exception."""
 
@@ -125,6 +131,8 @@ class OnError(Notification):
 class OnCompleted(Notification):
     """Represents an OnCompleted notification to an observer."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Constructs a notification of the end of a sequence."""
 
@@ -1,3 +1,7 @@
 from .observable import Observable
 from .connectableobservable import ConnectableObservable
 from .groupedobservable import GroupedObservable
+from .iterableobservable import IterableObservable
+from .controlledobservable import ControlledObservable
+from .fusedobservable import FusedObservable
+from .asyncobservable import AsyncObservable
@@ -0,0 +1,98 @@
+from typing import Any, Awaitable, Callable, Optional, Union
+
+from rx.disposable import Disposable
+
+from .. import abc, typing
+from ..observer.asyncobserver import AsyncObserver, AutoDetachAsyncObserver
+
+AsyncSubscription = Callable[[abc.AsyncObserver], Awaitable[typing.Disposable]]
+
+
+class AsyncObservable(abc.AsyncObservable):
+    """Observable base class for sequences which notify their observers
+    with coroutines, so that every element is awaited by the producer
+    before the next one is sent.
+
+    Subscribing is a coroutine as well, and must be awaited on a
+    running asyncio event loop.
+    """
+
+    def __init__(self, subscribe_async: Optional[AsyncSubscription] = None) -> None:
+        """Creates an asynchronous observable sequence from the
+        specified subscription coroutine function.
+
+        Args:
+            subscribe_async: [Optional] Subscription coroutine function,
+                returning a disposable.
+        """
+
+        super().__init__()
+        self._subscribe_async = subscribe_async
+
+    async def _subscribe_async_core(self, observer: abc.AsyncObserver) -> typing.Disposable:
+        if self._subscribe_async:
+            return await self._subscribe_async(observer)
+        return Disposable()
+
+    async def subscribe_async(self,  # pylint: disable=arguments-differ
+                              observer: Optional[Union[abc.AsyncObserver, Callable[[Any], Awaitable]]] = None,
+                              on_error_async: Optional[Callable[[Exception], Awaitable]] = None,
+                              on_completed_async: Optional[Callable[[], Awaitable]] = None
+                              ) -> typing.Disposable:
+        """Subscribe an asynchronous observer to the sequence.
+
+        You may subscribe using an observer or coroutine functions, not
+        both.
+
+        Examples:
+            >>> await source.subscribe_async(observer)
+            >>> await source.subscribe_async(on_next_async)
+            >>> await source.subscribe_async(on_next_async, on_error_async, on_completed_async)
+
+        Args:
+            observer: [Optional] The observer that is to receive
+                notifications, or a coroutine function to invoke for
+                each element in the sequence.
+            on_error_async: [Optional] Coroutine function to invoke upon
+                exceptional termination of the sequence.
+            on_completed_async: [Optional] Coroutine function to invoke
+                upon graceful termination of the sequence.
+
+        Returns:
+            Disposable object representing an observer's subscription
+            to the sequence.
+        """
+
+        if not isinstance(observer, abc.AsyncObserver):
+            observer = AsyncObserver(observer, on_error_async, on_completed_async)
+
+        auto_detach_observer = AutoDetachAsyncObserver(observer)
+        try:
+            subscription = await self._subscribe_async_core(auto_detach_observer)
+        except Exception as ex:  # By design. pylint: disable=W0703
+            if auto_detach_observer.is_stopped:
+                raise
+            await auto_detach_observer.on_error_async(ex)
+        else:
+            if not hasattr(subscription, 'dispose'):
+                subscription = Disposable(subscription)
+            auto_detach_observer.subscription = subscription
+
+        return Disposable(auto_detach_observer.dispose)
+
+    def pipe(self, *operators: Callable[['AsyncObservable'], Any]) -> Any:
+        """Compose multiple operators left to right.
+
+        Examples:
+            >>> source.pipe() == source
+            >>> source.pipe(f) == f(source)
+            >>> source.pipe(g, f) == f(g(source))
+
+        Args:
+            operators: Sequence of operators.
+
+        Returns:
+             The composed observable.
+        """
+        from ..pipe import pipe
+        return pipe(*operators)(self)
@@ -1,6 +1,7 @@
 from typing import Optional
 
 from rx.core import Observable, typing
+from rx.core.observer import SerializedObserver
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
 
 
@@ -17,12 +18,11 @@ def _combine_latest(*sources: Observable) -> Observable:
         elements of the sources into a tuple.
     """
 
-    parent = sources[0]
-
     def subscribe(observer: typing.Observer,
                   scheduler: Optional[typing.Scheduler] = None
                   ) -> CompositeDisposable:
 
+        serialized = SerializedObserver(observer)
         n = len(sources)
         has_value = [False] * n
         has_value_all = [False]
@@ -52,15 +52,13 @@ def _combine_latest(*sources: Observable) -> Observable:
             subscriptions[i] = SingleAssignmentDisposable()
 
             def on_next(x):
-                with parent.lock:
-                    values[i] = x
-                    _next(i)
-
-            def on_completed():
-                with parent.lock:
-                    done(i)
+                values[i] = x
+                _next(i)
 
-            subscriptions[i].disposable = sources[i].subscribe_(on_next, observer.on_error, on_completed, scheduler)
+            subscriptions[i].disposable = sources[i].subscribe_(lambda x: serialized.serialize(on_next, x),
+                                                                serialized.on_error,
+                                                                lambda: serialized.serialize(done, i),
+                                                                scheduler)
 
         for idx in range(n):
             func(idx)
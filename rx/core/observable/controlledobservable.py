@@ -0,0 +1,222 @@
+import threading
+from abc import abstractmethod
+from collections import deque
+from operator import length_hint
+from typing import Any, Deque, Iterator, List, Optional
+
+from rx.disposable import CompositeDisposable, Disposable
+from rx.scheduler import current_thread_scheduler
+
+from .. import typing
+from .observable import Observable
+from .iterableobservable import IterableObservable
+
+
+_EMPTY = object()
+
+
+class _Producer(typing.Disposable):
+    """Abstract base of the producers forwarding the elements of a single
+    subscription to its observer, no more than have been requested."""
+
+    def __init__(self, observer: typing.Observer) -> None:
+        self.observer = observer
+        self.lock = threading.RLock()
+        self.demand = 0
+        self.is_emitting = False
+        self.is_disposed = False
+
+    def request(self, number: int) -> None:
+        with self.lock:
+            self.demand += number
+            if self.is_emitting or self.is_disposed:
+                return
+            self.is_emitting = True
+
+        self.emit()
+
+    @abstractmethod
+    def emit(self) -> None:
+        """Emits as many elements as there is demand for. Called by
+        request when no emission is in progress."""
+
+        raise NotImplementedError
+
+    def dispose(self) -> None:
+        with self.lock:
+            self.is_disposed = True
+
+
+class _PullProducer(_Producer):
+    """Pulls the requested number of elements from an iterator, on the
+    given scheduler. Once the demand is met, the producer checks whether
+    the iterator is exhausted, so that completion does not wait for more
+    demand. Iterators which report their exact remaining length, such as
+    those of ranges and lists, are never read ahead; others are read at
+    most one element ahead, which is kept until requested."""
+
+    def __init__(self,
+                 observer: typing.Observer,
+                 iterator: Iterator,
+                 scheduler: typing.Scheduler
+                 ) -> None:
+        super().__init__(observer)
+        self.iterator = iterator
+        self.scheduler = scheduler
+        self.next_value: Any = _EMPTY
+
+    def emit(self) -> None:
+        self.scheduler.schedule(self.run)
+
+    def run(self, scheduler: typing.Scheduler, state: Any = None) -> None:
+        observer = self.observer
+
+        while True:
+            with self.lock:
+                count, self.demand = self.demand, 0
+                if not count or self.is_disposed:
+                    self.is_emitting = False
+                    return
+
+            for _ in range(count):
+                if self.is_disposed:
+                    break
+
+                value, self.next_value = self.next_value, _EMPTY
+                if value is _EMPTY:
+                    value = self.pull()
+                    if value is _EMPTY:
+                        return
+
+                observer.on_next(value)
+
+            if self.is_disposed or self.next_value is not _EMPTY:
+                continue
+
+            remaining = length_hint(self.iterator, -1)
+            if remaining == 0:
+                self.dispose()
+                observer.on_completed()
+                return
+            if remaining < 0:
+                self.next_value = self.pull()
+                if self.next_value is _EMPTY:
+                    return
+
+    def pull(self) -> Any:
+        """Returns the next element of the iterator, or _EMPTY once the
+        sequence has been terminated."""
+
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            self.dispose()
+            self.observer.on_completed()
+        except Exception as error:  # pylint: disable=broad-except
+            self.dispose()
+            self.observer.on_error(error)
+        return _EMPTY
+
+
+class _BufferedProducer(_Producer):
+    """Buffers the elements pushed by the source until they are
+    requested."""
+
+    def __init__(self, observer: typing.Observer) -> None:
+        super().__init__(observer)
+        self.queue: Deque[Any] = deque()
+        self.terminal: Optional[typing.Action] = None
+
+    def on_next(self, value: Any) -> None:
+        self.queue.append(value)
+        self.request(0)
+
+    def on_error(self, error: Exception) -> None:
+        self.terminal = lambda: self.observer.on_error(error)
+        self.request(0)
+
+    def on_completed(self) -> None:
+        self.terminal = self.observer.on_completed
+        self.request(0)
+
+    def emit(self) -> None:
+        observer = self.observer
+        queue = self.queue
+
+        while True:
+            with self.lock:
+                if self.is_disposed:
+                    self.is_emitting = False
+                    return
+
+                if self.demand and queue:
+                    self.demand -= 1
+                    value = queue.popleft()
+                elif not queue and self.terminal:
+                    self.is_disposed = True
+                    terminal = self.terminal
+                    break
+                else:
+                    self.is_emitting = False
+                    return
+
+            observer.on_next(value)
+
+        terminal()
+
+
+class ControlledObservable(Observable):
+    """Represents an observable sequence which only emits elements once
+    they are requested by calling request.
+
+    If the source is an IterableObservable, elements are pulled from it
+    only as requested, so the source is never read ahead. Any other
+    source is subscribed to immediately, and the elements it pushes are
+    buffered until they are requested.
+    """
+
+    def __init__(self, source: Observable, scheduler: Optional[typing.Scheduler] = None) -> None:
+        super().__init__()
+        self.source = source
+        self.scheduler = scheduler
+        self.producers: List[_Producer] = []
+
+    def _subscribe_core(self, observer, scheduler=None):
+        source = self.source
+
+        if isinstance(source, IterableObservable):
+            _scheduler = self.scheduler or scheduler or current_thread_scheduler
+            producer: _Producer = _PullProducer(observer, source.iterate(), _scheduler)
+            subscription: typing.Disposable = Disposable()
+        else:
+            producer = _BufferedProducer(observer)
+            subscription = source.subscribe_(producer.on_next, producer.on_error, producer.on_completed,
+                                             self.scheduler or scheduler)
+
+        with self.lock:
+            self.producers.append(producer)
+
+        def dispose():
+            producer.dispose()
+            with self.lock:
+                if producer in self.producers:
+                    self.producers.remove(producer)
+
+        return CompositeDisposable(subscription, Disposable(dispose))
+
+    def request(self, number: int) -> None:
+        """Requests the given number of elements to be emitted to every
+        current subscriber, in addition to those requested before.
+
+        Args:
+            number: The number of elements to request.
+        """
+
+        if number < 0:
+            raise ValueError("number must not be negative")
+
+        with self.lock:
+            producers = list(self.producers)
+
+        for producer in producers:
+            producer.request(number)
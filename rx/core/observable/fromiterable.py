@@ -1,6 +1,6 @@
 from typing import Iterable, Any, Optional
 
-from rx.core import Observable, typing
+from rx.core import Observable, IterableObservable, typing
 from rx.scheduler import current_thread_scheduler
 from rx.disposable import CompositeDisposable, Disposable
 
@@ -43,4 +43,4 @@ def from_iterable(iterable: Iterable, scheduler: Optional[typing.Scheduler] = No
 
         disp = Disposable(dispose)
         return CompositeDisposable(_scheduler.schedule(action), disp)
-    return Observable(subscribe)
+    return IterableObservable(subscribe, lambda: iter(iterable))
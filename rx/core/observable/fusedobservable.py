@@ -0,0 +1,109 @@
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from .. import typing
+from ..observer import AutoDetachObserver
+from .observable import Observable
+from .iterableobservable import IterableObservable
+
+MAP = 0
+FILTER = 1
+TAP = 2
+
+Stage = Tuple[int, Callable[[Any], Any]]
+
+
+class FusedObservable(Observable):
+    """Represents an observable sequence which applies a chain of
+    stateless stages, as added by map, filter and do_action, to the
+    elements of its source.
+
+    All stages run within a single observer subscribed to the source,
+    instead of one observer per operator. Applying another of these
+    operators to a fused observable extends its chain, so a pipeline of
+    such operators subscribes to its source only once. Errors are
+    handled as if the stages were separate operators: an exception
+    raised by any stage terminates the sequence with that exception.
+    """
+
+    def __init__(self, source: Observable, stages: Tuple[Stage, ...]) -> None:
+        Observable.__init__(self)
+        self.source = source
+        self.stages = stages
+
+    def _subscribe_core(self,
+                        observer: typing.Observer,
+                        scheduler: Optional[typing.Scheduler] = None
+                        ) -> typing.Disposable:
+        stages = self.stages
+        observer_on_next = observer.on_next
+        observer_on_error = observer.on_error
+
+        def on_next(value: Any) -> None:
+            # Sources emitting from within the subscribe call can only be
+            # stopped through their observer.
+            if observer.is_stopped:
+                upstream.dispose()
+                return
+
+            try:
+                for kind, func in stages:
+                    if kind == MAP:
+                        value = func(value)
+                    elif kind == FILTER:
+                        if not func(value):
+                            return
+                    else:
+                        func(value)
+            except Exception as err:  # pylint: disable=broad-except
+                observer_on_error(err)
+                return
+            observer_on_next(value)
+
+        upstream = AutoDetachObserver(on_next, observer_on_error, observer.on_completed)
+        return self.source._subscribe_auto_detach(upstream, scheduler)  # pylint: disable=protected-access
+
+
+class FusedIterableObservable(FusedObservable, IterableObservable):
+    """Fused observable over an iterable observable, whose elements can
+    also be pulled through the chain of stages."""
+
+    def __init__(self, source: IterableObservable, stages: Tuple[Stage, ...]) -> None:
+        FusedObservable.__init__(self, source, stages)
+
+    def iterate(self) -> Iterator:  # pylint: disable=method-hidden
+        stages = self.stages
+        for value in self.source.iterate():
+            for kind, func in stages:
+                if kind == MAP:
+                    value = func(value)
+                elif kind == FILTER:
+                    if not func(value):
+                        break
+                else:
+                    func(value)
+            else:
+                yield value
+
+
+def fuse(source: Observable, kind: int, func: Callable[[Any], Any]) -> FusedObservable:
+    """Applies a stateless stage to the source, extending its chain of
+    stages if the source is a fused observable itself.
+
+    Args:
+        source: The source observable.
+        kind: The kind of stage; MAP, FILTER or TAP.
+        func: The mapper, predicate or action of the stage.
+
+    Returns:
+        A fused observable sequence with the stage applied.
+    """
+
+    if isinstance(source, FusedObservable):
+        stages = source.stages + ((kind, func),)
+        source = source.source
+    else:
+        stages = ((kind, func),)
+
+    if isinstance(source, IterableObservable):
+        return FusedIterableObservable(source, stages)
+    return FusedObservable(source, stages)
@@ -1,49 +1,67 @@
-from typing import Any
+from typing import Any, Optional
 
-from rx.core import Observable
+from rx.core import Observable, IterableObservable, typing
 from rx.core.typing import Mapper, Predicate
 from rx.scheduler import current_thread_scheduler
-from rx.disposable import MultipleAssignmentDisposable
+from rx.disposable import CompositeDisposable, Disposable, MultipleAssignmentDisposable
 
 
 def _generate(initial_state: Any,
               condition: Predicate,
-              iterate: Mapper
+              iterate: Mapper,
+              yield_every: Optional[int] = None
               ) -> Observable:
+    if yield_every is not None and yield_every < 1:
+        raise ValueError("yield_every must be a positive integer")
 
     def subscribe(observer, scheduler=None):
         scheduler = scheduler or current_thread_scheduler
         first = True
         state = initial_state
+        disposed = False
         mad = MultipleAssignmentDisposable()
 
-        def action(scheduler, state1=None):
+        def action(scheduler: typing.Scheduler, _: Any = None) -> None:
             nonlocal first
             nonlocal state
 
-            has_result = False
-            result = None
+            count = 0
+            # The observer is stopped by downstream operators such as take,
+            # before this subscription has even been returned when the
+            # scheduler runs the action right away.
+            while not disposed and not observer.is_stopped:
+                try:
+                    if first:
+                        first = False
+                    else:
+                        state = iterate(state)
 
-            try:
-                if first:
-                    first = False
-                else:
-                    state = iterate(state)
+                    has_result = condition(state)
+                except Exception as exception:  # pylint: disable=broad-except
+                    observer.on_error(exception)
+                    return
 
-                has_result = condition(state)
-                if has_result:
-                    result = state
+                if not has_result:
+                    observer.on_completed()
+                    return
 
-            except Exception as exception:  # pylint: disable=broad-except
-                observer.on_error(exception)
-                return
+                observer.on_next(state)
+                count += 1
+                if count == yield_every:
+                    mad.disposable = scheduler.schedule(action)
+                    return
 
-            if has_result:
-                observer.on_next(result)
-                mad.disposable = scheduler.schedule(action)
-            else:
-                observer.on_completed()
+        def dispose() -> None:
+            nonlocal disposed
+            disposed = True
 
         mad.disposable = scheduler.schedule(action)
-        return mad
-    return Observable(subscribe)
+        return CompositeDisposable(mad, Disposable(dispose))
+
+    def generator():
+        state = initial_state
+        while condition(state):
+            yield state
+            state = iterate(state)
+
+    return IterableObservable(subscribe, generator)
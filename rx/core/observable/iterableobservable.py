@@ -0,0 +1,30 @@
+from typing import Callable, Iterator, Optional
+
+from .. import typing
+from .observable import Observable
+
+
+class IterableObservable(Observable):
+    """Represents an observable sequence whose elements are taken from an
+    iterator, such as the sequences created by from_iterable, range and
+    generate.
+
+    Besides being subscribed to like any other observable, its elements
+    can be pulled one by one from a fresh iterator returned by iterate.
+    This is what allows a ControlledObservable to produce only as many
+    elements as have been requested.
+    """
+
+    def __init__(self,
+                 subscribe: Optional[typing.Subscription],
+                 iterate: Callable[[], Iterator]
+                 ) -> None:
+        """Creates an iterable observable sequence.
+
+        Args:
+            subscribe: Subscription function pushing the elements.
+            iterate: Factory returning a new iterator over the elements.
+        """
+
+        super().__init__(subscribe)
+        self.iterate = iterate
@@ -17,12 +17,17 @@ F = TypeVar('F')
 G = TypeVar('G')
 
 
+_lock_guard = threading.Lock()
+
+
 class Observable(typing.Observable):
     """Observable base class.
 
     Represents a push-style collection, which you can :func:`pipe <pipe>` into
     :mod:`operators <rx.operators>`."""
 
+    _lock: Optional[threading.RLock] = None
+
     def __init__(self, subscribe: Optional[typing.Subscription] = None) -> None:
         """Creates an observable sequence object from the specified
         subscription function.
@@ -32,9 +37,26 @@ class Observable(typing.Observable):
         """
         super().__init__()
 
-        self.lock = threading.RLock()
         self._subscribe = subscribe
 
+    @property
+    def lock(self) -> threading.RLock:
+        """Reentrant lock of the observable, for the few operators and
+        subclasses that synchronize on it. Created on first use, since
+        most observables never need one."""
+
+        lock = self._lock
+        if lock is None:
+            with _lock_guard:
+                lock = self._lock
+                if lock is None:
+                    lock = self._lock = threading.RLock()
+        return lock
+
+    @lock.setter
+    def lock(self, value: threading.RLock) -> None:
+        self._lock = value
+
     def _subscribe_core(self,
                         observer: typing.Observer,
                         scheduler: Optional[typing.Scheduler] = None
@@ -120,7 +142,25 @@ class Observable(typing.Observable):
             the observable sequence.
         """
 
-        auto_detach_observer = AutoDetachObserver(on_next, on_error, on_completed)
+        return self._subscribe_auto_detach(AutoDetachObserver(on_next, on_error, on_completed), scheduler)
+
+    def _subscribe_auto_detach(self,
+                               auto_detach_observer: AutoDetachObserver,
+                               scheduler: Optional[typing.Scheduler] = None
+                               ) -> typing.Disposable:
+        """Subscribes the given auto detach observer to the observable
+        sequence. Operators holding on to the observer can stop it, and
+        so its source, before the subscription has been returned, as
+        happens with sources emitting synchronously while subscribed.
+
+        Args:
+            auto_detach_observer: The observer to subscribe.
+            scheduler: [Optional] The scheduler to use for this
+                subscription.
+
+        Returns:
+            Disposable object representing the subscription.
+        """
 
         def fix_subscriber(subscriber):
             """Fixes subscriber to make sure it returns a Disposable instead
@@ -291,6 +331,21 @@ class Observable(typing.Observable):
         from ..operators.tofuture import _to_future
         return iter(self.pipe(_to_future()))
 
+    def __aiter__(self) -> Any:
+        """Asynchronously iterates the given observable.
+
+        Example:
+            >>> async for value in source:
+            ...     print(value)
+
+        Returns:
+            An asynchronous iterator over the items of the observable
+            sequence. See :func:`to_async_iterable
+            <rx.operators.to_async_iterable>` for how items are buffered.
+        """
+        from ..operators.toasynciterable import _to_async_iterable
+        return _to_async_iterable()(self).__aiter__()
+
     def __add__(self, other) -> 'Observable':
         """Pythonic version of :func:`concat <rx.concat>`.
 
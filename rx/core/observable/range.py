@@ -1,15 +1,16 @@
-from typing import Optional
+from typing import Any, Optional
 
 from rx.core import typing
-from rx.core import Observable
+from rx.core import Observable, IterableObservable
 from rx.scheduler import current_thread_scheduler
-from rx.disposable import MultipleAssignmentDisposable
+from rx.disposable import CompositeDisposable, Disposable, MultipleAssignmentDisposable
 
 
 def _range(start: int,
            stop: Optional[int] = None,
            step: Optional[int] = None,
-           scheduler: Optional[typing.Scheduler] = None
+           scheduler: Optional[typing.Scheduler] = None,
+           yield_every: Optional[int] = None
            ) -> Observable:
     """Generates an observable sequence of integral numbers within a
     specified range, using the specified scheduler to send out observer
@@ -24,12 +25,18 @@ def _range(start: int,
         start: The value of the first integer in the sequence.
         count: The number of sequential integers to generate.
         scheduler: The scheduler to schedule the values on.
+        yield_every: [Optional] Number of values to send out before
+            yielding back to the scheduler. By default all values are
+            sent out in a single scheduled action.
 
     Returns:
         An observable sequence that contains a range of sequential
         integral numbers.
     """
 
+    if yield_every is not None and yield_every < 1:
+        raise ValueError("yield_every must be a positive integer")
+
     if step is None and stop is None:
         range_t = range(start)
     elif step is None:
@@ -38,18 +45,31 @@ def _range(start: int,
         range_t = range(start, stop, step)
 
     def subscribe(observer, scheduler_: typing.Scheduler = None):
-        nonlocal range_t
-
         _scheduler = scheduler or scheduler_ or current_thread_scheduler
+        iterator = iter(range_t)
         sd = MultipleAssignmentDisposable()
+        disposed = False
 
-        def action(scheduler, iterator):
-            try:
-                observer.on_next(next(iterator))
-                sd.disposable = _scheduler.schedule(action, state=iterator)
-            except StopIteration:
+        def action(scheduler: typing.Scheduler, _: Any = None) -> None:
+            count = 0
+            for value in iterator:
+                # The observer is stopped by downstream operators such as
+                # take, before this subscription has even been returned
+                # when the scheduler runs the action right away.
+                if disposed or observer.is_stopped:
+                    return
+                observer.on_next(value)
+                count += 1
+                if count == yield_every:
+                    sd.disposable = scheduler.schedule(action)
+                    return
+            if not disposed:
                 observer.on_completed()
 
-        sd.disposable = _scheduler.schedule(action, iter(range_t))
-        return sd
-    return Observable(subscribe)
+        def dispose() -> None:
+            nonlocal disposed
+            disposed = True
+
+        sd.disposable = _scheduler.schedule(action)
+        return CompositeDisposable(sd, Disposable(dispose))
+    return IterableObservable(subscribe, lambda: iter(range_t))
@@ -1,4 +1,6 @@
 from .observer import Observer
 from .scheduledobserver import ScheduledObserver
-from .observeonobserver import ObserveOnObserver
+from .observeonobserver import ObserveOnObserver, OverflowStats
 from .autodetachobserver import AutoDetachObserver
+from .serializedobserver import SerializedObserver
+from .asyncobserver import AsyncObserver, AutoDetachAsyncObserver
@@ -0,0 +1,104 @@
+from typing import Any, Awaitable, Callable, Optional
+
+from rx.disposable import SingleAssignmentDisposable
+
+from .. import abc, typing
+
+
+async def _noop_async(*_: Any) -> None:
+    pass
+
+
+async def _default_error_async(error: Exception) -> None:
+    if isinstance(error, BaseException):
+        raise error
+    raise Exception(error)
+
+
+class AsyncObserver(abc.AsyncObserver, typing.Disposable):
+    """Base class for observers receiving notifications as coroutines.
+
+    Producers await every notification, so an observer that takes its
+    time to handle an element holds back the producer until it is done.
+    Like Observer, this base class enforces the grammar of observers
+    where on_error_async and on_completed_async are terminal messages.
+    """
+
+    def __init__(self,
+                 on_next_async: Optional[Callable[[Any], Awaitable]] = None,
+                 on_error_async: Optional[Callable[[Exception], Awaitable]] = None,
+                 on_completed_async: Optional[Callable[[], Awaitable]] = None
+                 ) -> None:
+        self.is_stopped = False
+        self._handler_on_next_async = on_next_async or _noop_async
+        self._handler_on_error_async = on_error_async or _default_error_async
+        self._handler_on_completed_async = on_completed_async or _noop_async
+
+    async def on_next_async(self, value: Any) -> None:
+        """Notify the observer of a new element in the sequence."""
+
+        if not self.is_stopped:
+            await self._on_next_async_core(value)
+
+    async def _on_next_async_core(self, value: Any) -> None:
+        await self._handler_on_next_async(value)
+
+    async def on_error_async(self, error: Exception) -> None:
+        """Notify the observer that an exception has occurred.
+
+        Args:
+            error: The error that occurred.
+        """
+
+        if not self.is_stopped:
+            self.is_stopped = True
+            await self._on_error_async_core(error)
+
+    async def _on_error_async_core(self, error: Exception) -> None:
+        await self._handler_on_error_async(error)
+
+    async def on_completed_async(self) -> None:
+        """Notifies the observer of the end of the sequence."""
+
+        if not self.is_stopped:
+            self.is_stopped = True
+            await self._on_completed_async_core()
+
+    async def _on_completed_async_core(self) -> None:
+        await self._handler_on_completed_async()
+
+    def dispose(self) -> None:
+        """Disposes the observer, causing it to transition to the
+        stopped state."""
+
+        self.is_stopped = True
+
+
+class AutoDetachAsyncObserver(AsyncObserver):
+    """Asynchronous observer which disposes its subscription once the
+    sequence terminates."""
+
+    def __init__(self, observer: abc.AsyncObserver) -> None:
+        super().__init__(observer.on_next_async, observer.on_error_async, observer.on_completed_async)
+        self._subscription = SingleAssignmentDisposable()
+
+    async def _on_error_async_core(self, error: Exception) -> None:
+        try:
+            await super()._on_error_async_core(error)
+        finally:
+            self._subscription.dispose()
+
+    async def _on_completed_async_core(self) -> None:
+        try:
+            await super()._on_completed_async_core()
+        finally:
+            self._subscription.dispose()
+
+    def set_disposable(self, value: typing.Disposable):
+        self._subscription.disposable = value
+
+    subscription = property(fset=set_disposable)
+
+    def dispose(self) -> None:
+        super().dispose()
+        self._subscription.dispose()
@@ -1,12 +1,83 @@
-from typing import Any
+import threading
+from typing import Any, Callable, Optional
+
+from rx.core import typing
+from rx.disposable import SingleAssignmentDisposable
+from rx.internal.exceptions import OverflowException
 
 from .scheduledobserver import ScheduledObserver
 
 
+DROP_OLDEST = 'drop_oldest'
+DROP_NEWEST = 'drop_newest'
+BLOCK_PRODUCER = 'block_producer'
+LATEST_ONLY = 'latest_only'
+ERROR = 'error'
+
+OVERFLOW_STRATEGIES = (DROP_OLDEST, DROP_NEWEST, BLOCK_PRODUCER, LATEST_ONLY, ERROR)
+
+
+class OverflowStats:
+    """Counts the values discarded by bounded observe_on queues. An
+    instance can be shared by several subscriptions and operators, and
+    be read at any time."""
+
+    def __init__(self) -> None:
+        self.dropped = 0
+        self.lock = threading.Lock()
+
+    def add_dropped(self, count: int) -> None:
+        with self.lock:
+            self.dropped += count
+
+
 class ObserveOnObserver(ScheduledObserver):
+    """Scheduled observer used by observe_on.
+
+    When a capacity is given, at most that many on_next notifications are
+    queued, and the overflow strategy decides what happens to further
+    values: drop_oldest discards the oldest queued value, drop_newest
+    discards the incoming value, block_producer makes the producer wait
+    for space, and error terminates the sequence with an
+    OverflowException and disposes the upstream subscription. With
+    latest_only, only the most recent value is kept queued, regardless of
+    the capacity. The number of discarded values is kept in dropped, and
+    added to the stats if given, and each discarded value is passed to
+    on_drop.
+
+    The subscription to the source should be assigned to upstream.
+    """
+
+    def __init__(self,
+                 scheduler: typing.Scheduler,
+                 observer: typing.Observer,
+                 budget: Optional[int] = None,
+                 capacity: Optional[int] = None,
+                 overflow: str = DROP_OLDEST,
+                 on_drop: Optional[Callable[[Any], None]] = None,
+                 stats: Optional[OverflowStats] = None
+                 ) -> None:
+        super().__init__(scheduler, observer, budget)
+
+        if overflow not in OVERFLOW_STRATEGIES:
+            raise ValueError("overflow must be one of %s" % ", ".join(OVERFLOW_STRATEGIES))
+        if overflow == LATEST_ONLY:
+            capacity = 1
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be a positive integer")
+
+        self.capacity = capacity
+        self.overflow = overflow
+        self.on_drop = on_drop
+        self.stats = stats
+        self.dropped = 0
+        self.upstream = SingleAssignmentDisposable()
 
     def _on_next_core(self, value: Any) -> None:
-        super()._on_next_core(value)
+        if self.capacity is None:
+            super()._on_next_core(value)
+        else:
+            self._on_next_bounded(value)
         self.ensure_active()
 
     def _on_error_core(self, error: Exception) -> None:
@@ -16,3 +87,47 @@ class ObserveOnObserver(ScheduledObserver):
     def _on_completed_core(self) -> None:
         super()._on_completed_core()
         self.ensure_active()
+
+    def _on_next_bounded(self, value: Any) -> None:
+        queue = self.queue
+        overflow = self.overflow
+        dropped = []
+        accept = True
+        overflowed = False
+
+        with self.lock:
+            if len(queue) >= self.capacity:
+                if overflow in (DROP_OLDEST, LATEST_ONLY):
+                    while len(queue) >= self.capacity:
+                        try:
+                            dropped.append(queue.popleft()[1][0])
+                        except IndexError:  # Drained concurrently
+                            break
+                elif overflow == DROP_NEWEST:
+                    dropped.append(value)
+                    accept = False
+                elif overflow == BLOCK_PRODUCER:
+                    self.waiting += 1
+                    try:
+                        while len(queue) >= self.capacity and not self.has_faulted and not self.disposable.is_disposed:
+                            self.space_available.wait()
+                    finally:
+                        self.waiting -= 1
+                else:
+                    dropped.append(value)
+                    accept = False
+                    overflowed = True
+                    self.is_stopped = True
+                    super()._on_error_core(OverflowException())
+
+            if accept:
+                super()._on_next_core(value)
+            self.dropped += len(dropped)
+
+        if dropped and self.stats is not None:
+            self.stats.add_dropped(len(dropped))
+        if overflowed:
+            self.upstream.dispose()
+        if self.on_drop is not None:
+            for item in dropped:
+                self.on_drop(item)
@@ -10,6 +10,8 @@ class Observer(typing.Observer, typing.Disposable):
     OnCompleted are terminal messages.
     """
 
+    __slots__ = ('is_stopped', '_handler_on_next', '_handler_on_error', '_handler_on_completed')
+
     def __init__(self,
                  on_next: Optional[typing.OnNext] = None,
                  on_error: Optional[typing.OnError] = None,
@@ -1,42 +1,59 @@
 import threading
-from typing import List, Any
+from collections import deque
+from typing import Any, Callable, Deque, Optional, Tuple
 
 from rx.core import typing
 from rx.disposable import SerialDisposable
 
 from .observer import Observer
 
+DEFAULT_BUDGET = 128
+
 
 class ScheduledObserver(Observer):
-    def __init__(self, scheduler: typing.Scheduler, observer: typing.Observer) -> None:
+    """Observer which queues notifications and forwards them to the
+    wrapped observer from actions run on the given scheduler.
+
+    Each scheduled run drains the queued notifications in batches of at
+    most budget notifications, DEFAULT_BUDGET unless given, and then
+    reschedules itself, so a fast producer cannot hold the scheduler and
+    other work on it gets a turn in between.
+    """
+
+    def __init__(self,
+                 scheduler: typing.Scheduler,
+                 observer: typing.Observer,
+                 budget: Optional[int] = None
+                 ) -> None:
         super().__init__()
 
+        if budget is None:
+            budget = DEFAULT_BUDGET
+        elif budget < 1:
+            raise ValueError("budget must be a positive integer")
+
         self.scheduler = scheduler
         self.observer = observer
+        self.budget = budget
 
         self.lock = threading.RLock()
+        self.space_available = threading.Condition(self.lock)
+        self.waiting = 0  # Number of producers blocked on space_available
         self.is_acquired = False
         self.has_faulted = False
-        self.queue: List[typing.Action] = []
+        self.queue: Deque[Tuple[Callable, Tuple]] = deque()
         self.disposable = SerialDisposable()
 
-        # Note to self: list append is thread safe
-        # http://effbot.org/pyfaq/what-kinds-of-global-value-mutation-are-thread-safe.htm
+        # Note to self: deque append is thread safe
 
     def _on_next_core(self, value: Any) -> None:
-        def action():
-            self.observer.on_next(value)
-        self.queue.append(action)
+        self.queue.append((self.observer.on_next, (value,)))
 
     def _on_error_core(self, error: Exception) -> None:
-        def action():
-            self.observer.on_error(error)
-        self.queue.append(action)
+        self.queue.append((self.observer.on_error, (error,)))
 
     def _on_completed_core(self) -> None:
-        def action():
-            self.observer.on_completed()
-        self.queue.append(action)
+        self.queue.append((self.observer.on_completed, ()))
 
     def ensure_active(self) -> None:
         is_owner = False
@@ -50,25 +67,41 @@ class ScheduledObserver(Observer):
             self.disposable.disposable = self.scheduler.schedule(self.run)
 
     def run(self, scheduler: typing.Scheduler, state: typing.TState) -> None:
-        parent = self
-
-        with self.lock:
-            if parent.queue:
-                work = parent.queue.pop(0)
-            else:
-                parent.is_acquired = False
-                return
+        queue = self.queue
+        budget = self.budget
 
+        count = 0
         try:
-            work()
+            # Besides the owner, only producers dropping the oldest values
+            # pop from the queue, under the lock. Since popleft is atomic,
+            # each notification is still taken once, and the owner only
+            # needs the lock to release ownership.
+            while count < budget:
+                try:
+                    action, args = queue.popleft()
+                except IndexError:
+                    break
+                if self.waiting:
+                    with self.lock:
+                        self.space_available.notify()
+                action(*args)
+                count += 1
         except Exception:
             with self.lock:
-                parent.queue = []
-                parent.has_faulted = True
+                queue.clear()
+                self.has_faulted = True
+                self.space_available.notify_all()
             raise
 
-        self.scheduler.schedule(self.run)
+        with self.lock:
+            if not queue:
+                self.is_acquired = False
+                return
+
+        self.disposable.disposable = self.scheduler.schedule(self.run)
 
     def dispose(self) -> None:
         super().dispose()
         self.disposable.dispose()
+        with self.lock:
+            self.space_available.notify_all()
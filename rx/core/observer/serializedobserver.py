@@ -0,0 +1,86 @@
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Tuple
+
+from .. import typing
+
+
+class SerializedObserver(typing.Observer):
+    """Observer which forwards notifications from concurrent producers
+    to the wrapped observer one at a time, in the order they arrive.
+
+    Notifications are not delivered under a lock. The thread which finds
+    the observer idle emits its own notification, and then drains any
+    notifications queued by other threads in the meantime; those other
+    threads return immediately instead of waiting. When a single thread
+    is emitting, notifications are forwarded directly without queueing.
+    Reentrant notifications, sent by the wrapped observer while it is
+    handling one, are queued and delivered once it returns. This differs
+    from the reentrant lock used before by merge and combine_latest,
+    which delivered them inline, nested in the current notification.
+
+    An exception raised by the wrapped observer propagates to the thread
+    that delivers the notification, which may not be the thread that
+    sent it: a notification queued by another thread raises on the
+    thread draining the queue. Notifications still queued at that point
+    are kept, and delivered by the next thread to find the observer
+    idle.
+
+    Each instance serializes a single subscription, so concurrent
+    subscriptions to the same observable do not contend.
+    """
+
+    def __init__(self, observer: typing.Observer) -> None:
+        self.observer = observer
+        self.queue: Deque[Tuple[Callable, Tuple]] = deque()
+        self.gate = threading.Lock()
+
+    def on_next(self, value: Any) -> None:
+        self.serialize(self.observer.on_next, value)
+
+    def on_error(self, error: Exception) -> None:
+        self.serialize(self.observer.on_error, error)
+
+    def on_completed(self) -> None:
+        self.serialize(self.observer.on_completed)
+
+    def serialize(self, action: Callable, *args: Any) -> None:
+        """Runs the action serialized with the notifications, and with
+        other actions passed to this method.
+
+        Args:
+            action: Action to run.
+            args: Arguments to pass to the action.
+        """
+
+        queue = self.queue
+        gate = self.gate
+
+        if gate.acquire(False):
+            try:
+                if queue:
+                    queue.append((action, args))
+                else:
+                    action(*args)
+                self._drain()
+            finally:
+                gate.release()
+        else:
+            queue.append((action, args))
+
+        # Whoever held the gate may have finished draining just before
+        # the item above was queued, so check again after releasing.
+        while queue and gate.acquire(False):
+            try:
+                self._drain()
+            finally:
+                gate.release()
+
+    def _drain(self) -> None:
+        queue = self.queue
+        while True:
+            try:
+                action, args = queue.popleft()
+            except IndexError:
+                return
+            action(*args)
@@ -1,7 +1,8 @@
-from typing import Callable, Optional, Any
+from collections import deque
+from typing import Callable, Optional, Any, Iterator, List
 
 from rx import operators as ops
-from rx.core import Observable, pipe
+from rx.core import Observable, IterableObservable, pipe
 
 
 def _buffer(boundaries: Observable) -> Callable[[Observable], Observable]:
@@ -58,5 +59,30 @@ def _buffer_with_count(count: int, skip: Optional[int] = None) -> Callable[[Obse
         def predicate(value):
             return len(value) > 0
 
-        return source.pipe(ops.window_with_count(count, skip), ops.flat_map(mapper), ops.filter(predicate))
+        observable = source.pipe(ops.window_with_count(count, skip), ops.flat_map(mapper), ops.filter(predicate))
+
+        if isinstance(source, IterableObservable):
+            def subscribe(observer, scheduler=None):
+                return observable.subscribe(observer, scheduler=scheduler)
+
+            return IterableObservable(subscribe, lambda: _iterate_buffers(source.iterate(), count, skip))
+        return observable
     return buffer_with_count
+
+
+def _iterate_buffers(iterator: Iterator, count: int, skip: int) -> Iterator[List[Any]]:
+    """Pulls the buffers of buffer_with_count from the source iterator,
+    reading no further ahead than needed to fill the next buffer."""
+
+    buffers: deque = deque()
+    for index, value in enumerate(iterator):
+        if index % skip == 0:
+            buffers.append([])
+        for buffer in buffers:
+            buffer.append(value)
+        if buffers and len(buffers[0]) == count:
+            yield buffers.popleft()
+
+    for buffer in buffers:
+        if buffer:
+            yield buffer
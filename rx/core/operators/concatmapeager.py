@@ -0,0 +1,162 @@
+import collections
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Optional
+
+from rx import from_, from_future
+from rx.core import Observable
+from rx.core.typing import Mapper
+from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
+from rx.internal.utils import is_future
+
+
+class _Inner:
+    """Subscription to one inner sequence, with the elements it
+    produced before becoming the head of the output."""
+
+    __slots__ = ('buffer', 'is_done', 'subscription')
+
+    def __init__(self) -> None:
+        self.buffer: Deque[Any] = deque()
+        self.is_done = False
+        self.subscription = SingleAssignmentDisposable()
+
+
+def _concat_map_eager(mapper: Mapper,
+                      max_concurrent: Optional[int] = None
+                      ) -> Callable[[Observable], Observable]:
+    if max_concurrent is not None and max_concurrent < 1:
+        raise ValueError("max_concurrent must be a positive integer")
+
+    def concat_map_eager(source: Observable) -> Observable:
+        """Projects each element of the source to an observable
+        sequence, subscribes to several of them at once, and
+        concatenates their elements in source order.
+
+        Args:
+            source: The source observable.
+
+        Returns:
+            An observable sequence with the elements of the projected
+            sequences, in source order.
+        """
+
+        def subscribe(observer, scheduler=None):
+            lock = threading.RLock()
+            active: Deque[_Inner] = deque()  # In source order; the first one is the head
+            waiting: Deque[Observable] = deque()
+            is_stopped = False
+            is_disposed = False
+            is_draining = False
+            is_missed = False
+
+            def drain() -> None:
+                """Emits the buffers of inner sequences that have become
+                the head, and subscribes to waiting sequences while there
+                is room. Should be called under the lock. Calls made
+                while draining, e.g. by inner sequences completing
+                synchronously, are picked up by the running drain."""
+
+                nonlocal is_draining, is_missed
+
+                if is_draining:
+                    is_missed = True
+                    return
+                is_draining = True
+
+                try:
+                    while True:
+                        is_missed = False
+                        while active and not is_disposed:
+                            head = active[0]
+                            buffer = head.buffer
+                            while buffer and not is_disposed:
+                                observer.on_next(buffer.popleft())
+                            if not head.is_done:
+                                break
+                            active.popleft()
+
+                        if is_disposed:
+                            return
+                        if waiting and (max_concurrent is None or len(active) < max_concurrent):
+                            start(waiting.popleft())
+                            continue
+                        if not is_missed:
+                            break
+                finally:
+                    is_draining = False
+
+                if is_stopped and not active and not waiting:
+                    observer.on_completed()
+                    dispose()
+
+            def start(inner_source: Observable) -> None:
+                inner = _Inner()
+                active.append(inner)
+
+                def on_next(value: Any) -> None:
+                    with lock:
+                        if is_disposed:
+                            return
+                        if active and active[0] is inner and not is_draining:
+                            observer.on_next(value)
+                        else:
+                            inner.buffer.append(value)
+
+                def on_completed() -> None:
+                    with lock:
+                        inner.is_done = True
+                        if active and active[0] is inner:
+                            drain()
+
+                inner.subscription.disposable = inner_source.subscribe_(on_next, on_error, on_completed, scheduler)
+
+            def on_next_source(value: Any) -> None:
+                try:
+                    result = mapper(value)
+                    if isinstance(result, collections.abc.Iterable):
+                        result = from_(result)
+                    elif is_future(result):
+                        result = from_future(result)
+                except Exception as error:  # pylint: disable=broad-except
+                    on_error(error)
+                    return
+
+                with lock:
+                    if is_disposed:
+                        return
+                    if max_concurrent is None or len(active) < max_concurrent:
+                        start(result)
+                    else:
+                        waiting.append(result)
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    if not is_disposed:
+                        observer.on_error(error)
+                        dispose()
+
+            def on_completed_source() -> None:
+                nonlocal is_stopped
+
+                with lock:
+                    is_stopped = True
+                    drain()
+
+            def dispose() -> None:
+                nonlocal is_disposed
+
+                with lock:
+                    is_disposed = True
+                    inners = list(active)
+                    active.clear()
+                    waiting.clear()
+
+                for inner in inners:
+                    inner.buffer.clear()
+                    inner.subscription.dispose()
+
+            subscription = source.subscribe_(on_next_source, on_error, on_completed_source, scheduler)
+            return CompositeDisposable(subscription, Disposable(dispose))
+        return Observable(subscribe)
+    return concat_map_eager
@@ -0,0 +1,24 @@
+from typing import Callable, Optional
+
+from rx.core import Observable, ControlledObservable, typing
+
+
+def _controlled(scheduler: Optional[typing.Scheduler] = None) -> Callable[[Observable], ControlledObservable]:
+    def controlled(source: Observable) -> ControlledObservable:
+        """Returns a controlled observable sequence, which only emits
+        elements of the source once they are requested.
+
+        Examples:
+            >>> res = controlled(source)
+            >>> res.request(10)
+
+        Args:
+            source: Source observable to control.
+
+        Returns:
+            A ControlledObservable whose request method is used to ask
+            for elements.
+        """
+
+        return ControlledObservable(source, scheduler)
+    return controlled
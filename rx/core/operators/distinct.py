@@ -1,7 +1,9 @@
+from collections import OrderedDict
 from typing import Callable, Optional
-from rx.core import Observable
+
+from rx.core import Observable, typing
 from rx.core.typing import Mapper, Comparer
-from rx.internal.basic import default_comparer
+from rx.scheduler import timeout_scheduler
 
 
 def array_index_of_comparer(array, item, comparer):
@@ -12,6 +14,9 @@ def array_index_of_comparer(array, item, comparer):
 
 
 class HashSet:
+    """Linear lookup set used when a custom comparer is supplied, since
+    arbitrary equality functions cannot be hashed."""
+
     def __init__(self, comparer):
         self.comparer = comparer
         self.set = []
@@ -23,10 +28,63 @@ class HashSet:
         return ret_value
 
 
+class KeySet:
+    """Hash based set of seen keys with optional bounded memory.
+
+    Keys are kept in recency order. When max_keys is given, the least
+    recently seen key is evicted once the set grows beyond it. When a
+    ttl is given, keys not seen for longer than the ttl are forgotten.
+    Unhashable keys fall back to a linear lookup.
+    """
+
+    def __init__(self,
+                 max_keys: Optional[int] = None,
+                 ttl: Optional[typing.RelativeTime] = None,
+                 scheduler: Optional[typing.Scheduler] = None
+                 ) -> None:
+        self.max_keys = max_keys
+        self.ttl = ttl
+        self.scheduler = scheduler
+        self.keys = OrderedDict()
+        self.unhashable = HashSet(lambda x, y: x == y)
+
+    def push(self, key) -> bool:
+        try:
+            hash(key)
+        except TypeError:
+            return self.unhashable.push(key)
+
+        keys = self.keys
+        now = None
+        if self.ttl is not None:
+            now = self.scheduler.now
+            expiry = now - self.scheduler.to_timedelta(self.ttl)
+            while keys:
+                oldest = next(iter(keys))
+                if keys[oldest] > expiry:
+                    break
+                del keys[oldest]
+
+        if key in keys:
+            if self.max_keys is not None or now is not None:
+                keys.move_to_end(key)
+                keys[key] = now
+            return False
+
+        keys[key] = now
+        if self.max_keys is not None and len(keys) > self.max_keys:
+            keys.popitem(last=False)
+        return True
+
+
 def _distinct(key_mapper: Optional[Mapper] = None,
-              comparer: Optional[Comparer] = None
+              comparer: Optional[Comparer] = None,
+              max_keys: Optional[int] = None,
+              ttl: Optional[typing.RelativeTime] = None,
+              scheduler: Optional[typing.Scheduler] = None
               ) -> Callable[[Observable], Observable]:
-    comparer = comparer or default_comparer
+    if max_keys is not None and max_keys < 1:
+        raise ValueError("max_keys must be a positive integer")
 
     def distinct(source: Observable) -> Observable:
         """Returns an observable sequence that contains only distinct
@@ -46,8 +104,12 @@ def _distinct(key_mapper: Optional[Mapper] = None,
             sequence.
         """
 
-        def subscribe(observer, scheduler=None):
-            hashset = HashSet(comparer)
+        def subscribe(observer, scheduler_=None):
+            if comparer:
+                hashset = HashSet(comparer)
+            else:
+                _scheduler = scheduler or scheduler_ or timeout_scheduler
+                hashset = KeySet(max_keys, ttl, _scheduler)
 
             def on_next(x):
                 key = x
@@ -60,6 +122,6 @@ def _distinct(key_mapper: Optional[Mapper] = None,
                         return
 
                 hashset.push(key) and observer.on_next(x)
-            return source.subscribe_(on_next, observer.on_error,observer.on_completed, scheduler)
+            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler_)
         return Observable(subscribe)
     return distinct
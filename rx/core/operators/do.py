@@ -1,6 +1,7 @@
 from typing import Callable, Optional
 
 from rx.core import Observable, typing
+from rx.core.observable.fusedobservable import fuse, TAP
 from rx.core.typing import Observer, Disposable
 from rx.disposable import CompositeDisposable
 
@@ -35,6 +36,9 @@ def _do_action(on_next: Optional[typing.OnNext] = None,
             behavior applied.
         """
 
+        if on_next and not on_error and not on_completed:
+            return fuse(source, TAP, on_next)
+
         def subscribe(observer, scheduler=None):
             def _on_next(x):
                 if not on_next:
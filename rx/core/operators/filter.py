@@ -1,6 +1,7 @@
 from typing import Callable, Optional
 
 from rx.core import Observable
+from rx.core.observable.fusedobservable import fuse, FILTER
 from rx.core.typing import Predicate, PredicateIndexed, Scheduler, Observer, Disposable
 
 
@@ -22,19 +23,7 @@ def _filter(predicate: Predicate) -> Callable[[Observable], Observable]:
             A filtered observable sequence.
         """
 
-        def subscribe(observer: Observer, scheduler: Optional[Scheduler]) -> Disposable:
-            def on_next(value):
-                try:
-                    should_run = predicate(value)
-                except Exception as ex:  # pylint: disable=broad-except
-                    observer.on_error(ex)
-                    return
-
-                if should_run:
-                    observer.on_next(value)
-
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
-        return Observable(subscribe)
+        return fuse(source, FILTER, predicate)
     return filter
 
 
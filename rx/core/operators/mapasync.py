@@ -0,0 +1,139 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set, Tuple
+
+from rx.core import Observable, typing
+from rx.disposable import CompositeDisposable, Disposable
+from rx.scheduler.eventloop import AsyncIOScheduler, AsyncIOThreadSafeScheduler
+
+
+def _map_async(mapper: Callable[[Any], Any],
+               max_concurrency: Optional[int] = None,
+               ordered: bool = True,
+               scheduler: Optional[AsyncIOScheduler] = None
+               ) -> Callable[[Observable], Observable]:
+    if max_concurrency is not None and max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer")
+
+    def map_async(source: Observable) -> Observable:
+        """Runs a coroutine function for each element of the source, on
+        an asyncio event loop, and emits the results.
+
+        Args:
+            source: The source observable.
+
+        Returns:
+            An observable sequence with the results of the coroutines.
+        """
+
+        def subscribe(observer, scheduler_=None):
+            _scheduler = scheduler or scheduler_
+            if isinstance(_scheduler, AsyncIOScheduler):
+                loop = _scheduler._loop  # pylint: disable=protected-access
+                threadsafe = isinstance(_scheduler, AsyncIOThreadSafeScheduler)
+            else:
+                loop = asyncio.get_event_loop()
+                threadsafe = False
+
+            lock = threading.RLock()
+            pending: Deque[Tuple[int, Any]] = deque()
+            running: Set[Any] = set()
+            results: Dict[int, Any] = {}
+            index = 0
+            next_index = 0
+            is_stopped = False
+            is_disposed = False
+
+            def start(i: int, value: Any) -> None:
+                # Mappers returning something that cannot be awaited fail
+                # when the future is created.
+                try:
+                    coro = mapper(value)
+                    if threadsafe:
+                        future = asyncio.run_coroutine_threadsafe(coro, loop)
+                    else:
+                        future = asyncio.ensure_future(coro, loop=loop)
+                except Exception as error:  # pylint: disable=broad-except
+                    fail(error)
+                    return
+
+                running.add(future)
+                future.add_done_callback(lambda f: on_done(i, f))
+
+            def on_done(i: int, future: Any) -> None:
+                nonlocal next_index
+
+                with lock:
+                    running.discard(future)
+                    if is_disposed or future.cancelled():
+                        return
+
+                    error = future.exception()
+                    if error is not None:
+                        fail(error)
+                        return
+
+                    if ordered:
+                        results[i] = future.result()
+                        while next_index in results:
+                            observer.on_next(results.pop(next_index))
+                            next_index += 1
+                    else:
+                        observer.on_next(future.result())
+
+                    if pending and not is_disposed:
+                        start(*pending.popleft())
+                    check_completed()
+
+            def check_completed() -> None:
+                if is_stopped and not running and not pending and not is_disposed:
+                    observer.on_completed()
+                    dispose()
+
+            def fail(error: Exception) -> None:
+                if not is_disposed:
+                    observer.on_error(error)
+                    dispose()
+
+            def on_next(value: Any) -> None:
+                nonlocal index
+
+                with lock:
+                    if is_disposed:
+                        return
+
+                    i, index = index, index + 1
+                    if max_concurrency is None or len(running) < max_concurrency:
+                        start(i, value)
+                    else:
+                        pending.append((i, value))
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    fail(error)
+
+            def on_completed() -> None:
+                nonlocal is_stopped
+
+                with lock:
+                    is_stopped = True
+                    check_completed()
+
+            def dispose() -> None:
+                nonlocal is_disposed
+
+                with lock:
+                    is_disposed = True
+                    pending.clear()
+                    results.clear()
+                    futures = list(running)
+                    running.clear()
+
+                for future in futures:
+                    future.cancel()
+
+            subscription = source.subscribe_(on_next, on_error, on_completed, scheduler_)
+            return CompositeDisposable(subscription, Disposable(dispose))
+        return Observable(subscribe)
+    return map_async
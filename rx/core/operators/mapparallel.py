@@ -0,0 +1,198 @@
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from rx.core import Observable
+from rx.disposable import CompositeDisposable, Disposable
+from rx.internal.concurrency import default_thread_factory
+
+
+def _map_chunk(mapper: Callable[[Any], Any], chunk: List[Any]) -> List[Any]:
+    """Applies the mapper to a chunk of elements. Runs in the executor,
+    so it must be defined at module level to be picklable."""
+
+    return [mapper(value) for value in chunk]
+
+
+def _map_parallel(mapper: Callable[[Any], Any],
+                  executor: Optional[Executor] = None,
+                  workers: Optional[int] = None,
+                  chunk_size: int = 1,
+                  ordered: bool = True,
+                  max_pending: Optional[int] = None
+                  ) -> Callable[[Observable], Observable]:
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    if max_pending is None:
+        max_pending = 2 * (workers or os.cpu_count() or 1)
+    elif max_pending < 1:
+        raise ValueError("max_pending must be a positive integer")
+
+    def map_parallel(source: Observable) -> Observable:
+        """Applies the mapper to the elements of the source in an
+        executor, a chunk of elements at a time.
+
+        Args:
+            source: The source observable.
+
+        Returns:
+            An observable sequence with the mapped elements.
+        """
+
+        def subscribe(observer, scheduler=None):
+            _executor = executor or ProcessPoolExecutor(max_workers=workers)
+
+            lock = threading.RLock()
+            chunk_done = threading.Condition(lock)
+            chunk: List[Any] = []
+            running: Dict[int, Future] = {}
+            results: Dict[int, List[Any]] = {}
+            index = 0
+            next_index = 0
+            is_stopped = False
+            is_disposed = False
+            is_released = False
+            cancelled: List[Future] = []
+            terminal: Optional[Callable[[], None]] = None
+
+            def submit() -> None:
+                """Submits the current chunk, waiting for room if
+                max_pending chunks are in flight. Should be called
+                under the lock."""
+
+                nonlocal chunk, index
+
+                while len(running) >= max_pending and not is_disposed:
+                    chunk_done.wait()
+                if is_disposed:
+                    return
+
+                i, index = index, index + 1
+                values, chunk = chunk, []
+                try:
+                    future = _executor.submit(_map_chunk, mapper, values)
+                except Exception as error:  # pylint: disable=broad-except
+                    fail(error)
+                    return
+
+                running[i] = future
+                future.add_done_callback(lambda f: on_done(i, f))
+
+            def on_done(i: int, future: Future) -> None:
+                nonlocal next_index
+
+                with lock:
+                    running.pop(i, None)
+                    chunk_done.notify()
+                    if is_disposed or future.cancelled():
+                        return
+
+                    error = future.exception()
+                    if error is not None:
+                        fail(error)
+                    else:
+                        if ordered:
+                            results[i] = future.result()
+                            while next_index in results:
+                                for value in results.pop(next_index):
+                                    observer.on_next(value)
+                                next_index += 1
+                        else:
+                            for value in future.result():
+                                observer.on_next(value)
+
+                        check_completed()
+                release()
+
+            def check_completed() -> None:
+                nonlocal terminal
+
+                if is_stopped and not running and not is_disposed:
+                    stop()
+                    terminal = observer.on_completed
+
+            def fail(error: Exception) -> None:
+                nonlocal terminal
+
+                if not is_disposed:
+                    stop()
+                    terminal = lambda: observer.on_error(error)
+
+            def stop() -> None:
+                """Stops accepting and emitting values. Should be called
+                under the lock; the running chunks are cancelled by
+                release."""
+
+                nonlocal is_disposed
+
+                is_disposed = True
+                chunk.clear()
+                results.clear()
+                cancelled.extend(running.values())
+                running.clear()
+                chunk_done.notify_all()
+
+            def release() -> None:
+                """Sends the terminal notification, cancels the running
+                chunks and shuts down the executor owned by the
+                subscription once stopped. Should be called outside the
+                lock, since it may run on a thread of the executor."""
+
+                nonlocal terminal, is_released
+
+                with lock:
+                    if not is_disposed:
+                        return
+                    notify, terminal = terminal, None
+                    futures = cancelled[:]
+                    cancelled.clear()
+                    shutdown = executor is None and not is_released
+                    is_released = True
+
+                for future in futures:
+                    future.cancel()
+                if notify is not None:
+                    notify()
+                # A process pool cannot be shut down from one of its own
+                # callbacks, which is where the sequence usually ends.
+                if shutdown:
+                    default_thread_factory(_executor.shutdown).start()
+
+            def on_next(value: Any) -> None:
+                with lock:
+                    if is_disposed:
+                        return
+
+                    chunk.append(value)
+                    if len(chunk) >= chunk_size:
+                        submit()
+                release()
+
+            def on_error(error: Exception) -> None:
+                with lock:
+                    fail(error)
+                release()
+
+            def on_completed() -> None:
+                nonlocal is_stopped
+
+                with lock:
+                    if chunk:
+                        submit()
+                    is_stopped = True
+                    check_completed()
+                release()
+
+            def dispose() -> None:
+                with lock:
+                    if not is_disposed:
+                        stop()
+                release()
+
+            subscription = source.subscribe_(on_next, on_error, on_completed, scheduler)
+            return CompositeDisposable(subscription, Disposable(dispose))
+        return Observable(subscribe)
+    return map_parallel
@@ -1,10 +1,11 @@
-from typing import Callable, Optional
+from collections import deque
+from typing import Callable, Deque, Optional
 
 import rx
 from rx import from_future
 from rx.core import Observable
+from rx.core.observer import SerializedObserver
 from rx.disposable import CompositeDisposable, SingleAssignmentDisposable
-from rx.internal.concurrency import synchronized
 from rx.internal.utils import is_future
 
 
@@ -34,29 +35,28 @@ def _merge(*sources: Observable,
             return rx.merge(*sources_)
 
         def subscribe(observer, scheduler=None):
+            serialized = SerializedObserver(observer)
             active_count = [0]
             group = CompositeDisposable()
             is_stopped = [False]
-            queue = []
+            queue: Deque[Observable] = deque()
 
             def subscribe(xs):
                 subscription = SingleAssignmentDisposable()
                 group.add(subscription)
 
-                @synchronized(source.lock)
                 def on_completed():
                     group.remove(subscription)
                     if queue:
-                        s = queue.pop(0)
+                        s = queue.popleft()
                         subscribe(s)
                     else:
                         active_count[0] -= 1
                         if is_stopped[0] and active_count[0] == 0:
                             observer.on_completed()
 
-                on_next = synchronized(source.lock)(observer.on_next)
-                on_error = synchronized(source.lock)(observer.on_error)
-                subscription.disposable = xs.subscribe_(on_next, on_error, on_completed, scheduler)
+                subscription.disposable = xs.subscribe_(serialized.on_next, serialized.on_error,
+                                                        lambda: serialized.serialize(on_completed), scheduler)
 
             def on_next(inner_source):
                 if active_count[0] < max_concurrent:
@@ -70,7 +70,8 @@ def _merge(*sources: Observable,
                 if active_count[0] == 0:
                     observer.on_completed()
 
-            group.add(source.subscribe_(on_next, observer.on_error, on_completed, scheduler))
+            group.add(source.subscribe_(lambda x: serialized.serialize(on_next, x), serialized.on_error,
+                                        lambda: serialized.serialize(on_completed), scheduler))
             return group
         return Observable(subscribe)
     return merge
@@ -91,6 +92,7 @@ def _merge_all() -> Callable[[Observable], Observable]:
             sequences.
         """
         def subscribe(observer, scheduler=None):
+            serialized = SerializedObserver(observer)
             group = CompositeDisposable()
             is_stopped = [False]
             m = SingleAssignmentDisposable()
@@ -102,15 +104,13 @@ def _merge_all() -> Callable[[Observable], Observable]:
 
                 inner_source = from_future(inner_source) if is_future(inner_source) else inner_source
 
-                @synchronized(source.lock)
                 def on_completed():
                     group.remove(inner_subscription)
                     if is_stopped[0] and len(group) == 1:
                         observer.on_completed()
 
-                on_next = synchronized(source.lock)(observer.on_next)
-                on_error = synchronized(source.lock)(observer.on_error)
-                subscription = inner_source.subscribe_(on_next, on_error, on_completed, scheduler)
+                subscription = inner_source.subscribe_(serialized.on_next, serialized.on_error,
+                                                       lambda: serialized.serialize(on_completed), scheduler)
                 inner_subscription.disposable = subscription
 
             def on_completed():
@@ -118,7 +118,8 @@ def _merge_all() -> Callable[[Observable], Observable]:
                 if len(group) == 1:
                     observer.on_completed()
 
-            m.disposable = source.subscribe_(on_next, observer.on_error, on_completed, scheduler)
+            m.disposable = source.subscribe_(on_next, serialized.on_error,
+                                             lambda: serialized.serialize(on_completed), scheduler)
             return group
 
         return Observable(subscribe)
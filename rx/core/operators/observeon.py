@@ -1,11 +1,18 @@
-from typing import Callable
+from typing import Any, Callable, Optional
 
 from rx.core import Observable
 from rx.core.typing import Scheduler
-from rx.core.observer import ObserveOnObserver
+from rx.core.observer import ObserveOnObserver, OverflowStats
+from rx.disposable import CompositeDisposable
 
 
-def _observe_on(scheduler: Scheduler) -> Callable[[Observable], Observable]:
+def _observe_on(scheduler: Scheduler,
+                budget: Optional[int] = None,
+                capacity: Optional[int] = None,
+                overflow: str = 'drop_oldest',
+                on_drop: Optional[Callable[[Any], None]] = None,
+                stats: Optional[OverflowStats] = None
+                ) -> Callable[[Observable], Observable]:
     def observe_on(source: Observable) -> Observable:
         """Wraps the source sequence in order to run its observer
         callbacks on the specified scheduler.
@@ -24,8 +31,10 @@ def _observe_on(scheduler: Scheduler) -> Callable[[Observable], Observable]:
             the specified scheduler.
         """
         def subscribe(observer, subscribe_scheduler=None):
-            return source.subscribe(ObserveOnObserver(scheduler, observer),
-                                    scheduler=subscribe_scheduler)
+            scheduled_observer = ObserveOnObserver(scheduler, observer, budget, capacity, overflow, on_drop, stats)
+            upstream = scheduled_observer.upstream
+            upstream.disposable = source.subscribe(scheduled_observer, scheduler=subscribe_scheduler)
+            return CompositeDisposable(upstream, scheduled_observer)
 
         return Observable(subscribe)
     return observe_on
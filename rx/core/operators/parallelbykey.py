@@ -0,0 +1,97 @@
+import os
+import threading
+from typing import Any, Callable, List, Optional
+
+from rx.core import Observable, typing
+from rx.core.typing import Mapper
+from rx.disposable import CompositeDisposable
+from rx.scheduler import EventLoopScheduler
+from rx.subject import Subject
+
+from .observeon import _observe_on
+
+
+def _parallel_by_key(key_mapper: Mapper,
+                     shards: Optional[int] = None,
+                     pipeline: Optional[Callable[[Observable], Observable]] = None,
+                     scheduler_factory: Optional[Callable[[], typing.Scheduler]] = None
+                     ) -> Callable[[Observable], Observable]:
+    if shards is None:
+        shards = os.cpu_count() or 1
+    elif shards < 1:
+        raise ValueError("shards must be a positive integer")
+
+    def parallel_by_key(source: Observable) -> Observable:
+        """Partitions the source by key into shards, runs the pipeline
+        for each shard on its own scheduler and merges the results.
+
+        Args:
+            source: The source observable.
+
+        Returns:
+            An observable sequence with the merged output of the shard
+            pipelines.
+        """
+
+        def subscribe(observer, scheduler=None):
+            gate = threading.RLock()
+            group = CompositeDisposable()
+            subjects: List[Subject] = []
+            remaining = shards
+            is_stopped = False
+
+            def on_next(value: Any) -> None:
+                with gate:
+                    if not is_stopped:
+                        observer.on_next(value)
+
+            def on_error(error: Exception) -> None:
+                nonlocal is_stopped
+
+                with gate:
+                    if is_stopped:
+                        return
+                    is_stopped = True
+                    observer.on_error(error)
+                group.dispose()
+
+            def on_completed() -> None:
+                nonlocal remaining, is_stopped
+
+                with gate:
+                    remaining -= 1
+                    if remaining or is_stopped:
+                        return
+                    is_stopped = True
+                    observer.on_completed()
+                group.dispose()
+
+            for _ in range(shards):
+                shard_scheduler = scheduler_factory() if scheduler_factory else EventLoopScheduler()
+                if scheduler_factory is None:
+                    group.add(shard_scheduler)
+
+                subject = Subject()
+                subjects.append(subject)
+                shard = _observe_on(shard_scheduler)(subject)
+                if pipeline is not None:
+                    shard = pipeline(shard)
+                group.add(shard.subscribe_(on_next, on_error, on_completed, shard_scheduler))
+
+            def on_next_source(value: Any) -> None:
+                try:
+                    key = key_mapper(value)
+                    subject = subjects[hash(key) % shards]
+                except Exception as error:  # pylint: disable=broad-except
+                    on_error(error)
+                    return
+                subject.on_next(value)
+
+            def on_completed_source() -> None:
+                for subject in subjects:
+                    subject.on_completed()
+
+            subscription = source.subscribe_(on_next_source, on_error, on_completed_source, scheduler)
+            return CompositeDisposable(subscription, group)
+        return Observable(subscribe)
+    return parallel_by_key
@@ -0,0 +1,107 @@
+import threading
+from collections import deque
+from typing import Callable, Optional
+
+from rx.core import Observable
+from rx.disposable import CompositeDisposable
+
+
+def _pausable(pauser: Observable) -> Callable[[Observable], Observable]:
+    def pausable(source: Observable) -> Observable:
+        """Pauses the source sequence while the pauser last emitted
+        False, dropping the elements it produces in the meantime.
+
+        Examples:
+            >>> res = pausable(source)
+
+        Args:
+            source: Source observable to pause.
+
+        Returns:
+            An observable sequence with the elements of the source
+            which were produced while not paused.
+        """
+
+        def subscribe(observer, scheduler=None):
+            flowing = True
+
+            def on_next(value):
+                if flowing:
+                    observer.on_next(value)
+
+            def on_pauser(value):
+                nonlocal flowing
+                flowing = bool(value)
+
+            pauser_subscription = pauser.subscribe_(on_pauser, observer.on_error, None, scheduler)
+            subscription = source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+            return CompositeDisposable(subscription, pauser_subscription)
+        return Observable(subscribe)
+    return pausable
+
+
+def _pausable_buffered(pauser: Observable, max_buffer: Optional[int] = None) -> Callable[[Observable], Observable]:
+    if max_buffer is not None and max_buffer < 1:
+        raise ValueError("max_buffer must be a positive integer")
+
+    def pausable_buffered(source: Observable) -> Observable:
+        """Pauses the source sequence while the pauser last emitted
+        False, buffering the elements it produces in the meantime.
+
+        Examples:
+            >>> res = pausable_buffered(source)
+
+        Args:
+            source: Source observable to pause.
+
+        Returns:
+            An observable sequence with the elements of the source,
+            where those produced while paused are emitted once resumed.
+        """
+
+        def subscribe(observer, scheduler=None):
+            lock = threading.RLock()
+            flowing = True
+            buffer = deque(maxlen=max_buffer)
+            is_completed = False
+
+            def drain():
+                while buffer and flowing:
+                    observer.on_next(buffer.popleft())
+
+                if is_completed and not buffer:
+                    observer.on_completed()
+
+            def on_next(value):
+                with lock:
+                    if flowing and not buffer:
+                        observer.on_next(value)
+                    else:
+                        buffer.append(value)
+
+            def on_error(error):
+                with lock:
+                    buffer.clear()
+                    observer.on_error(error)
+
+            def on_completed():
+                nonlocal is_completed
+
+                with lock:
+                    is_completed = True
+                    if not buffer:
+                        observer.on_completed()
+
+            def on_pauser(value):
+                nonlocal flowing
+
+                with lock:
+                    flowing = bool(value)
+                    if flowing and buffer:
+                        drain()
+
+            pauser_subscription = pauser.subscribe_(on_pauser, on_error, None, scheduler)
+            subscription = source.subscribe_(on_next, on_error, on_completed, scheduler)
+            return CompositeDisposable(subscription, pauser_subscription)
+        return Observable(subscribe)
+    return pausable_buffered
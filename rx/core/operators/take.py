@@ -2,6 +2,7 @@ from typing import Callable
 
 from rx import empty
 from rx.core import Observable
+from rx.core.observer import AutoDetachObserver
 from rx.internal import ArgumentOutOfRangeException
 
 
@@ -36,7 +37,11 @@ def _take(count: int) -> Callable[[Observable], Observable]:
                     observer.on_next(value)
                     if not remaining:
                         observer.on_completed()
+                        # Stops sources which are still emitting from
+                        # within the subscribe call.
+                        upstream.dispose()
 
-            return source.subscribe_(on_next, observer.on_error, observer.on_completed, scheduler)
+            upstream = AutoDetachObserver(on_next, observer.on_error, observer.on_completed)
+            return source._subscribe_auto_detach(upstream, scheduler)  # pylint: disable=protected-access
         return Observable(subscribe)
     return take
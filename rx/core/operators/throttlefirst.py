@@ -1,3 +1,4 @@
+import threading
 from typing import Callable, Optional
 
 from rx.core import Observable, typing
@@ -23,13 +24,14 @@ def _throttle_first(window_duration: typing.RelativeTime, scheduler: Optional[ty
             duration = _scheduler.to_timedelta(window_duration or 0.0)
             if duration <= _scheduler.to_timedelta(0):
                 raise ValueError('window_duration cannot be less or equal zero.')
+            lock = threading.Lock()
             last_on_next = [0]
 
             def on_next(x):
                 emit = False
                 now = _scheduler.now
 
-                with source.lock:
+                with lock:
                     if not last_on_next[0] or now - last_on_next[0] >= duration:
                         last_on_next[0] = now
                         emit = True
@@ -0,0 +1,234 @@
+import asyncio
+import threading
+from collections import deque
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Deque, Optional
+
+from rx.core import Observable, ControlledObservable
+from rx.core.observable.iterableobservable import IterableObservable
+from rx.core.observer.observeonobserver import (DROP_OLDEST, DROP_NEWEST, BLOCK_PRODUCER, LATEST_ONLY,
+                                                OVERFLOW_STRATEGIES)
+from rx.disposable import SingleAssignmentDisposable
+from rx.internal.exceptions import OverflowException
+
+
+class _Channel:
+    """Bounded buffer between a subscription and an async iterator
+    running on an event loop."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: Optional[int], overflow: str) -> None:
+        self.loop = loop
+        self.thread = threading.get_ident()
+        self.maxsize = maxsize
+        self.overflow = overflow
+
+        self.lock = threading.RLock()
+        self.space_available = threading.Condition(self.lock)
+        self.waiting = 0  # Number of producers blocked on space_available
+        self.queue: Deque[Any] = deque()
+        self.error: Optional[Exception] = None
+        self.is_done = False
+        self.is_closed = False
+        self.waiter: Optional[asyncio.Future] = None
+        self.subscription = SingleAssignmentDisposable()
+
+    def on_next(self, value: Any) -> None:
+        queue = self.queue
+        maxsize = self.maxsize
+
+        with self.lock:
+            if self.is_closed or self.is_done:
+                return
+
+            if maxsize is not None and len(queue) >= maxsize:
+                overflow = self.overflow
+                if overflow in (DROP_OLDEST, LATEST_ONLY):
+                    while len(queue) >= maxsize:
+                        queue.popleft()
+                elif overflow == DROP_NEWEST:
+                    return
+                elif overflow == BLOCK_PRODUCER:
+                    # Producers on the event loop thread cannot wait for the
+                    # consumer without deadlocking the loop.
+                    if threading.get_ident() != self.thread:
+                        self.waiting += 1
+                        try:
+                            while len(queue) >= maxsize and not self.is_closed:
+                                self.space_available.wait()
+                        finally:
+                            self.waiting -= 1
+                        if self.is_closed:
+                            return
+                else:
+                    self.error = OverflowException()
+                    self.is_done = True
+                    self.subscription.dispose()
+                    self._wake()
+                    return
+
+            queue.append(value)
+            self._wake()
+
+    def on_error(self, error: Exception) -> None:
+        with self.lock:
+            if not self.is_done:
+                self.error = error
+                self.is_done = True
+                self._wake()
+
+    def on_completed(self) -> None:
+        with self.lock:
+            if not self.is_done:
+                self.is_done = True
+                self._wake()
+
+    def _wake(self) -> None:
+        """Resumes the consumer if it is waiting. Should be called under
+        the lock. Values arriving before the consumer has resumed are
+        picked up by the same wakeup."""
+
+        waiter = self.waiter
+        if waiter is None:
+            return
+        self.waiter = None
+
+        if threading.get_ident() == self.thread:
+            if not waiter.done():
+                waiter.set_result(None)
+        else:
+            self.loop.call_soon_threadsafe(_set_done, waiter)
+
+    def close(self) -> None:
+        with self.lock:
+            self.is_closed = True
+            self.queue.clear()
+            self.space_available.notify_all()
+        self.subscription.dispose()
+
+
+def _set_done(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class _AsyncIterable(AsyncIterable):
+    def __init__(self, source: Observable, maxsize: Optional[int], overflow: str) -> None:
+        self.source = source
+        self.maxsize = maxsize
+        self.overflow = overflow
+
+    def __aiter__(self) -> AsyncIterator:
+        return _AsyncIterator(self.source, self.maxsize, self.overflow)
+
+
+class _AsyncIterator(AsyncIterator):
+    """Iterates a subscription to an observable. The subscription is
+    made on the first call to __anext__, and disposed as soon as the
+    iteration ends, fails, is cancelled or closed, or when the iterator
+    is dropped after a break, without waiting for the event loop to
+    finalize it."""
+
+    def __init__(self, source: Observable, maxsize: Optional[int], overflow: str) -> None:
+        self.source = source
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.channel: Optional[_Channel] = None
+        self.controlled: Optional[ControlledObservable] = None
+        self.pending = 0  # Requested values not yet taken from the queue
+        self.is_closed = False
+
+    def _subscribe(self) -> _Channel:
+        # Only called from __anext__, where this is the running loop
+        channel = _Channel(asyncio.get_event_loop(), self.maxsize, self.overflow)
+        self.channel = channel
+
+        # Sequences that can be pulled are requested a buffer full at a
+        # time, so they are never read further ahead than maxsize.
+        source = self.source
+        if isinstance(source, IterableObservable) and self.maxsize is not None:
+            self.controlled = source = ControlledObservable(source)
+
+        channel.subscription.disposable = source.subscribe_(channel.on_next, channel.on_error,
+                                                            channel.on_completed)
+        return channel
+
+    async def __anext__(self) -> Any:
+        if self.is_closed:
+            raise StopAsyncIteration
+
+        try:
+            channel = self.channel or self._subscribe()
+            loop = channel.loop
+            queue = channel.queue
+            controlled = self.controlled
+
+            while True:
+                with channel.lock:
+                    if queue:
+                        value = queue.popleft()
+                        self.pending -= 1
+                        if channel.waiting:
+                            channel.space_available.notify()
+                        return value
+                    if channel.error is not None:
+                        raise channel.error
+                    if channel.is_done:
+                        raise StopAsyncIteration
+                    if controlled is None:
+                        channel.waiter = waiter = loop.create_future()
+
+                if controlled is not None:
+                    controlled.request(self.maxsize - max(self.pending, 0))
+                    self.pending = self.maxsize
+                    with channel.lock:
+                        if queue or channel.is_done:
+                            continue
+                        channel.waiter = waiter = loop.create_future()
+                await waiter
+        except BaseException:
+            self.close()
+            raise
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Ends the iteration, disposing the subscription."""
+
+        if self.is_closed:
+            return
+        self.is_closed = True
+        if self.channel is not None:
+            self.channel.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _to_async_iterable(maxsize: Optional[int] = 128,
+                       overflow: str = BLOCK_PRODUCER
+                       ) -> Callable[[Observable], AsyncIterable]:
+    if overflow not in OVERFLOW_STRATEGIES:
+        raise ValueError("overflow must be one of %s" % ", ".join(OVERFLOW_STRATEGIES))
+    if overflow == LATEST_ONLY:
+        maxsize = 1
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be a positive integer")
+
+    def to_async_iterable(source: Observable) -> AsyncIterable:
+        """Converts an observable sequence to an asynchronous iterable.
+
+        Example:
+            >>> async for value in source.pipe(to_async_iterable()):
+            ...     print(value)
+
+        Args:
+            source: Source observable to iterate.
+
+        Returns:
+            An asynchronous iterable. Every iteration subscribes to the
+            source, and disposes the subscription when the iteration
+            ends.
+        """
+
+        return _AsyncIterable(source, maxsize, overflow)
+    return to_async_iterable
@@ -1,17 +1,24 @@
 from threading import RLock
+from typing import Dict
 
 from rx.core.typing import Disposable
 
 
 class CompositeDisposable(Disposable):
     """Represents a group of disposable resources that are disposed
-    together"""
+    together.
+
+    The disposables are kept in an insertion-ordered dict, so adding,
+    removing and looking up a disposable take constant time however
+    large the group grows. Adding a disposable that is already in the
+    group has no effect."""
+
+    __slots__ = ('disposable', 'is_disposed', 'lock')
 
     def __init__(self, *args):
         if args and isinstance(args[0], list):
-            self.disposable = args[0]
-        else:
-            self.disposable = list(args)
+            args = args[0]
+        self.disposable: Dict[Disposable, None] = dict.fromkeys(args)
 
         self.is_disposed = False
         self.lock = RLock()
@@ -29,23 +36,22 @@ class CompositeDisposable(Disposable):
             if self.is_disposed:
                 should_dispose = True
             else:
-                self.disposable.append(item)
+                self.disposable[item] = None
 
         if should_dispose:
             item.dispose()
 
     def remove(self, item):
-        """Removes and disposes the first occurrence of a disposable
-        from the CompositeDisposable."""
+        """Removes and disposes a disposable from the
+        CompositeDisposable."""
 
         if self.is_disposed:
             return
 
-        should_dispose = False
         with self.lock:
-            if item in self.disposable:
-                self.disposable.remove(item)
-                should_dispose = True
+            should_dispose = item in self.disposable
+            if should_dispose:
+                del self.disposable[item]
 
         if should_dispose:
             item.dispose()
@@ -62,7 +68,7 @@ class CompositeDisposable(Disposable):
         with self.lock:
             self.is_disposed = True
             current_disposable = self.disposable
-            self.disposable = []
+            self.disposable = {}
 
         for disp in current_disposable:
             disp.dispose()
@@ -74,7 +80,7 @@ class CompositeDisposable(Disposable):
 
         with self.lock:
             current_disposable = self.disposable
-            self.disposable = []
+            self.disposable = {}
 
         for disposable in current_disposable:
             disposable.dispose()
@@ -92,7 +98,7 @@ class CompositeDisposable(Disposable):
         return item in self.disposable
 
     def to_list(self):
-        return self.disposable[:]
+        return list(self.disposable)
 
     def __len__(self):
         return len(self.disposable)
@@ -9,8 +9,12 @@ class RefCountDisposable(typing.Disposable):
     disposable resource when all dependent disposable objects have been
     disposed."""
 
+    __slots__ = ('underlying_disposable', 'is_primary_disposed', 'is_disposed', 'lock', 'count')
+
     class InnerDisposable(typing.Disposable):
 
+        __slots__ = ('parent', 'is_disposed', 'lock')
+
         def __init__(self, parent) -> None:
             self.parent = parent
             self.is_disposed = False
@@ -11,6 +11,8 @@ class SerialDisposable(Disposable):
     automatic disposal of the previous underlying disposable resource.
     """
 
+    __slots__ = ('current', 'is_disposed', 'lock')
+
     def __init__(self) -> None:
         self.current: Optional[Disposable] = None
         self.is_disposed = False
@@ -10,6 +10,8 @@ class SingleAssignmentDisposable(Disposable):
     disposable resource has already been set, future attempts to set the
     underlying disposable resource will throw an Error."""
 
+    __slots__ = ('is_disposed', 'current', 'lock')
+
     def __init__(self) -> None:
         """Initializes a new instance of the SingleAssignmentDisposable
         class.
@@ -1,5 +1,5 @@
 from .priorityqueue import PriorityQueue
 from .basic import noop, default_error, default_comparer
-from .exceptions import SequenceContainsNoElementsError, ArgumentOutOfRangeException, DisposedException
+from .exceptions import SequenceContainsNoElementsError, ArgumentOutOfRangeException, DisposedException, OverflowException
 from . import concurrency
 from . import constants
@@ -1,5 +1,6 @@
 from typing import Any
 from datetime import datetime
+from time import monotonic
 
 
 # Defaults
@@ -17,6 +18,16 @@ def default_now() -> datetime:
     return datetime.utcnow()
 
 
+_monotonic_offset = (datetime.utcnow() - datetime.utcfromtimestamp(0)).total_seconds() - monotonic()
+
+
+def monotonic_now() -> float:
+    """Returns seconds since the epoch as measured by a monotonic clock,
+    which is anchored to the wall clock once, at import time, and is not
+    affected by later adjustments of the system time."""
+    return _monotonic_offset + monotonic()
+
+
 def default_comparer(x: Any, y: Any) -> bool:
     return x == y
 
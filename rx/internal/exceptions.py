@@ -29,3 +29,8 @@ class CompletedException(Exception):
 class WouldBlockException(Exception):
     def __init__(self, msg=None):
         super(WouldBlockException, self).__init__(msg or "Would block")
+
+
+class OverflowException(Exception):
+    def __init__(self, msg=None):
+        super(OverflowException, self).__init__(msg or "Buffer overflow")
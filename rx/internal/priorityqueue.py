@@ -1,18 +1,33 @@
-import heapq
 from sys import maxsize
-from typing import Generic, List, Tuple
+from typing import Callable, Dict, Generic, List, Optional
 
 from rx.core.typing import T1
 
 
 class PriorityQueue(Generic[T1]):
-    """Priority queue for scheduling. Note that methods aren't thread-safe."""
+    """Priority queue for scheduling. Note that methods aren't thread-safe.
+
+    The queue is a binary heap which keeps track of the position of every
+    entry, so that items can be removed in O(log n). Optionally, items which
+    have been cancelled may be left in the queue and dropped in bulk: callers
+    report cancelled items with mark_cancelled(), and once these exceed the
+    compaction threshold (as a fraction of the queue length), all items for
+    which is_cancelled returns True are removed at once.
+    """
 
     MIN_COUNT = ~maxsize
+    MIN_COMPACTION_LENGTH = 64
 
-    def __init__(self) -> None:
-        self.items: List[Tuple[T1, int]] = []
+    def __init__(self,
+                 is_cancelled: Optional[Callable[[T1], bool]] = None,
+                 compaction_threshold: float = 0.5
+                 ) -> None:
+        self.items: List[list] = []  # Entries are [item, count, index, marked cancelled]
         self.count = PriorityQueue.MIN_COUNT  # Monotonic increasing for sort stability
+        self.is_cancelled = is_cancelled
+        self.compaction_threshold = compaction_threshold
+        self.cancelled = 0
+        self._index: Dict[int, list] = {}
 
     def __len__(self):
         """Returns length of queue"""
@@ -26,29 +41,139 @@ class PriorityQueue(Generic[T1]):
     def dequeue(self) -> T1:
         """Returns and removes item with lowest priority from queue"""
 
-        item: T1 = heapq.heappop(self.items)[0]
+        entry = self.items[0]
+        self._remove_at(0)
         if not self.items:
             self.count = PriorityQueue.MIN_COUNT
-        return item
+            self.cancelled = 0
+        return entry[0]
 
     def enqueue(self, item: T1) -> None:
         """Adds item to queue"""
 
-        heapq.heappush(self.items, (item, self.count))
+        items = self.items
+        entry = [item, self.count, len(items), False]
         self.count += 1
+        items.append(entry)
+        self._index.setdefault(id(item), entry)
+        self._sift_up(entry[2])
 
     def remove(self, item: T1) -> bool:
         """Remove given item from queue"""
 
-        for index, _item in enumerate(self.items):
-            if _item[0] == item:
-                self.items.pop(index)
-                heapq.heapify(self.items)
-                return True
-
-        return False
+        entry = self._index.get(id(item))
+        if entry is None:
+            for entry in self.items:
+                if entry[0] == item:
+                    break
+            else:
+                return False
+
+        self._remove_at(entry[2])
+        return True
+
+    def mark_cancelled(self, item: T1) -> None:
+        """Records that the given item was cancelled, compacting the queue
+        if cancelled items make up more than the compaction threshold of
+        it. Items which already left the queue, or were reported before,
+        are not counted. Counted items leaving the queue are discounted."""
+
+        if self.is_cancelled is None:
+            return
+
+        entry = self._index.get(id(item))
+        if entry is None or entry[0] is not item or entry[3]:
+            return
+
+        entry[3] = True
+        self.cancelled += 1
+        length = len(self.items)
+        if length >= PriorityQueue.MIN_COMPACTION_LENGTH \
+                and self.cancelled > length * self.compaction_threshold:
+            self.compact()
+
+    def compact(self) -> None:
+        """Drops all cancelled items from the queue."""
+
+        is_cancelled = self.is_cancelled
+        self.cancelled = 0
+        if is_cancelled is None:
+            return
+
+        items = [entry for entry in self.items if not is_cancelled(entry[0])]
+        self.items = items
+        self._index = {}
+        for index, entry in enumerate(items):
+            entry[2] = index
+            entry[3] = False
+            self._index.setdefault(id(entry[0]), entry)
+        for index in reversed(range(len(items) // 2)):
+            self._sift_down(index)
 
     def clear(self):
         """Remove all items from the queue."""
         self.items = []
         self.count = PriorityQueue.MIN_COUNT
+        self.cancelled = 0
+        self._index = {}
+
+    def _remove_at(self, index: int) -> None:
+        items = self.items
+        entry = items[index]
+        if self._index.get(id(entry[0])) is entry:
+            del self._index[id(entry[0])]
+        if entry[3]:
+            self.cancelled -= 1
+
+        last = items.pop()
+        if last is not entry:
+            items[index] = last
+            last[2] = index
+            self._sift_down(index)
+            self._sift_up(last[2])
+
+    @staticmethod
+    def _less(a: list, b: list) -> bool:
+        x, y = a[0], b[0]
+        if x < y:
+            return True
+        if y < x:
+            return False
+        return a[1] < b[1]
+
+    def _sift_up(self, index: int) -> None:
+        items = self.items
+        less = self._less
+        entry = items[index]
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = items[parent_index]
+            if not less(entry, parent):
+                break
+            items[index] = parent
+            parent[2] = index
+            index = parent_index
+        items[index] = entry
+        entry[2] = index
+
+    def _sift_down(self, index: int) -> None:
+        items = self.items
+        less = self._less
+        length = len(items)
+        entry = items[index]
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= length:
+                break
+            child = items[child_index]
+            right_index = child_index + 1
+            if right_index < length and less(items[right_index], child):
+                child_index = right_index
+                child = items[right_index]
+            if not less(child, entry):
+                break
+            items[index] = child
+            child[2] = index
+            index = child_index
+        items[index] = entry
+        entry[2] = index
@@ -1,13 +1,15 @@
 # pylint: disable=too-many-lines,redefined-outer-name,redefined-builtin
 
 from asyncio import Future
-from typing import Callable, Union, Any, Iterable, List, Optional, cast, overload
+from concurrent.futures import Executor
+from typing import AsyncIterable, Callable, Union, Any, Iterable, List, Optional, cast, overload
 from datetime import timedelta, datetime
 
 from rx.internal.utils import NotSet
-from rx.core import Observable, ConnectableObservable, GroupedObservable, typing, pipe
+from rx.core import Observable, ConnectableObservable, ControlledObservable, GroupedObservable, typing, pipe
 from rx.core.typing import Mapper, MapperIndexed, Predicate, PredicateIndexed, Comparer, Accumulator
 from rx.subject import Subject
+from rx.core.observer import OverflowStats
 
 
 def all(predicate: Predicate) -> Callable[[Observable], Observable]:
@@ -378,6 +380,38 @@ def concat(*sources: Observable) -> Callable[[Observable], Observable]:
     return _concat(*sources)
 
 
+def concat_map_eager(mapper: Mapper,
+                     max_concurrent: Optional[int] = None
+                     ) -> Callable[[Observable], Observable]:
+    """Projects each element of an observable sequence to an observable
+    sequence, and concatenates the resulting sequences in source order
+    while subscribing to several of them at once.
+
+    Up to max_concurrent inner sequences are subscribed to at the same
+    time. The elements of the first one are emitted as they arrive; the
+    elements of the others are buffered until all sequences before them
+    have completed. Disposing the subscription releases all buffered
+    elements.
+
+    Examples:
+        >>> res = source.pipe(ops.concat_map_eager(lambda url: fetch(url), max_concurrent=4))
+
+    Args:
+        mapper: A function returning an observable sequence, a future or
+            an iterable for each element of the source.
+        max_concurrent: [Optional] Maximum number of inner sequences
+            subscribed to or buffered at the same time. Unbounded if not
+            given.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence with the elements of the inner
+        sequences, in the order of the source elements.
+    """
+    from rx.core.operators.concatmapeager import _concat_map_eager
+    return _concat_map_eager(mapper, max_concurrent)
+
+
 def contains(value: Any,
              comparer: Optional[typing.Comparer] = None
              ) -> Callable[[Observable], Observable]:
@@ -409,6 +443,36 @@ def contains(value: Any,
     return _contains(value, comparer)
 
 
+def controlled(scheduler: Optional[typing.Scheduler] = None) -> Callable[[Observable], ControlledObservable]:
+    """Turns an observable sequence into one that only emits elements
+    once they are requested, by calling ``request(n)`` on the returned
+    :class:`ControlledObservable <rx.core.ControlledObservable>`.
+
+    Sequences created by :func:`rx.from_iterable`, :func:`rx.range`
+    and :func:`rx.generate`, optionally followed by :func:`map`,
+    :func:`filter` and :func:`buffer_with_count`, are pulled only as
+    far as requested, so they can be streamed through slow consumers
+    in constant memory. The elements of any other source are buffered
+    until requested.
+
+    Examples:
+        >>> source = rx.range(0, 1000000).pipe(ops.controlled())
+        >>> source.subscribe(lambda x: source.request(1))
+        >>> source.request(1)
+
+    Args:
+        scheduler: [Optional] Scheduler to pull elements on. Defaults
+            to the subscription scheduler, or the current thread
+            scheduler.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns a controlled observable sequence.
+    """
+    from rx.core.operators.controlled import _controlled
+    return _controlled(scheduler)
+
+
 def count(predicate: Optional[typing.Predicate] = None) -> Callable[[Observable], Observable]:
     """Returns an observable sequence containing a value that
     represents how many elements in the specified observable sequence
@@ -611,7 +675,10 @@ def delay(duetime: typing.RelativeTime,
 
 
 def distinct(key_mapper: Optional[Mapper] = None,
-             comparer: Optional[Comparer] = None
+             comparer: Optional[Comparer] = None,
+             max_keys: Optional[int] = None,
+             ttl: Optional[typing.RelativeTime] = None,
+             scheduler: Optional[typing.Scheduler] = None
              ) -> Callable[[Observable], Observable]:
     """Returns an observable sequence that contains only distinct
     elements according to the key_mapper and the comparer. Usage of
@@ -630,11 +697,21 @@ def distinct(key_mapper: Optional[Mapper] = None,
         >>> res = obs = xs.distinct()
         >>> obs = xs.distinct(lambda x: x.id)
         >>> obs = xs.distinct(lambda x: x.id, lambda a,b: a == b)
+        >>> obs = xs.distinct(lambda x: x.id, max_keys=100000)
+        >>> obs = xs.distinct(lambda x: x.id, ttl=60.0)
 
     Args:
         key_mapper: [Optional]  A function to compute the comparison
             key for each element.
         comparer: [Optional]  Used to compare items in the collection.
+            Supplying a comparer disables hashing, so every lookup
+            scans all previously seen keys.
+        max_keys: [Optional] Maximum number of keys to remember. When
+            exceeded, the least recently seen key is forgotten and may
+            be emitted again. Ignored when a comparer is given.
+        ttl: [Optional] Time after which a key that has not been seen
+            again is forgotten. Ignored when a comparer is given.
+        scheduler: [Optional] Scheduler used to measure the ttl.
 
     Returns:
         An operator function that takes an observable source and
@@ -643,7 +720,7 @@ def distinct(key_mapper: Optional[Mapper] = None,
         sequence.
     """
     from rx.core.operators.distinct import _distinct
-    return _distinct(key_mapper, comparer)
+    return _distinct(key_mapper, comparer, max_keys, ttl, scheduler)
 
 
 def distinct_until_changed(key_mapper: Optional[Mapper] = None,
@@ -1463,6 +1540,49 @@ def map(mapper: Optional[Mapper] = None) -> Callable[[Observable], Observable]:
     return _map(mapper)
 
 
+def map_async(mapper: Callable[[Any], Any],
+              max_concurrency: Optional[int] = None,
+              ordered: bool = True,
+              scheduler: Optional[typing.Scheduler] = None
+              ) -> Callable[[Observable], Observable]:
+    """Runs a coroutine function for each element of the source on an
+    asyncio event loop, and emits the results.
+
+    At most max_concurrency coroutines are in flight at any time;
+    elements arriving while the limit is reached are queued until one
+    of the running coroutines finishes. Results are emitted in the
+    order of the source elements, or as soon as they are available if
+    ordered is False. The sequence completes when the source has
+    completed and all coroutines have finished, and fails with the
+    first exception raised by a coroutine. Disposing the subscription
+    cancels the coroutines still in flight.
+
+    Examples:
+        >>> res = source.pipe(ops.map_async(fetch, max_concurrency=10))
+        >>> res = source.pipe(ops.map_async(fetch, ordered=False))
+
+    Args:
+        mapper: A coroutine function to apply to each element.
+        max_concurrency: [Optional] Maximum number of coroutines in
+            flight. Unbounded if not given.
+        ordered: [Optional] Whether to emit the results in the order of
+            the source elements. Defaults to True.
+        scheduler: [Optional] AsyncIOScheduler or
+            AsyncIOThreadSafeScheduler whose loop runs the coroutines.
+            Defaults to the subscription scheduler if that is an
+            asyncio scheduler, or else the current event loop. Use the
+            thread safe scheduler if the source emits on other threads
+            than the loop thread.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence with the results of the
+        coroutines.
+    """
+    from rx.core.operators.mapasync import _map_async
+    return _map_async(mapper, max_concurrency, ordered, scheduler)
+
+
 def map_indexed(mapper_indexed: Optional[MapperIndexed] = None) -> Callable[[Observable], Observable]:
     """Project each element of an observable sequence into a new form
     by incorporating the element's index.
@@ -1492,6 +1612,53 @@ def map_indexed(mapper_indexed: Optional[MapperIndexed] = None) -> Callable[[Obs
     return _map_indexed(mapper_indexed)
 
 
+def map_parallel(mapper: Callable[[Any], Any],
+                 executor: Optional[Executor] = None,
+                 workers: Optional[int] = None,
+                 chunk_size: int = 1,
+                 ordered: bool = True,
+                 max_pending: Optional[int] = None
+                 ) -> Callable[[Observable], Observable]:
+    """Applies a function to each element of the source in parallel,
+    in an executor such as a process pool.
+
+    Elements are grouped in chunks of chunk_size elements, and each
+    chunk is submitted to the executor as a single task, which saves a
+    round trip per element. A chunk is submitted once it is full, or
+    when the source completes. At most max_pending chunks are in flight
+    at any time; the source is blocked while the limit is reached.
+    Results are emitted in the order of the source elements, or a chunk
+    at a time in completion order if ordered is False.
+
+    Examples:
+        >>> res = source.pipe(ops.map_parallel(extract_features, workers=16, chunk_size=64))
+        >>> res = source.pipe(ops.map_parallel(extract_features, executor=executor))
+
+    Args:
+        mapper: A function to apply to each element. When using a
+            process pool, it has to be picklable, i.e. defined at
+            module level.
+        executor: [Optional] The executor to run the chunks in. If not
+            given, a ProcessPoolExecutor with the given number of
+            workers is created for each subscription, and shut down
+            when the subscription ends.
+        workers: [Optional] Number of worker processes of the created
+            executor. Defaults to the number of processors.
+        chunk_size: [Optional] Number of elements to submit per task.
+            Defaults to 1.
+        ordered: [Optional] Whether to emit the results in the order of
+            the source elements. Defaults to True.
+        max_pending: [Optional] Maximum number of chunks in flight.
+            Defaults to twice the number of workers.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence with the mapped elements.
+    """
+    from rx.core.operators.mapparallel import _map_parallel
+    return _map_parallel(mapper, executor, workers, chunk_size, ordered, max_pending)
+
+
 def materialize() -> Callable[[Observable], Observable]:
     """Materializes the implicit notifications of an observable
     sequence as explicit notification values.
@@ -1717,12 +1884,41 @@ def multicast(subject: Optional[typing.Subject] = None,
     return _multicast(subject, subject_factory, mapper)
 
 
-def observe_on(scheduler: typing.Scheduler) -> Callable[[Observable], Observable]:
+def observe_on(scheduler: typing.Scheduler,
+               budget: Optional[int] = None,
+               capacity: Optional[int] = None,
+               overflow: str = 'drop_oldest',
+               on_drop: Optional[Callable[[Any], None]] = None,
+               stats: Optional[OverflowStats] = None
+               ) -> Callable[[Observable], Observable]:
     """Wraps the source sequence in order to run its observer callbacks
     on the specified scheduler.
 
+    Notifications are queued, and each action run on the scheduler
+    forwards a batch of the queued notifications at once.
+
     Args:
         scheduler: Scheduler to notify observers on.
+        budget: [Optional] Maximum number of notifications forwarded
+            by a single scheduled action, after which the remaining
+            ones are forwarded by a newly scheduled action. Defaults to
+            128.
+        capacity: [Optional] Maximum number of values waiting to be
+            forwarded. Unbounded if not given.
+        overflow: [Optional] What to do with values arriving while the
+            queue is at capacity: 'drop_oldest' (the default) discards
+            the oldest queued value, 'drop_newest' discards the
+            arriving value, 'block_producer' blocks the producer until
+            there is space, 'latest_only' keeps only the most recent
+            value queued, and 'error' terminates the sequence with an
+            OverflowException and disposes the subscription to the
+            source. Do not use 'block_producer' when the producer runs
+            on the same thread as the scheduler.
+        on_drop: [Optional] Called with every discarded value.
+        stats: [Optional] An :class:`OverflowStats
+            <rx.core.observer.OverflowStats>` instance whose dropped
+            count is increased by the number of discarded values. It
+            can be shared between subscriptions and operators.
 
     This only invokes observer callbacks on a scheduler. In case the
     subscription and/or unsubscription actions have side-effects
@@ -1734,7 +1930,7 @@ def observe_on(scheduler: typing.Scheduler) -> Callable[[Observable], Observable
         specified scheduler.
     """
     from rx.core.operators.observeon import _observe_on
-    return _observe_on(scheduler)
+    return _observe_on(scheduler, budget, capacity, overflow, on_drop, stats)
 
 
 def on_error_resume_next(second: Observable) -> Callable[[Observable], Observable]:
@@ -1782,6 +1978,50 @@ def pairwise() -> Callable[[Observable], Observable]:
     return _pairwise()
 
 
+def parallel_by_key(key_mapper: Mapper,
+                    shards: Optional[int] = None,
+                    pipeline: Optional[Callable[[Observable], Observable]] = None,
+                    scheduler_factory: Optional[Callable[[], typing.Scheduler]] = None
+                    ) -> Callable[[Observable], Observable]:
+    """Partitions the source sequence by key into a fixed number of
+    shards, runs an operator pipeline for each shard on its own
+    scheduler, and merges the outputs.
+
+    Elements are assigned to a shard by the hash of their key, so all
+    elements with the same key go through the same shard, in order,
+    while different keys are spread over the shards. Unlike
+    :func:`group_by` followed by :func:`observe_on`, this takes one
+    subject and one thread per shard rather than per key.
+
+    The output of the shard pipelines is interleaved arbitrarily, but
+    for each key the order of the source is preserved as long as the
+    pipeline does not reorder elements itself.
+
+    Examples:
+        >>> res = source.pipe(ops.parallel_by_key(lambda x: x['user'], shards=8,
+        ...                                       pipeline=ops.map(enrich)))
+
+    Args:
+        key_mapper: A function to extract the key of each element.
+        shards: [Optional] Number of shards. Defaults to the number of
+            processors.
+        pipeline: [Optional] Operator to apply to the sequence of each
+            shard, e.g. composed with :func:`rx.pipe`.
+        scheduler_factory: [Optional] Function returning the scheduler
+            to run a shard on; called once per shard for every
+            subscription. Defaults to creating an
+            :class:`EventLoopScheduler <rx.scheduler.EventLoopScheduler>`
+            per shard, which is disposed when the subscription ends.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an observable sequence with the merged output of the
+        shard pipelines.
+    """
+    from rx.core.operators.parallelbykey import _parallel_by_key
+    return _parallel_by_key(key_mapper, shards, pipeline, scheduler_factory)
+
+
 def partition(predicate: Predicate) -> Callable[[Observable], List[Observable]]:
     """Returns two observables which partition the observations of the
     source by the given function. The first will trigger observations
@@ -1845,6 +2085,58 @@ def partition_indexed(predicate_indexed: PredicateIndexed) -> Callable[[Observab
     return _partition_indexed(predicate_indexed)
 
 
+def pausable(pauser: Observable) -> Callable[[Observable], Observable]:
+    """Pauses the source observable sequence while the pauser last
+    emitted False, and resumes it when the pauser emits True. Elements
+    produced by the source while paused are dropped. The sequence is
+    not paused until the pauser first emits False.
+
+    Examples:
+        >>> pauser = rx.subject.Subject()
+        >>> res = source.pipe(ops.pausable(pauser))
+        >>> pauser.on_next(False)  # Pause
+        >>> pauser.on_next(True)  # Resume
+
+    Args:
+        pauser: Observable sequence of booleans, where False pauses
+            and True resumes the source sequence.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns the source sequence with the elements produced while
+        paused left out.
+    """
+    from rx.core.operators.pausable import _pausable
+    return _pausable(pauser)
+
+
+def pausable_buffered(pauser: Observable, max_buffer: Optional[int] = None) -> Callable[[Observable], Observable]:
+    """Pauses the source observable sequence while the pauser last
+    emitted False, and resumes it when the pauser emits True. Elements
+    produced by the source while paused are buffered, and emitted at
+    once when resumed. Completion of the source is delayed until the
+    buffer has been emitted.
+
+    Examples:
+        >>> pauser = rx.subject.Subject()
+        >>> res = source.pipe(ops.pausable_buffered(pauser, max_buffer=10000))
+
+    Args:
+        pauser: Observable sequence of booleans, where False pauses
+            and True resumes the source sequence.
+        max_buffer: [Optional] Maximum number of buffered elements.
+            When the buffer is full, the oldest element is dropped to
+            make room for a new one. Unbounded if not given.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns the source sequence, with the elements produced while
+        paused emitted once resumed.
+    """
+    from rx.core.operators.pausable import _pausable_buffered
+    return _pausable_buffered(pauser, max_buffer)
+
+
 def pluck(key: Any) -> Callable[[Observable], Observable]:
     """Retrieves the value of a specified key using dict-like access (as in
     element[key]) from all elements in the Observable sequence.
@@ -3167,6 +3459,48 @@ def time_interval(scheduler: Optional[typing.Scheduler] = None) -> Callable[[Obs
     return _time_interval(scheduler=scheduler)
 
 
+def to_async_iterable(maxsize: Optional[int] = 128,
+                      overflow: str = 'block_producer'
+                      ) -> Callable[[Observable], AsyncIterable]:
+    """Converts an observable sequence to an asynchronous iterable, to
+    be consumed with ``async for`` on an asyncio event loop.
+
+    Every iteration subscribes to the source, and disposes the
+    subscription when the iteration ends, also when breaking out of
+    the loop. Items are kept in a buffer of at most maxsize items until
+    they are consumed.
+
+    Sequences created by :func:`rx.from_iterable`, :func:`rx.range`
+    and :func:`rx.generate` are pulled only as far as there is room in
+    the buffer. For other sources, the overflow strategy decides what
+    happens when the buffer is full: ``'block_producer'`` makes the
+    producing thread wait for room, ``'drop_oldest'`` discards the
+    oldest buffered item, ``'drop_newest'`` discards the incoming item,
+    ``'latest_only'`` only keeps the most recent item, and ``'error'``
+    ends the iteration with an
+    :class:`OverflowException <rx.internal.exceptions.OverflowException>`.
+    Producers running on the event loop thread itself cannot be
+    blocked, so their items are buffered regardless of maxsize when
+    using ``'block_producer'``.
+
+    Examples:
+        >>> async for value in source.pipe(ops.to_async_iterable()):
+        ...     print(value)
+        >>> res = source.pipe(ops.to_async_iterable(maxsize=1000, overflow='drop_oldest'))
+
+    Args:
+        maxsize: [Optional] Maximum number of buffered items, or None
+            for an unbounded buffer. Defaults to 128.
+        overflow: [Optional] Strategy to apply when the buffer is full.
+
+    Returns:
+        An operator function that takes an observable source and
+        returns an asynchronous iterable over its items.
+    """
+    from rx.core.operators.toasynciterable import _to_async_iterable
+    return _to_async_iterable(maxsize, overflow)
+
+
 def to_dict(key_mapper: Mapper, element_mapper: Optional[Mapper] = None
            ) -> Callable[[Observable], Observable]:
     """Converts the observable sequence to a Map if it exists.
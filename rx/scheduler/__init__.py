@@ -8,4 +8,6 @@ from .immediatescheduler import ImmediateScheduler, immediate_scheduler
 from .newthreadscheduler import NewThreadScheduler
 from .threadpoolscheduler import ThreadPoolScheduler
 from .timeoutscheduler import TimeoutScheduler, timeout_scheduler
+from .timingwheelscheduler import TimingWheelScheduler
 from .virtualtimescheduler import VirtualTimeScheduler
+from .workstealingscheduler import WorkStealingScheduler
@@ -1,12 +1,13 @@
 import logging
 import threading
 import time
-from typing import MutableMapping, Optional
+from collections import deque
+from datetime import datetime
+from typing import Deque, MutableMapping, Optional, Union
 from weakref import WeakKeyDictionary
 
 from rx.core import typing
 from rx.internal import PriorityQueue
-from rx.internal.constants import DELTA_ZERO
 
 from .scheduler import Scheduler
 from .scheduleditem import ScheduledItem
@@ -17,26 +18,49 @@ log = logging.getLogger('Rx')
 
 class Trampoline(object):
     @classmethod
-    def run(cls, queue: PriorityQueue[ScheduledItem[typing.TState]]) -> None:
-        while queue:
-            item: ScheduledItem = queue.peek()
-            if item.is_cancelled():
-                queue.dequeue()
-            else:
-                diff = item.duetime - item.scheduler.now
-                if diff <= DELTA_ZERO:
-                    item.invoke()
-                    queue.dequeue()
-                else:
-                    time.sleep(diff.total_seconds())
+    def run(cls,
+            ready: Deque[ScheduledItem[typing.TState]],
+            queue: PriorityQueue[ScheduledItem[typing.TState]]
+            ) -> None:
+        """Runs the items in the ready lane in FIFO order. While there are
+        delayed items in the queue, the time is checked before each ready
+        item, and delayed items that have become due are moved to the end
+        of the ready lane, so a steady stream of ready items cannot hold
+        them back. The clock is not read at all while there are no delayed
+        items."""
+
+        while ready or queue:
+            if queue:
+                scheduler = queue.peek().scheduler
+                now = scheduler._internal_now()
+                while queue:
+                    item = queue.peek()
+                    if item.is_cancelled():
+                        queue.dequeue()
+                    elif item.duetime <= now:
+                        ready.append(queue.dequeue())
+                    else:
+                        break
+
+                if not ready:
+                    if queue:
+                        diff = scheduler.to_seconds(queue.peek().duetime - now)
+                        if diff > 0:
+                            time.sleep(diff)
+                    continue
+
+            item = ready.popleft()
+            if not item.is_cancelled():
+                item.invoke()
 
 
 class _Local(threading.local):
-    __slots__ = 'idle', 'queue'
+    __slots__ = 'idle', 'ready', 'queue'
 
     def __init__(self) -> None:
         super().__init__()
         self.idle: bool = True
+        self.ready: Deque[ScheduledItem[typing.TState]] = deque()
         self.queue: PriorityQueue[
             ScheduledItem[typing.TState]] = PriorityQueue()
 
@@ -89,7 +113,12 @@ class CurrentThreadScheduler(Scheduler):
             (best effort).
         """
 
-        return self.schedule_absolute(self.now, action, state=state)
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, self._internal_now())
+        local: _Local = CurrentThreadScheduler._local
+        local.ready.append(si)
+        if local.idle:
+            self._run(local)
+        return si.disposable
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -108,8 +137,7 @@ class CurrentThreadScheduler(Scheduler):
             (best effort).
         """
 
-        duetime = max(DELTA_ZERO, self.to_timedelta(duetime))
-        return self.schedule_absolute(self.now + duetime, action, state=state)
+        return self._schedule_at(self._internal_due(duetime), action, state)
 
     def schedule_absolute(self,
                           duetime: typing.AbsoluteTime,
@@ -128,25 +156,35 @@ class CurrentThreadScheduler(Scheduler):
             (best effort).
         """
 
-        duetime = self.to_datetime(duetime)
-
-        if duetime > self.now:
-            log.warning("Do not schedule blocking work!")
+        return self._schedule_at(self._internal_time(duetime), action, state)
 
+    def _schedule_at(self,
+                     duetime: Union[datetime, float],
+                     action: typing.ScheduledAction,
+                     state: Optional[typing.TState] = None
+                     ) -> typing.Disposable:
         si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, duetime)
 
         local: _Local = CurrentThreadScheduler._local
-        local.queue.enqueue(si)
+        if duetime > self._internal_now():
+            log.warning("Do not schedule blocking work!")
+            local.queue.enqueue(si)
+        else:
+            local.ready.append(si)
         if local.idle:
-            local.idle = False
-            try:
-                Trampoline.run(local.queue)
-            finally:
-                local.idle = True
-                local.queue.clear()
-
+            self._run(local)
         return si.disposable
 
+    @staticmethod
+    def _run(local: _Local) -> None:
+        local.idle = False
+        try:
+            Trampoline.run(local.ready, local.queue)
+        finally:
+            local.idle = True
+            local.ready.clear()
+            local.queue.clear()
+
     def schedule_required(self) -> bool:
         """Test if scheduling is required.
 
@@ -2,10 +2,9 @@ import logging
 import asyncio
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
 from rx.core import typing
-from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
 
 from ..periodicscheduler import PeriodicScheduler
 
@@ -13,10 +12,57 @@ from ..periodicscheduler import PeriodicScheduler
 log = logging.getLogger("Rx")
 
 
+class _AsyncIOAction(typing.Disposable):
+    """An action scheduled on the asyncio loop. A single object serves as
+    the loop callback and as the disposable returned to the caller."""
+
+    __slots__ = ('scheduler', 'action', 'state', 'handle', 'disposable', 'is_disposed')
+
+    def __init__(self,
+                 scheduler: 'AsyncIOScheduler',
+                 action: typing.ScheduledAction,
+                 state: Optional[typing.TState]
+                 ) -> None:
+        self.scheduler = scheduler
+        self.action: Optional[typing.ScheduledAction] = action
+        self.state = state
+        self.handle: Optional[asyncio.Handle] = None
+        self.disposable: Optional[typing.Disposable] = None
+        self.is_disposed = False
+
+    def run(self) -> None:
+        action, state = self.action, self.state
+        self.action = self.state = None
+        if self.is_disposed or action is None:
+            return
+
+        ret = action(self.scheduler, state)
+        if isinstance(ret, typing.Disposable):
+            if self.is_disposed:
+                ret.dispose()
+            else:
+                self.disposable = ret
+
+    def dispose(self) -> None:
+        if self.is_disposed:
+            return
+        self.is_disposed = True
+        self.action = self.state = None
+
+        if self.handle is not None:
+            self.handle.cancel()
+        if self.disposable is not None:
+            self.disposable.dispose()
+
+
 class AsyncIOScheduler(PeriodicScheduler):
     """A scheduler that schedules work via the asyncio mainloop. This class
     does not use the asyncio threadsafe methods, if you need those please use
-    the AsyncIOThreadSafeScheduler class."""
+    the AsyncIOThreadSafeScheduler class.
+
+    Due times are kept as float seconds on the clock of the loop, and each
+    scheduled action is a single handle object which is also the
+    disposable returned to the caller."""
 
     def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
         """Create a new AsyncIOScheduler.
@@ -42,17 +88,10 @@ class AsyncIOScheduler(PeriodicScheduler):
             The disposable object used to cancel the scheduled action
             (best effort).
         """
-        sad = SingleAssignmentDisposable()
-
-        def interval() -> None:
-            sad.disposable = self.invoke_action(action, state=state)
-
-        handle = self._loop.call_soon(interval)
 
-        def dispose() -> None:
-            handle.cancel()
-
-        return CompositeDisposable(sad, Disposable(dispose))
+        item = _AsyncIOAction(self, action, state)
+        item.handle = self._loop.call_soon(item.run)
+        return item
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -74,17 +113,9 @@ class AsyncIOScheduler(PeriodicScheduler):
         if seconds <= 0:
             return self.schedule(action, state)
 
-        sad = SingleAssignmentDisposable()
-
-        def interval() -> None:
-            sad.disposable = self.invoke_action(action, state=state)
-
-        handle = self._loop.call_later(seconds, interval)
-
-        def dispose() -> None:
-            handle.cancel()
-
-        return CompositeDisposable(sad, Disposable(dispose))
+        item = _AsyncIOAction(self, action, state)
+        item.handle = self._loop.call_later(seconds, item.run)
+        return item
 
     def schedule_absolute(self,
                           duetime: typing.AbsoluteTime,
@@ -103,8 +134,8 @@ class AsyncIOScheduler(PeriodicScheduler):
             (best effort).
         """
 
-        duetime = self.to_datetime(duetime)
-        return self.schedule_relative(duetime - self.now, action, state=state)
+        seconds = self.to_seconds(duetime) - self._loop.time()
+        return self.schedule_relative(seconds, action, state=state)
 
     @property
     def now(self) -> datetime:
@@ -117,3 +148,12 @@ class AsyncIOScheduler(PeriodicScheduler):
         """
 
         return self.to_datetime(self._loop.time())
+
+    def _internal_now(self) -> Union[datetime, float]:
+        return self._loop.time()
+
+    def _internal_time(self, duetime: typing.AbsoluteTime) -> Union[datetime, float]:
+        return self.to_seconds(duetime)
+
+    def _internal_due(self, duetime: typing.RelativeTime) -> Union[datetime, float]:
+        return self._loop.time() + max(0.0, self.to_seconds(duetime))
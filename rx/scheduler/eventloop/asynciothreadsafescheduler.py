@@ -1,12 +1,15 @@
 import logging
 import asyncio
+import threading
 
+from collections import deque
 from concurrent.futures import Future
-from typing import Optional
+from typing import Deque, Optional
 
 from rx.core import typing
 from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
 
+from ..scheduleditem import ScheduledItem
 from .asyncioscheduler import AsyncIOScheduler
 
 
@@ -16,17 +19,29 @@ log = logging.getLogger("Rx")
 class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
     """A scheduler that schedules work via the asyncio mainloop. This is a
     subclass of AsyncIOScheduler which uses the threadsafe asyncio methods.
+
+    In batching mode, actions passed to schedule are put in a queue which
+    is drained by a single callback on the loop. Only the first action
+    queued while no drain is pending wakes up the loop, so producers on
+    other threads scheduling many actions in a row cause one wakeup per
+    loop iteration rather than one per action.
     """
 
-    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+    def __init__(self, loop: asyncio.AbstractEventLoop, batch: bool = False) -> None:
         """Create a new AsyncIOThreadSafeScheduler.
 
         Args:
             loop: Instance of asyncio event loop to use; typically, you would
                 get this by asyncio.get_event_loop()
+            batch: [Optional] If True, actions scheduled without a delay
+                are queued and run in batches by one loop callback.
         """
 
         super().__init__(loop)
+        self._batch = batch
+        self._batch_lock = threading.Lock()
+        self._batch_queue: Deque[ScheduledItem] = deque()
+        self._drain_pending = False
 
     def schedule(self,
                  action: typing.ScheduledAction,
@@ -42,6 +57,10 @@ class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
             The disposable object used to cancel the scheduled action
             (best effort).
         """
+
+        if self._batch:
+            return self._schedule_batched(action, state)
+
         sad = SingleAssignmentDisposable()
 
         def interval() -> None:
@@ -61,6 +80,43 @@ class AsyncIOThreadSafeScheduler(AsyncIOScheduler):
 
         return CompositeDisposable(sad, Disposable(dispose))
 
+    def _schedule_batched(self,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        item: ScheduledItem = ScheduledItem(self, state, action, self._loop.time())
+
+        with self._batch_lock:
+            self._batch_queue.append(item)
+            wakeup = not self._drain_pending
+            self._drain_pending = True
+
+        if wakeup:
+            self._loop.call_soon_threadsafe(self._drain)
+
+        # Cancelling does not need a round trip to the loop, since the
+        # drain skips items that were disposed before their turn.
+        return item.disposable
+
+    def _drain(self) -> None:
+        with self._batch_lock:
+            items = self._batch_queue
+            self._batch_queue = deque()
+            self._drain_pending = False
+
+        for item in items:
+            if item.is_cancelled():
+                continue
+            try:
+                item.invoke()
+            except Exception as exc:  # pylint: disable=broad-except
+                # Report like the loop does for a failing callback, so
+                # one action cannot keep the rest of the batch from running.
+                self._loop.call_exception_handler({
+                    'message': 'Exception in scheduled action',
+                    'exception': exc,
+                })
+
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
                           action: typing.ScheduledAction,
@@ -1,12 +1,12 @@
 import logging
 import threading
 from collections import deque
-from typing import Deque, Optional
+from datetime import datetime
+from typing import Deque, Optional, Union
 
 from rx.core import typing
 from rx.disposable import Disposable
 from rx.internal.concurrency import default_thread_factory
-from rx.internal.constants import DELTA_ZERO
 from rx.internal.exceptions import DisposedException
 from rx.internal.priorityqueue import PriorityQueue
 
@@ -30,7 +30,7 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
         self._thread_factory = thread_factory or default_thread_factory
         self._thread: Optional[threading.Thread] = None
         self._condition = threading.Condition(threading.Lock())
-        self._queue: PriorityQueue[ScheduledItem[typing.TState]] = PriorityQueue()
+        self._queue: PriorityQueue[ScheduledItem[typing.TState]] = PriorityQueue(ScheduledItem.is_cancelled)
         self._ready_list: Deque[ScheduledItem] = deque()
 
         self._exit_if_empty = exit_if_empty
@@ -50,7 +50,7 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
             (best effort).
         """
 
-        return self.schedule_absolute(self.now, action, state=state)
+        return self._schedule_at(self._internal_now(), action, state)
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -69,8 +69,7 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
             (best effort).
         """
 
-        duetime = max(DELTA_ZERO, self.to_timedelta(duetime))
-        return self.schedule_absolute(self.now + duetime, action, state)
+        return self._schedule_at(self._internal_due(duetime), action, state)
 
     def schedule_absolute(self,
                           duetime: typing.AbsoluteTime,
@@ -89,21 +88,32 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
             (best effort).
         """
 
+        return self._schedule_at(self._internal_time(duetime), action, state)
+
+    def _schedule_at(self,
+                     duetime: Union[datetime, float],
+                     action: typing.ScheduledAction,
+                     state: Optional[typing.TState] = None
+                     ) -> typing.Disposable:
         if self._is_disposed:
             raise DisposedException()
 
-        dt = self.to_datetime(duetime)
-        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, dt)
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, duetime)
 
         with self._condition:
-            if dt <= self.now:
+            if duetime <= self._internal_now():
                 self._ready_list.append(si)
             else:
                 self._queue.enqueue(si)
             self._condition.notify()  # signal that a new item is available
             self._ensure_thread()
 
-        return Disposable(si.cancel)
+        def dispose() -> None:
+            si.cancel()
+            with self._condition:
+                self._queue.mark_cancelled(si)
+
+        return Disposable(dispose)
 
     def schedule_periodic(self,
                           period: typing.RelativeTime,
@@ -163,7 +173,7 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
 
                 # Sort the ready_list (from recent calls for immediate schedule)
                 # and the due subset of previously queued items.
-                time = self.now
+                time = self._internal_now()
                 while self._queue:
                     due = self._queue.peek().duetime
                     while self._ready_list and due > self._ready_list[0].duetime:
@@ -187,8 +197,8 @@ class EventLoopScheduler(PeriodicScheduler, typing.Disposable):
                     continue
 
                 elif self._queue:
-                    due = self._queue.peek().duetime - self.now
-                    seconds = due.total_seconds()
+                    due = self._queue.peek().duetime - self._internal_now()
+                    seconds = self.to_seconds(due)
                     if seconds > 0:
                         log.debug("timeout: %s", seconds)
                         self._condition.wait(seconds)
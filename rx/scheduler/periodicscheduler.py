@@ -38,7 +38,7 @@ class PeriodicScheduler(Scheduler, typing.PeriodicScheduler):
             if disp.is_disposed:
                 return None
 
-            time: typing.AbsoluteOrRelativeTime = scheduler.now
+            time = self._internal_now()
 
             try:
                 state = action(state)
@@ -46,7 +46,7 @@ class PeriodicScheduler(Scheduler, typing.PeriodicScheduler):
                 disp.dispose()
                 raise
 
-            time = seconds - (scheduler.now - time).total_seconds()
+            time = seconds - self.to_seconds(self._internal_now() - time)
             disp.disposable = scheduler.schedule_relative(time, periodic, state=state)
 
             return None
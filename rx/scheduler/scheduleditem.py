@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Generic, Optional, Any
+from typing import Generic, Optional, Any, Union
 
 from rx.core import typing
 from rx.disposable import SingleAssignmentDisposable
@@ -9,16 +9,18 @@ from .scheduler import Scheduler
 
 class ScheduledItem(Generic[typing.TState]):  # pylint: disable=unsubscriptable-object
 
+    __slots__ = ('scheduler', 'state', 'action', 'duetime', 'disposable')
+
     def __init__(self,
                  scheduler: Scheduler,
                  state: Optional[typing.TState],
                  action: typing.ScheduledAction,
-                 duetime: datetime
+                 duetime: Union[datetime, float]
                  ) -> None:
         self.scheduler: Scheduler = scheduler
         self.state: Optional[typing.TState] = state
         self.action: typing.ScheduledAction = action
-        self.duetime: datetime = duetime
+        self.duetime: Union[datetime, float] = duetime
         self.disposable: SingleAssignmentDisposable = SingleAssignmentDisposable()
 
     def invoke(self) -> None:
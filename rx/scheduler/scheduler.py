@@ -1,10 +1,10 @@
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Union
 
 from rx.core import typing
 from rx.disposable import Disposable, MultipleAssignmentDisposable
-from rx.internal.basic import default_now
+from rx.internal.basic import default_now, monotonic_now
 from rx.internal.constants import DELTA_ZERO, UTC_ZERO
 
 
@@ -12,8 +12,17 @@ class Scheduler(typing.Scheduler):
     """Base class for the various scheduler implementations in this package as
     well as the mainloop sub-package. This does not include an implementation
     of schedule_periodic, refer to PeriodicScheduler.
+
+    Setting monotonic_clock to True, on this class or on a subclass, makes
+    schedulers using the system clock keep time as monotonic float
+    seconds internally, converting to datetime only in now. This avoids
+    building datetimes for every scheduled item and is not affected by
+    adjustments of the wall clock. It should be set before any work is
+    scheduled.
     """
 
+    monotonic_clock: bool = False
+
     @property
     def now(self) -> datetime:
         """Represents a notion of time for this scheduler. Tasks being
@@ -24,8 +33,35 @@ class Scheduler(typing.Scheduler):
              The scheduler's current time, as a datetime instance.
         """
 
+        if self.monotonic_clock:
+            return self.to_datetime(monotonic_now())
         return default_now()
 
+    def _internal_now(self) -> Union[datetime, float]:
+        """Returns the current time in the representation used for due
+        times: float seconds in monotonic clock mode, or now otherwise."""
+
+        if self.monotonic_clock:
+            return monotonic_now()
+        return self.now
+
+    def _internal_time(self, duetime: typing.AbsoluteTime) -> Union[datetime, float]:
+        """Converts an absolute time to the representation used for due
+        times."""
+
+        if self.monotonic_clock:
+            return self.to_seconds(duetime)
+        return self.to_datetime(duetime)
+
+    def _internal_due(self, duetime: typing.RelativeTime) -> Union[datetime, float]:
+        """Returns the due time for a relative time from now, in the
+        representation used for due times. Negative values are treated as
+        zero."""
+
+        if self.monotonic_clock:
+            return monotonic_now() + max(0.0, self.to_seconds(duetime))
+        return self.now + max(DELTA_ZERO, self.to_timedelta(duetime))
+
     @abstractmethod
     def schedule(self,
                  action: typing.ScheduledAction,
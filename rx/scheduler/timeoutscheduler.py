@@ -1,14 +1,50 @@
-from threading import Timer
-from typing import Optional
+import logging
+import os
+import threading
+from collections import deque
+from typing import Deque, Optional
 
 from rx.core import typing
-from rx.disposable import CompositeDisposable, Disposable, SingleAssignmentDisposable
+from rx.disposable import Disposable
+from rx.internal.basic import monotonic_now
+from rx.internal.concurrency import default_thread_factory
+from rx.internal.priorityqueue import PriorityQueue
 
 from .periodicscheduler import PeriodicScheduler
+from .scheduleditem import ScheduledItem
+
+
+log = logging.getLogger('Rx')
 
 
 class TimeoutScheduler(PeriodicScheduler):
-    """A scheduler that schedules work via a timed callback."""
+    """A scheduler that schedules work via a timed callback.
+
+    All instances share a single daemon timer thread which keeps pending
+    items in a priority queue ordered by due time, instead of starting an
+    OS thread per scheduled action. The timer thread only waits; due
+    actions are handed to a shared pool of worker threads, which is grown
+    whenever no worker is idle, up to the number of processors plus four
+    like a ThreadPoolExecutor, so actions run concurrently and a blocking
+    action does not hold up other timers. Once the pool is full, due
+    actions wait for a worker. Workers that stay idle for a while exit. Cancelled items are discarded once they reach the
+    head of the queue, or in bulk when they make up a large part of it.
+
+    The queue holds due times as monotonic float seconds whatever the
+    clock mode of the scheduler that scheduled them, so instances with
+    different clock modes can share it.
+    """
+
+    _condition = threading.Condition(threading.Lock())
+    _queue: PriorityQueue[ScheduledItem[typing.TState]] = PriorityQueue(ScheduledItem.is_cancelled)
+    _thread: Optional[threading.Thread] = None
+
+    _worker_condition = threading.Condition(threading.Lock())
+    _ready: Deque[ScheduledItem[typing.TState]] = deque()
+    _idle = 0
+    _workers = 0
+    _max_workers = min(32, (os.cpu_count() or 1) + 4)
+    _keep_alive = 10.0
 
     def schedule(self,
                  action: typing.ScheduledAction,
@@ -25,19 +61,9 @@ class TimeoutScheduler(PeriodicScheduler):
             (best effort).
         """
 
-        sad = SingleAssignmentDisposable()
-
-        def interval() -> None:
-            sad.disposable = self.invoke_action(action, state)
-
-        timer = Timer(0, interval)
-        timer.setDaemon(True)
-        timer.start()
-
-        def dispose() -> None:
-            timer.cancel()
-
-        return CompositeDisposable(sad, Disposable(dispose))
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, monotonic_now())
+        TimeoutScheduler._dispatch(si)
+        return si.disposable
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -56,23 +82,7 @@ class TimeoutScheduler(PeriodicScheduler):
             (best effort).
         """
 
-        seconds = self.to_seconds(duetime)
-        if seconds <= 0.0:
-            return self.schedule(action, state)
-
-        sad = SingleAssignmentDisposable()
-
-        def interval() -> None:
-            sad.disposable = self.invoke_action(action, state)
-
-        timer = Timer(seconds, interval)
-        timer.setDaemon(True)
-        timer.start()
-
-        def dispose() -> None:
-            timer.cancel()
-
-        return CompositeDisposable(sad, Disposable(dispose))
+        return self._schedule_at(monotonic_now() + max(0.0, self.to_seconds(duetime)), action, state)
 
     def schedule_absolute(self,
                           duetime: typing.AbsoluteTime,
@@ -91,8 +101,106 @@ class TimeoutScheduler(PeriodicScheduler):
             (best effort).
         """
 
-        duetime = self.to_datetime(duetime)
-        return self.schedule_relative(duetime - self.now, action, state)
+        seconds = self.to_seconds(self._internal_time(duetime) - self._internal_now())
+        return self._schedule_at(monotonic_now() + seconds, action, state)
+
+    def _schedule_at(self,
+                     duetime: float,
+                     action: typing.ScheduledAction,
+                     state: Optional[typing.TState] = None
+                     ) -> typing.Disposable:
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, duetime)
+
+        cls = TimeoutScheduler
+        with cls._condition:
+            queue = cls._queue
+            notify = not queue or si < queue.peek()
+            queue.enqueue(si)
+            if notify:
+                cls._condition.notify()
+            if cls._thread is None:
+                cls._thread = default_thread_factory(cls._run)
+                cls._thread.start()
+
+        def dispose() -> None:
+            si.cancel()
+            with cls._condition:
+                cls._queue.mark_cancelled(si)
+
+        return Disposable(dispose)
+
+    @classmethod
+    def _run(cls) -> None:
+        """Timer loop running on the shared daemon thread. Sleeps until
+        the earliest pending item is due, or until an earlier item is
+        enqueued."""
+
+        condition = cls._condition
+        queue = cls._queue
+
+        while True:
+            with condition:
+                while True:
+                    while queue and queue.peek().is_cancelled():
+                        queue.dequeue()
+
+                    if not queue:
+                        condition.wait()
+                        continue
+
+                    item = queue.peek()
+                    seconds = item.duetime - monotonic_now()
+                    if seconds <= 0:
+                        queue.dequeue()
+                        break
+
+                    condition.wait(seconds)
+
+            if not item.is_cancelled():
+                cls._dispatch(item)
+
+    @classmethod
+    def _dispatch(cls, item: ScheduledItem[typing.TState]) -> None:
+        """Hands a due item to an idle worker, or to a new worker if
+        there are not enough idle ones and the pool is not full. The
+        item otherwise waits for the next worker to finish."""
+
+        with cls._worker_condition:
+            cls._ready.append(item)
+            # Woken workers count as idle until they have taken an item.
+            if cls._idle >= len(cls._ready):
+                cls._worker_condition.notify()
+            elif cls._workers < cls._max_workers:
+                cls._workers += 1
+                default_thread_factory(cls._work).start()
+
+    @classmethod
+    def _work(cls) -> None:
+        """Worker loop. Runs due items until none has come in for the
+        keep alive period."""
+
+        condition = cls._worker_condition
+        ready = cls._ready
+
+        while True:
+            with condition:
+                if not ready:
+                    cls._idle += 1
+                    try:
+                        if not condition.wait_for(lambda: ready, cls._keep_alive):
+                            cls._workers -= 1
+                            return
+                    finally:
+                        cls._idle -= 1
+                item = ready.popleft()
+
+            if item.is_cancelled():
+                continue
+
+            try:
+                item.invoke()
+            except Exception:  # pylint: disable=broad-except
+                log.exception("TimeoutScheduler:action failed")
 
 
 timeout_scheduler = TimeoutScheduler()
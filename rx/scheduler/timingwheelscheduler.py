@@ -0,0 +1,310 @@
+import logging
+import math
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Union
+
+from rx.core import typing
+from rx.disposable import Disposable
+from rx.internal.concurrency import default_thread_factory
+from rx.internal.exceptions import DisposedException
+
+from .periodicscheduler import PeriodicScheduler
+from .scheduleditem import ScheduledItem
+
+
+log = logging.getLogger('Rx')
+
+
+class _WheelItem(ScheduledItem[typing.TState]):  # pylint: disable=unsubscriptable-object
+    """Scheduled item which remembers its due tick and the wheel slot it
+    currently lives in, so it can be unlinked in constant time."""
+
+    __slots__ = ('tick', 'slot')
+
+    def __init__(self,
+                 scheduler: 'TimingWheelScheduler',
+                 state: Optional[typing.TState],
+                 action: typing.ScheduledAction,
+                 duetime: Union[datetime, float],
+                 tick: int
+                 ) -> None:
+        super().__init__(scheduler, state, action, duetime)
+        self.tick = tick
+        self.slot: Optional[Dict[int, '_WheelItem']] = None
+
+
+class TimingWheelScheduler(PeriodicScheduler, typing.Disposable):
+    """A scheduler that keeps pending work in a hierarchical timing wheel
+    serviced by a designated thread.
+
+    Time is divided into ticks of the given resolution. Each level of the
+    wheel has wheel_size slots, and every slot of a level spans a full
+    revolution of the level below it. Items are inserted into and removed
+    from their slot in O(1), and all items of a slot are expired together
+    once their tick has passed. Items are never run before their due
+    time, but may run up to one tick late.
+
+    This is well suited for large numbers of timeouts that are mostly
+    cancelled before they are due, such as those created by timeout,
+    debounce and group_by_until.
+    """
+
+    def __init__(self,
+                 resolution: typing.RelativeTime = 0.01,
+                 wheel_size: int = 256,
+                 levels: int = 4,
+                 thread_factory: Optional[typing.StartableFactory] = None
+                 ) -> None:
+        """Creates a timing wheel scheduler.
+
+        Args:
+            resolution: [Optional] Duration of one tick, in seconds or as
+                a timedelta. Defaults to 10 milliseconds.
+            wheel_size: [Optional] Number of slots per wheel level.
+            levels: [Optional] Number of wheel levels. Items further in
+                the future than wheel_size ** levels ticks are kept in
+                an overflow slot until they come in range.
+            thread_factory: [Optional] Factory used to create the thread
+                servicing the wheel.
+        """
+
+        super().__init__()
+
+        resolution = self.to_seconds(resolution)
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+        if wheel_size < 2:
+            raise ValueError("wheel_size must be at least 2")
+        if levels < 1:
+            raise ValueError("levels must be at least 1")
+
+        self._resolution: float = resolution
+        self._wheel_size = wheel_size
+        self._levels = levels
+        self._wheels: List[List[Dict[int, _WheelItem]]] = [
+            [{} for _ in range(wheel_size)] for _ in range(levels)]
+        self._overflow: Dict[int, _WheelItem] = {}
+        self._ready: Deque[_WheelItem] = deque()
+        self._count = 0
+        self._tick = self._to_tick(self._internal_now(), math.floor)
+
+        self._is_disposed = False
+        self._thread_factory = thread_factory or default_thread_factory
+        self._thread: Optional[threading.Thread] = None
+        self._condition = threading.Condition(threading.Lock())
+
+    def schedule(self,
+                 action: typing.ScheduledAction,
+                 state: Optional[typing.TState] = None
+                 ) -> typing.Disposable:
+        """Schedules an action to be executed.
+
+        Args:
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        return self.schedule_absolute(self._internal_now(), action, state=state)
+
+    def schedule_relative(self,
+                          duetime: typing.RelativeTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed after duetime.
+
+        Args:
+            duetime: Relative time after which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        return self.schedule_absolute(self._internal_due(duetime), action, state=state)
+
+    def schedule_absolute(self,
+                          duetime: typing.AbsoluteTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed at duetime.
+
+        Args:
+            duetime: Absolute time at which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        if self._is_disposed:
+            raise DisposedException()
+
+        dt = self._internal_time(duetime)
+        si: _WheelItem[typing.TState] = _WheelItem(self, state, action, dt, self._to_tick(dt, math.ceil))
+
+        with self._condition:
+            self._insert(si)
+            self._count += 1
+            self._condition.notify()
+            self._ensure_thread()
+
+        def dispose() -> None:
+            with self._condition:
+                slot = si.slot
+                if slot is not None:
+                    del slot[id(si)]
+                    si.slot = None
+                    self._count -= 1
+            si.cancel()
+
+        return Disposable(dispose)
+
+    def schedule_periodic(self,
+                          period: typing.RelativeTime,
+                          action: typing.ScheduledPeriodicAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules a periodic piece of work.
+
+        Args:
+            period: Period in seconds or timedelta for running the
+                work periodically.
+            action: Action to be executed.
+            state: [Optional] Initial state passed to the action upon
+                the first iteration.
+
+        Returns:
+            The disposable object used to cancel the scheduled
+            recurring action (best effort).
+        """
+
+        if self._is_disposed:
+            raise DisposedException()
+
+        return super().schedule_periodic(period, action, state=state)
+
+    def _to_tick(self, value: Union[datetime, float], rounding) -> int:
+        return int(rounding(self.to_seconds(value) / self._resolution))
+
+    def _insert(self, item: _WheelItem) -> None:
+        """Links the item into the slot matching its distance from the
+        current tick. Should be called under the gate."""
+
+        delta = item.tick - self._tick
+        if delta <= 0:
+            slot = None
+            self._ready.append(item)
+        else:
+            size = self._wheel_size
+            span = size
+            for level in range(self._levels):
+                if delta < span:
+                    slot = self._wheels[level][(item.tick * size // span) % size]
+                    break
+                span *= size
+            else:
+                slot = self._overflow
+
+            slot[id(item)] = item
+        item.slot = slot
+
+    def _unlink(self, slot: Dict[int, _WheelItem]) -> List[_WheelItem]:
+        items = list(slot.values())
+        slot.clear()
+        for item in items:
+            item.slot = None
+        return items
+
+    def _advance(self, tick: int) -> None:
+        """Moves the wheel forward to the given tick, cascading items from
+        the outer levels and collecting all expired items in the ready
+        queue. Should be called under the gate."""
+
+        if not self._count:
+            self._tick = max(self._tick, tick)
+            return
+
+        size = self._wheel_size
+        while self._tick < tick:
+            self._tick += 1
+            current = self._tick
+
+            # Cascade outer levels down whenever the level below wraps.
+            level = 1
+            index = current
+            while level < self._levels and index % size == 0:
+                index //= size
+                for item in self._unlink(self._wheels[level][index % size]):
+                    self._insert(item)
+                level += 1
+            if level == self._levels and index % size == 0:
+                for item in self._unlink(self._overflow):
+                    self._insert(item)
+
+            slot = self._wheels[0][current % size]
+            if slot:
+                self._ready.extend(self._unlink(slot))
+
+    def _ensure_thread(self) -> None:
+        """Ensures there is a thread servicing the wheel. Should be
+        called under the gate."""
+
+        if not self._thread:
+            thread = self._thread_factory(self.run)
+            self._thread = thread
+            thread.start()
+
+    def run(self) -> None:
+        """Loop running on the designated thread. Expires due items tick
+        by tick and sleeps until the next tick while items are pending."""
+
+        ready: Deque[_WheelItem] = deque()
+
+        while True:
+            with self._condition:
+                if self._is_disposed:
+                    return
+
+                self._advance(self._to_tick(self._internal_now(), math.floor))
+                ready, self._ready = self._ready, ready
+                self._count -= len(ready)
+
+                if not ready:
+                    if self._count:
+                        seconds = (self._tick + 1) * self._resolution - self.to_seconds(self._internal_now())
+                        self._condition.wait(max(0.0, seconds))
+                    else:
+                        self._condition.wait()
+                    continue
+
+            while ready:
+                item = ready.popleft()
+                if item.is_cancelled():
+                    continue
+
+                try:
+                    item.invoke()
+                except Exception:  # pylint: disable=broad-except
+                    log.exception("TimingWheelScheduler:action failed")
+
+    def dispose(self) -> None:
+        """Ends the thread associated with this scheduler. All
+        remaining work in the scheduler wheel is abandoned.
+        """
+
+        with self._condition:
+            if not self._is_disposed:
+                self._is_disposed = True
+                self._condition.notify()
@@ -6,6 +6,7 @@ from typing import Optional
 
 from rx.internal import PriorityQueue, ArgumentOutOfRangeException
 from rx.core import typing
+from rx.disposable import Disposable
 
 from .periodicscheduler import PeriodicScheduler
 from .scheduleditem import ScheduledItem
@@ -19,6 +20,8 @@ class VirtualTimeScheduler(PeriodicScheduler):
     """Virtual Scheduler. This scheduler should work with either
     datetime/timespan or ticks as int/int"""
 
+    monotonic_clock = False  # Virtual time is never taken from the system clock
+
     def __init__(self, initial_clock=0.0) -> None:
         """Creates a new virtual time scheduler with the specified
         initial clock value.
@@ -31,7 +34,7 @@ class VirtualTimeScheduler(PeriodicScheduler):
         self._clock = initial_clock
         self._is_enabled = False
         self._lock: threading.Lock = threading.Lock()
-        self._queue: PriorityQueue[ScheduledItem[typing.TState]] = PriorityQueue()
+        self._queue: PriorityQueue[ScheduledItem[typing.TState]] = PriorityQueue(ScheduledItem.is_cancelled)
 
     def _get_clock(self):
         with self._lock:
@@ -108,7 +111,13 @@ class VirtualTimeScheduler(PeriodicScheduler):
         si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, duetime)
         with self._lock:
             self._queue.enqueue(si)
-        return si.disposable
+
+        def dispose() -> None:
+            si.cancel()
+            with self._lock:
+                self._queue.mark_cancelled(si)
+
+        return Disposable(dispose)
 
     def start(self) -> None:
         """Starts the virtual time scheduler."""
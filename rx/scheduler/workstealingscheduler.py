@@ -0,0 +1,298 @@
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, Optional, Union
+
+from rx.core import typing
+from rx.disposable import Disposable
+from rx.internal.concurrency import default_thread_factory
+from rx.internal.exceptions import DisposedException
+from rx.internal.priorityqueue import PriorityQueue
+
+from .periodicscheduler import PeriodicScheduler
+from .scheduleditem import ScheduledItem
+
+
+log = logging.getLogger('Rx')
+
+
+class WorkStealingScheduler(PeriodicScheduler, typing.Disposable):
+    """A scheduler that runs work on a pool of worker threads, each with
+    its own queue, which steal work from each other when they run out.
+
+    Actions scheduled from a worker thread go to the queue of that
+    worker; actions scheduled from any other thread go to a shared queue.
+    A worker takes work from its own queue first, then from the shared
+    queue, and finally steals from the opposite end of the queues of the
+    other workers. Workers are started on demand, up to max_workers, and
+    park while there is no work at all.
+
+    Timed actions wait in a single timer queue shared by all workers, and
+    are moved to the shared queue once due. Idle workers wait for the
+    earliest due time instead of sleeping on behalf of one action, so
+    delays and periodic actions never occupy a worker until they run.
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 thread_factory: Optional[typing.StartableFactory] = None
+                 ) -> None:
+        """Creates a work stealing scheduler.
+
+        Args:
+            max_workers: [Optional] Maximum number of worker threads.
+                Defaults to the number of processors plus four, at
+                most 32, like a ThreadPoolExecutor.
+            thread_factory: [Optional] Factory used to create the
+                worker threads.
+        """
+
+        super().__init__()
+
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        elif max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        self._max_workers = max_workers
+        self._thread_factory = thread_factory or default_thread_factory
+        self._condition = threading.Condition(threading.Lock())
+        self._local = threading.local()
+        self._queues: List[Deque[ScheduledItem]] = []
+        self._shared: Deque[ScheduledItem] = deque()
+        self._timers: PriorityQueue[ScheduledItem[typing.TState]] = PriorityQueue(ScheduledItem.is_cancelled)
+        self._next_due: Optional[Union[datetime, float]] = None
+        self._idle = 0
+        self._is_disposed = False
+
+    def schedule(self,
+                 action: typing.ScheduledAction,
+                 state: Optional[typing.TState] = None
+                 ) -> typing.Disposable:
+        """Schedules an action to be executed.
+
+        Args:
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        if self._is_disposed:
+            raise DisposedException()
+
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, self._internal_now())
+        queue = getattr(self._local, 'queue', None)
+        if queue is None:
+            queue = self._shared
+        queue.append(si)
+        self._wake()
+        return si.disposable
+
+    def schedule_relative(self,
+                          duetime: typing.RelativeTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed after duetime.
+
+        Args:
+            duetime: Relative time after which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        if self.to_seconds(duetime) <= 0:
+            return self.schedule(action, state=state)
+        return self._schedule_at(self._internal_due(duetime), action, state)
+
+    def schedule_absolute(self,
+                          duetime: typing.AbsoluteTime,
+                          action: typing.ScheduledAction,
+                          state: Optional[typing.TState] = None
+                          ) -> typing.Disposable:
+        """Schedules an action to be executed at duetime.
+
+        Args:
+            duetime: Absolute time at which to execute the action.
+            action: Action to be executed.
+            state: [Optional] state to be given to the action function.
+
+        Returns:
+            The disposable object used to cancel the scheduled action
+            (best effort).
+        """
+
+        return self._schedule_at(self._internal_time(duetime), action, state)
+
+    def _schedule_at(self,
+                     duetime: Union[datetime, float],
+                     action: typing.ScheduledAction,
+                     state: Optional[typing.TState] = None
+                     ) -> typing.Disposable:
+        if self._is_disposed:
+            raise DisposedException()
+
+        si: ScheduledItem[typing.TState] = ScheduledItem(self, state, action, duetime)
+
+        with self._condition:
+            timers = self._timers
+            earliest = not timers or si < timers.peek()
+            timers.enqueue(si)
+            if earliest:
+                self._next_due = duetime
+                # A worker has to wait for the new due time instead, and
+                # busy workers might not look at the timers in time.
+                self._wake_workers(1)
+
+        def dispose() -> None:
+            si.cancel()
+            with self._condition:
+                self._timers.mark_cancelled(si)
+
+        return Disposable(dispose)
+
+    def _wake(self) -> None:
+        """Wakes an idle worker for newly queued work, or starts a new
+        one if none is idle and the pool is not full yet."""
+
+        # Workers count themselves idle before their last look at the
+        # queues, so if none is idle here, the item will be found.
+        if self._idle or len(self._queues) < self._max_workers:
+            with self._condition:
+                self._wake_workers(1)
+
+    def _wake_workers(self, count: int) -> None:
+        """Wakes up to count idle workers, and starts new ones for the
+        rest while the pool is not full yet. Should be called under the
+        gate."""
+
+        woken = min(count, self._idle)
+        if woken:
+            self._condition.notify(woken)
+        for _ in range(count - woken):
+            if len(self._queues) >= self._max_workers or self._is_disposed:
+                break
+            self._start_worker()
+
+    def _start_worker(self) -> None:
+        """Starts a worker thread. Should be called under the gate."""
+
+        queue: Deque[ScheduledItem] = deque()
+        self._queues.append(queue)
+        thread = self._thread_factory(lambda: self._run(queue))
+        thread.start()
+
+    def _release_timers(self) -> Optional[float]:
+        """Moves due timed items to the shared queue. Should be called
+        under the gate.
+
+        Returns:
+            Seconds until the next timed item is due, or None if there
+            are no timed items left.
+        """
+
+        timers = self._timers
+        if not timers:
+            return None
+
+        now = self._internal_now()
+        released = 0
+        seconds = None
+        while timers:
+            item = timers.peek()
+            if item.is_cancelled():
+                timers.dequeue()
+            elif item.duetime <= now:
+                self._shared.append(timers.dequeue())
+                released += 1
+            else:
+                seconds = self.to_seconds(item.duetime - now)
+                break
+
+        self._next_due = timers.peek().duetime if timers else None
+        # The caller takes one of the released items itself.
+        if released > 1:
+            self._wake_workers(released - 1)
+        return seconds
+
+    def _next(self, queue: Deque[ScheduledItem]) -> Optional[ScheduledItem]:
+        """Takes the next item for the worker owning the given queue: from
+        its own queue, then from the shared queue, and otherwise stolen
+        from the other end of another worker's queue."""
+
+        try:
+            return queue.popleft()
+        except IndexError:
+            pass
+        try:
+            return self._shared.popleft()
+        except IndexError:
+            pass
+        for other in self._queues:
+            if other is not queue:
+                try:
+                    return other.pop()
+                except IndexError:
+                    pass
+        return None
+
+    def _run(self, queue: Deque[ScheduledItem]) -> None:
+        """Loop running on each worker thread."""
+
+        self._local.queue = queue
+        condition = self._condition
+
+        while True:
+            due = self._next_due
+            if due is not None and due <= self._internal_now():
+                with condition:
+                    self._release_timers()
+
+            item = self._next(queue)
+            if item is None:
+                with condition:
+                    if self._is_disposed:
+                        return
+
+                    timeout = self._release_timers()
+                    self._idle += 1
+                    try:
+                        item = self._next(queue)
+                        if item is None:
+                            condition.wait(timeout)
+                    finally:
+                        self._idle -= 1
+                if item is None:
+                    continue
+
+            if item.is_cancelled():
+                continue
+
+            try:
+                item.invoke()
+            except Exception:  # pylint: disable=broad-except
+                log.exception("WorkStealingScheduler:action failed")
+
+    def dispose(self) -> None:
+        """Ends the worker threads of this scheduler once they finish the
+        action they are running. All remaining work is abandoned.
+        """
+
+        with self._condition:
+            if not self._is_disposed:
+                self._is_disposed = True
+                self._shared.clear()
+                for queue in self._queues:
+                    queue.clear()
+                self._timers.clear()
+                self._next_due = None
+                self._condition.notify_all()
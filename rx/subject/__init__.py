@@ -2,3 +2,4 @@ from .subject import Subject
 from .asyncsubject import AsyncSubject
 from .behaviorsubject import BehaviorSubject
 from .replaysubject import ReplaySubject
+from .asyncstream import AsyncStream
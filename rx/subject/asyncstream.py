@@ -0,0 +1,97 @@
+from typing import Any, List, Optional
+
+from rx.core import typing, abc
+from rx.core.observable.asyncobservable import AsyncObservable
+from rx.core.observer.asyncobserver import AsyncObserver
+from rx.disposable import Disposable
+from rx.internal import DisposedException
+
+
+class AsyncStream(AsyncObservable, AsyncObserver):
+    """Represents an object that is both an asynchronous observable
+    sequence as well as an asynchronous observer. Each notification is
+    awaited by every subscribed observer in turn, so the producer is
+    held back by the slowest observer.
+
+    Subscribing after the stream has terminated replays the terminal
+    notification.
+    """
+
+    def __init__(self) -> None:
+        AsyncObservable.__init__(self)
+        AsyncObserver.__init__(self)
+
+        self.is_disposed = False
+        self.observers: List[abc.AsyncObserver] = []
+        self.exception: Optional[Exception] = None
+
+    def check_disposed(self) -> None:
+        if self.is_disposed:
+            raise DisposedException()
+
+    async def _subscribe_async_core(self, observer: abc.AsyncObserver) -> typing.Disposable:
+        self.check_disposed()
+        if self.is_stopped:
+            if self.exception is not None:
+                await observer.on_error_async(self.exception)
+            else:
+                await observer.on_completed_async()
+            return Disposable()
+
+        self.observers.append(observer)
+
+        def dispose() -> None:
+            if observer in self.observers:
+                self.observers.remove(observer)
+
+        return Disposable(dispose)
+
+    async def on_next_async(self, value: Any) -> None:
+        """Notifies all subscribed observers with the value, awaiting
+        each of them.
+
+        Args:
+            value: The value to send to all subscribed observers.
+        """
+
+        self.check_disposed()
+        await super().on_next_async(value)
+
+    async def _on_next_async_core(self, value: Any) -> None:
+        for observer in list(self.observers):
+            await observer.on_next_async(value)
+
+    async def on_error_async(self, error: Exception) -> None:
+        """Notifies all subscribed observers with the exception.
+
+        Args:
+            error: The exception to send to all subscribed observers.
+        """
+
+        self.check_disposed()
+        await super().on_error_async(error)
+
+    async def _on_error_async_core(self, error: Exception) -> None:
+        observers, self.observers = self.observers, []
+        self.exception = error
+        for observer in observers:
+            await observer.on_error_async(error)
+
+    async def on_completed_async(self) -> None:
+        """Notifies all subscribed observers of the end of the
+        sequence."""
+
+        self.check_disposed()
+        await super().on_completed_async()
+
+    async def _on_completed_async_core(self) -> None:
+        observers, self.observers = self.observers, []
+        for observer in observers:
+            await observer.on_completed_async()
+
+    def dispose(self) -> None:
+        """Unsubscribe all observers and release resources."""
+
+        self.is_disposed = True
+        self.observers = []
+        self.exception = None
@@ -58,7 +58,7 @@ setup(
               'rx.core.operators', 'rx.core.operators.connectable',
               'rx.core.observable', 'rx.core.observer',
               'rx.scheduler', 'rx.scheduler.eventloop', 'rx.scheduler.mainloop',
-              'rx.operators', 'rx.disposable', 'rx.subject',
+              'rx.operators', 'rx.disposable', 'rx.subject', 'rx.aio',
               'rx.testing'],
     package_dir={'rx': 'rx'},
     include_package_data=True
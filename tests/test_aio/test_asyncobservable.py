@@ -0,0 +1,162 @@
+import asyncio
+import unittest
+
+import rx
+import rx.aio
+from rx.aio import operators as ops
+from rx.core import AsyncObserver
+
+
+class RxException(Exception):
+    pass
+
+
+class TestAsyncObservable(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def collect(self, source, settle=None):
+        results = []
+        done = self.loop.create_future()
+
+        async def on_next_async(value):
+            results.append(value)
+
+        async def on_error_async(error):
+            results.append(error)
+            done.set_result(None)
+
+        async def on_completed_async():
+            results.append('completed')
+            done.set_result(None)
+
+        async def go():
+            await source.subscribe_async(on_next_async, on_error_async, on_completed_async)
+            await done
+
+        self.loop.run_until_complete(asyncio.wait_for(go(), 5))
+        return results
+
+    def test_from_iterable(self):
+        assert self.collect(rx.aio.from_iterable([1, 2, 3])) == [1, 2, 3, 'completed']
+
+    def test_range(self):
+        assert self.collect(rx.aio.range(1, 7, 2)) == [1, 3, 5, 'completed']
+
+    def test_empty(self):
+        assert self.collect(rx.aio.empty()) == ['completed']
+
+    def test_throw(self):
+        ex = RxException('ex')
+        assert self.collect(rx.aio.throw(ex)) == [ex]
+
+    def test_from_async_iterable_of_observable(self):
+        assert self.collect(rx.aio.from_async_iterable(rx.from_([1, 2]))) == [1, 2, 'completed']
+
+    def test_map_filter(self):
+        async def double(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        source = rx.aio.range(10).pipe(
+            ops.filter(lambda x: x % 3 == 0),
+            ops.map(double),
+        )
+        assert self.collect(source) == [0, 6, 12, 18, 'completed']
+
+    def test_map_error(self):
+        ex = RxException('ex')
+
+        def mapper(value):
+            if value == 2:
+                raise ex
+            return value
+
+        assert self.collect(rx.aio.range(5).pipe(ops.map(mapper))) == [0, 1, ex]
+
+    def test_flat_map(self):
+        source = rx.aio.from_([1, 2, 3]).pipe(ops.flat_map(lambda x: rx.aio.range(x)))
+        results = self.collect(source)
+        assert results[-1] == 'completed'
+        assert sorted(results[:-1]) == [0, 0, 0, 1, 1, 2]
+
+    def test_flat_map_inner_error(self):
+        ex = RxException('ex')
+        source = rx.aio.from_([1, 2]).pipe(ops.flat_map(lambda x: rx.aio.throw(ex)))
+        assert self.collect(source) == [ex]
+
+    def test_merge(self):
+        results = self.collect(rx.aio.merge(rx.aio.from_([1, 2]), rx.aio.from_([3, 4])))
+        assert results[-1] == 'completed'
+        assert sorted(results[:-1]) == [1, 2, 3, 4]
+
+        results = self.collect(rx.aio.from_([1]).pipe(ops.merge(rx.aio.from_([2]))))
+        assert sorted(results[:-1]) == [1, 2]
+
+    def test_merge_on_completed_awaits(self):
+        results = []
+
+        async def on_next_async(value):
+            results.append(value)
+
+        async def on_completed_async():
+            await asyncio.sleep(0.01)
+            results.append('completed')
+
+        async def go():
+            await rx.aio.merge(rx.aio.range(3), rx.aio.range(3)).subscribe_async(
+                on_next_async, None, on_completed_async)
+            while 'completed' not in results:
+                await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(asyncio.wait_for(go(), 5))
+        assert sorted(results[:-1]) == [0, 0, 1, 1, 2, 2]
+        assert results[-1] == 'completed'
+
+    def test_producer_awaits_observer(self):
+        pulled = []
+        handled = []
+
+        def numbers():
+            for x in range(5):
+                pulled.append(x)
+                yield x
+
+        class SlowObserver(AsyncObserver):
+            async def _on_next_async_core(self, value):
+                assert len(pulled) == len(handled) + 1
+                await asyncio.sleep(0.001)
+                handled.append(value)
+
+        async def go():
+            await rx.aio.from_iterable(numbers()).subscribe_async(SlowObserver())
+            while len(handled) < 5:
+                await asyncio.sleep(0.001)
+
+        self.loop.run_until_complete(asyncio.wait_for(go(), 5))
+        assert handled == [0, 1, 2, 3, 4]
+
+    def test_dispose_cancels_producer(self):
+        results = []
+
+        async def go():
+            async def on_next_async(value):
+                results.append(value)
+                await asyncio.sleep(0)
+
+            subscription = await rx.aio.range(1000).subscribe_async(on_next_async)
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            subscription.dispose()
+            count = len(results)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            return count
+
+        count = self.loop.run_until_complete(go())
+        assert 0 < count < 1000
+        assert len(results) == count
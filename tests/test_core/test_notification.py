@@ -361,3 +361,8 @@ def test_to_observable_on_error():
 
     res = scheduler.start(create)
     assert res.messages == [ReactiveTest.on_error(200, ex)]
+
+
+def test_notifications_are_slotted():
+    for notification in (OnNext(42), OnError(Exception()), OnCompleted()):
+        assert not hasattr(notification, '__dict__')
@@ -0,0 +1,49 @@
+import threading
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.core import Observable
+from rx.subject import Subject
+
+
+class TestObservableLock(unittest.TestCase):
+
+    def test_lock_created_lazily(self):
+        source = Observable()
+        assert '_lock' not in vars(source)
+
+        lock = source.lock
+        assert isinstance(lock, type(threading.RLock()))
+        assert source.lock is lock
+
+    def test_lock_not_created_by_pipeline(self):
+        source = rx.of(1, 2, 3).pipe(ops.map(lambda x: x * 2), ops.filter(lambda x: x > 2))
+        results = []
+        source.subscribe(results.append)
+        assert results == [4, 6]
+        assert '_lock' not in vars(source)
+
+    def test_lock_same_instance_across_threads(self):
+        source = Observable()
+        locks = []
+        barrier = threading.Barrier(8)
+
+        def get_lock():
+            barrier.wait()
+            locks.append(source.lock)
+
+        threads = [threading.Thread(target=get_lock) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(locks) == 8
+        assert all(lock is locks[0] for lock in locks)
+
+    def test_lock_assignable(self):
+        subject = Subject()
+        lock = threading.RLock()
+        subject.lock = lock
+        assert subject.lock is lock
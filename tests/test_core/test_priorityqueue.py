@@ -131,3 +131,99 @@ class TestPriorityQueue(unittest.TestCase):
         assert p.peek() == 41
         p.enqueue(43)
         assert p.peek() == 41
+
+    def test_priorityqueue_remove_identity(self):
+        """Remove the given item, not just one comparing equal to it"""
+
+        p = PriorityQueue()
+        first = TestItem(42, "first")
+        second = TestItem(42, "second")
+        p.enqueue(first)
+        p.enqueue(second)
+        p.enqueue(TestItem(41, "low"))
+
+        assert p.remove(second) is True
+        assert p.dequeue().label == "low"
+        assert p.dequeue() is first
+        assert len(p) == 0
+
+    def test_priorityqueue_remove_keeps_heap_order(self):
+        """Removing arbitrary items keeps the remaining items ordered"""
+
+        p = PriorityQueue()
+        items = [TestItem(n) for n in (17, 3, 42, 8, 25, 1, 30, 12, 5, 9)]
+        for item in items:
+            p.enqueue(item)
+        for item in items[::3]:
+            assert p.remove(item) is True
+
+        result = [p.dequeue().value for _ in range(len(p))]
+        assert result == sorted(item.value for item in items[1::3] + items[2::3])
+
+    def test_priorityqueue_compaction(self):
+        """Cancelled items are dropped once they exceed the threshold"""
+
+        cancelled = set()
+        p = PriorityQueue(lambda item: item.value in cancelled, compaction_threshold=0.5)
+        items = [TestItem(n) for n in range(100)]
+        for item in items:
+            p.enqueue(item)
+
+        for n in range(0, 100, 2):
+            cancelled.add(n)
+            p.mark_cancelled(items[n])
+        assert len(p) == 100
+
+        cancelled.add(1)
+        p.mark_cancelled(items[1])
+        assert len(p) == 49
+        assert [p.dequeue().value for _ in range(3)] == [3, 5, 7]
+
+    def test_priorityqueue_no_compaction_without_predicate(self):
+        p = PriorityQueue()
+        for n in range(100):
+            p.enqueue(n)
+        for n in range(100):
+            p.mark_cancelled(n)
+        assert len(p) == 100
+
+    def test_priorityqueue_mark_cancelled_dequeued(self):
+        """Items which already left the queue are not counted"""
+
+        cancelled = set()
+        p = PriorityQueue(lambda item: item.value in cancelled)
+        items = [TestItem(n) for n in range(100)]
+        for item in items:
+            p.enqueue(item)
+
+        for n in range(60):
+            assert p.dequeue() is items[n]
+            cancelled.add(n)
+            p.mark_cancelled(items[n])
+        assert p.cancelled == 0
+
+        p.mark_cancelled(TestItem(60))
+        assert p.cancelled == 0
+        p.mark_cancelled(items[60])
+        assert p.cancelled == 1
+
+    def test_priorityqueue_cancelled_leaving_queue(self):
+        """Counted items are discounted once they leave the queue"""
+
+        cancelled = set()
+        p = PriorityQueue(lambda item: item.value in cancelled)
+        items = [TestItem(n) for n in range(100)]
+        for item in items:
+            p.enqueue(item)
+
+        for n in range(10):
+            cancelled.add(n)
+            p.mark_cancelled(items[n])
+            p.mark_cancelled(items[n])
+        assert p.cancelled == 10
+
+        for n in range(5):
+            assert p.dequeue() is items[n]
+        assert p.remove(items[5])
+        assert p.cancelled == 4
+        assert len(p) == 94
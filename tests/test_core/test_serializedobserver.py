@@ -0,0 +1,163 @@
+import threading
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.core.observer import SerializedObserver
+from rx.scheduler import NewThreadScheduler
+from rx.subject import Subject
+
+
+class CheckingObserver:
+    def __init__(self):
+        self.values = []
+        self.completed = False
+        self.inside = 0
+        self.overlapped = False
+
+    def on_next(self, value):
+        self.inside += 1
+        if self.inside > 1:
+            self.overlapped = True
+        self.values.append(value)
+        self.inside -= 1
+
+    def on_error(self, error):
+        raise error
+
+    def on_completed(self):
+        self.completed = True
+
+
+class TestSerializedObserver(unittest.TestCase):
+
+    def test_serialized_observer_concurrent(self):
+        observer = CheckingObserver()
+        serialized = SerializedObserver(observer)
+
+        def produce(start):
+            for x in range(start, start + 1000):
+                serialized.on_next(x)
+
+        threads = [threading.Thread(target=produce, args=(i * 1000,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not observer.overlapped
+        assert sorted(observer.values) == list(range(8000))
+        for i in range(8):
+            values = [x for x in observer.values if i * 1000 <= x < (i + 1) * 1000]
+            assert values == list(range(i * 1000, (i + 1) * 1000))
+
+    def test_serialized_observer_reentrant(self):
+        results = []
+
+        class Observer:
+            def on_next(self, value):
+                results.append(('start', value))
+                if value == 1:
+                    serialized.on_next(2)
+                results.append(('end', value))
+
+        serialized = SerializedObserver(Observer())
+        serialized.on_next(1)
+        assert results == [('start', 1), ('end', 1), ('start', 2), ('end', 2)]
+
+    def test_serialized_observer_error_on_draining_thread(self):
+        entered = threading.Event()
+        release = threading.Event()
+        results = []
+        errors = []
+
+        class Observer:
+            def on_next(self, value):
+                if value == 'block':
+                    entered.set()
+                    release.wait(5)
+                elif value == 'fail':
+                    raise ValueError(value)
+                results.append(value)
+
+        serialized = SerializedObserver(Observer())
+
+        def produce():
+            try:
+                serialized.on_next('block')
+            except ValueError as err:
+                errors.append(err)
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        assert entered.wait(5)
+
+        # Queued for the blocked thread, so these return immediately
+        serialized.on_next('fail')
+        serialized.on_next('after')
+        release.set()
+        thread.join()
+
+        assert len(errors) == 1
+        assert results == ['block']
+
+        serialized.on_next('next')
+        assert results == ['block', 'after', 'next']
+
+    def test_serialized_observer_serialize_action(self):
+        results = []
+        serialized = SerializedObserver(CheckingObserver())
+        serialized.serialize(results.append, 42)
+        assert results == [42]
+
+    def test_merge_concurrent_sources(self):
+        results = []
+        done = threading.Event()
+        scheduler = NewThreadScheduler()
+
+        sources = [rx.range(i * 100, (i + 1) * 100, scheduler=scheduler) for i in range(5)]
+        rx.merge(*sources).subscribe_(results.append, None, done.set)
+        assert done.wait(10)
+        assert sorted(results) == list(range(500))
+
+    def test_merge_reentrant_ordering(self):
+        results = []
+        xs = Subject()
+        ys = Subject()
+
+        def on_next(value):
+            results.append(('start', value))
+            if value == 1:
+                ys.on_next(2)
+                xs.on_next(3)
+            results.append(('end', value))
+
+        rx.merge(xs, ys).subscribe_(on_next)
+        xs.on_next(1)
+        assert results == [('start', 1), ('end', 1), ('start', 2), ('end', 2), ('start', 3), ('end', 3)]
+
+    def test_combine_latest_reentrant_ordering(self):
+        results = []
+        xs = Subject()
+        ys = Subject()
+
+        def on_next(value):
+            results.append(('start', value))
+            if value == (1, 1):
+                ys.on_next(2)
+            results.append(('end', value))
+
+        rx.combine_latest(xs, ys).subscribe_(on_next)
+        xs.on_next(1)
+        ys.on_next(1)
+        assert results == [('start', (1, 1)), ('end', (1, 1)), ('start', (1, 2)), ('end', (1, 2))]
+
+    def test_merge_max_concurrent_concurrent_sources(self):
+        results = []
+        done = threading.Event()
+        scheduler = NewThreadScheduler()
+
+        sources = rx.from_([rx.range(i * 100, (i + 1) * 100, scheduler=scheduler) for i in range(5)])
+        sources.pipe(ops.merge(max_concurrent=2)).subscribe_(results.append, None, done.set)
+        assert done.wait(10)
+        assert sorted(results) == list(range(500))
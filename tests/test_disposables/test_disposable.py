@@ -186,6 +186,41 @@ def test_groupdisposable_clear():
     assert not disp3[0]
     assert g.length == 1
 
+def test_groupdisposable_dispose_in_insertion_order():
+    order = []
+    disposables = [Disposable(lambda i=i: order.append(i)) for i in range(5)]
+
+    g = CompositeDisposable(disposables)
+    g.remove(disposables[2])
+    g.add(disposables[2])
+    assert g.to_list() == [disposables[i] for i in (0, 1, 3, 4, 2)]
+
+    g.dispose()
+    assert order == [2, 0, 1, 3, 4]
+
+
+def test_groupdisposable_add_twice():
+    d = Disposable()
+    g = CompositeDisposable()
+    g.add(d)
+    g.add(d)
+    assert g.length == 1
+    assert g.remove(d)
+    assert not g.contains(d)
+
+
+def test_groupdisposable_remove_many():
+    disposables = [Disposable() for _ in range(100000)]
+    g = CompositeDisposable()
+    for d in disposables:
+        g.add(d)
+
+    for d in disposables:
+        assert g.remove(d)
+    assert not g.length
+    assert all(d.is_disposed for d in disposables)
+
+
 def test_mutabledisposable_ctor_prop():
     m = SerialDisposable()
     assert not m.disposable
@@ -288,3 +323,20 @@ def test_refcountdisposable_primarydisposesfirst():
     assert not d.is_disposed
     d2.dispose()
     assert d.is_disposed
+
+
+def test_disposables_are_slotted():
+    for disp in (Disposable(), SingleAssignmentDisposable(), SerialDisposable(),
+                 CompositeDisposable(), RefCountDisposable(Disposable())):
+        assert not hasattr(disp, '__dict__')
+
+
+def test_disposable_subclass_has_dict():
+    class TaggedDisposable(Disposable):
+        pass
+
+    d = TaggedDisposable()
+    d.tag = 'tag'
+    d.dispose()
+    assert d.is_disposed
+    assert d.tag == 'tag'
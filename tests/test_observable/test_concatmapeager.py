@@ -0,0 +1,93 @@
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestConcatMapEager(unittest.TestCase):
+
+    def test_concat_map_eager_ordered(self):
+        scheduler = TestScheduler()
+        ys = scheduler.create_cold_observable(on_next(50, 'a1'), on_next(60, 'a2'), on_completed(70))
+        zs = scheduler.create_cold_observable(on_next(10, 'b1'), on_next(20, 'b2'), on_completed(30))
+        xs = scheduler.create_hot_observable(on_next(210, ys), on_next(220, zs), on_completed(230))
+
+        results = scheduler.start(lambda: xs.pipe(ops.concat_map_eager(lambda x: x)))
+
+        assert results.messages == [
+            on_next(260, 'a1'), on_next(270, 'a2'), on_next(280, 'b1'), on_next(280, 'b2'), on_completed(280)]
+        # Both inner sequences run at the same time.
+        assert ys.subscriptions == [subscribe(210, 280)]
+        assert zs.subscriptions == [subscribe(220, 250)]
+
+    def test_concat_map_eager_max_concurrent(self):
+        scheduler = TestScheduler()
+        ys = scheduler.create_cold_observable(on_next(50, 'a1'), on_completed(70))
+        zs = scheduler.create_cold_observable(on_next(10, 'b1'), on_completed(30))
+        ws = scheduler.create_cold_observable(on_next(10, 'c1'), on_completed(20))
+        xs = scheduler.create_hot_observable(on_next(210, ys), on_next(220, zs), on_next(230, ws),
+                                             on_completed(240))
+
+        results = scheduler.start(lambda: xs.pipe(ops.concat_map_eager(lambda x: x, max_concurrent=2)))
+
+        assert results.messages == [
+            on_next(260, 'a1'), on_next(280, 'b1'), on_next(290, 'c1'), on_completed(300)]
+        assert ws.subscriptions == [subscribe(280, 300)]
+
+    def test_concat_map_eager_inner_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        ys = scheduler.create_cold_observable(on_next(50, 'a1'), on_completed(70))
+        zs = scheduler.create_cold_observable(on_next(10, 'b1'), on_error(20, ex))
+        xs = scheduler.create_hot_observable(on_next(210, ys), on_next(220, zs), on_completed(230))
+
+        results = scheduler.start(lambda: xs.pipe(ops.concat_map_eager(lambda x: x)))
+
+        assert results.messages == [on_error(240, ex)]
+        assert ys.subscriptions == [subscribe(210, 240)]
+
+    def test_concat_map_eager_mapper_throws(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_completed(230))
+
+        def mapper(x):
+            if x == 2:
+                raise Exception(ex)
+            return rx.of(x)
+
+        results = scheduler.start(lambda: xs.pipe(ops.concat_map_eager(mapper)))
+        assert results.messages[0] == on_next(210, 1)
+        assert results.messages[1].value.kind == 'E'
+
+    def test_concat_map_eager_dispose_releases_buffers(self):
+        scheduler = TestScheduler()
+        ys = scheduler.create_cold_observable(on_next(50, 'a1'), on_completed(500))
+        zs = scheduler.create_cold_observable(on_next(10, 'b1'), on_next(20, 'b2'))
+        xs = scheduler.create_hot_observable(on_next(210, ys), on_next(220, zs))
+
+        results = scheduler.start(lambda: xs.pipe(ops.concat_map_eager(lambda x: x)), disposed=300)
+
+        assert results.messages == [on_next(260, 'a1')]
+        assert ys.subscriptions == [subscribe(210, 300)]
+        assert zs.subscriptions == [subscribe(220, 300)]
+
+    def test_concat_map_eager_synchronous_inners(self):
+        results = []
+        rx.range(2000).pipe(
+            ops.concat_map_eager(lambda x: [x, x], max_concurrent=2)
+        ).subscribe_(results.append)
+        assert results == [x for x in range(2000) for _ in range(2)]
+
+    def test_concat_map_eager_invalid_max_concurrent(self):
+        with self.assertRaises(ValueError):
+            ops.concat_map_eager(lambda x: x, max_concurrent=0)
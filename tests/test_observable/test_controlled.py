@@ -0,0 +1,220 @@
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.core import IterableObservable
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class RxException(Exception):
+    pass
+
+
+class TestControlled(unittest.TestCase):
+
+    def test_controlled_sources_are_iterable(self):
+        assert isinstance(rx.from_iterable([1, 2]), IterableObservable)
+        assert isinstance(rx.range(3), IterableObservable)
+        assert isinstance(rx.generate(0, lambda x: x < 3, lambda x: x + 1), IterableObservable)
+        assert isinstance(rx.range(3).pipe(ops.map(str), ops.filter(bool), ops.buffer_with_count(2)),
+                          IterableObservable)
+
+    def test_controlled_pull_only_requested(self):
+        pulled = []
+
+        def iterable():
+            for n in range(100):
+                pulled.append(n)
+                yield n
+
+        source = rx.from_iterable(iterable()).pipe(ops.controlled())
+        results = []
+        source.subscribe(results.append)
+
+        assert results == []
+        source.request(3)
+        assert results == [0, 1, 2]
+        source.request(2)
+        assert results == [0, 1, 2, 3, 4]
+        # At most one element is read ahead of demand
+        assert pulled == list(range(6))
+
+    def test_controlled_pull_completes(self):
+        source = rx.range(0, 3).pipe(ops.controlled())
+        results = []
+        completed = []
+        source.subscribe(results.append, on_completed=lambda: completed.append(True))
+
+        source.request(2)
+        assert results == [0, 1]
+        assert completed == []
+
+        source.request(1)
+        assert results == [0, 1, 2]
+        assert completed == [True]
+
+    def test_controlled_pull_completes_exact_request(self):
+        pulled = []
+
+        def iterable():
+            for n in range(3):
+                pulled.append(n)
+                yield n
+
+        source = rx.from_iterable(iterable()).pipe(ops.controlled())
+        results = []
+        completed = []
+        source.subscribe(results.append, on_completed=lambda: completed.append(True))
+
+        source.request(3)
+        assert results == [0, 1, 2]
+        assert completed == [True]
+        assert pulled == [0, 1, 2]
+
+    def test_controlled_pull_sized_not_read_ahead(self):
+        pulled = []
+
+        class Iterator:
+            def __init__(self):
+                self.values = iter(range(5))
+
+            def __iter__(self):
+                return self
+
+            def __next__(self):
+                value = next(self.values)
+                pulled.append(value)
+                return value
+
+            def __length_hint__(self):
+                return 5 - len(pulled)
+
+        source = rx.from_iterable(Iterator()).pipe(ops.controlled())
+        results = []
+        completed = []
+        source.subscribe(results.append, on_completed=lambda: completed.append(True))
+
+        source.request(2)
+        assert pulled == [0, 1]
+        source.request(3)
+        assert results == [0, 1, 2, 3, 4]
+        assert pulled == [0, 1, 2, 3, 4]
+        assert completed == [True]
+
+    def test_controlled_pull_mapped_only_requested(self):
+        mapped = []
+
+        def mapper(x):
+            mapped.append(x)
+            return x * 10
+
+        source = rx.range(0, 100).pipe(ops.map(mapper), ops.controlled())
+        results = []
+        disposable = source.subscribe(results.append)
+
+        source.request(2)
+        disposable.dispose()
+        assert results == [0, 10]
+        # One element is mapped ahead to detect completion
+        assert mapped == [0, 1, 2]
+
+    def test_controlled_pull_error(self):
+        ex = RxException('ex')
+
+        def iterable():
+            yield 1
+            raise ex
+
+        source = rx.from_iterable(iterable()).pipe(ops.controlled())
+        results = []
+        errors = []
+        source.subscribe(results.append, errors.append)
+
+        source.request(5)
+        assert results == [1]
+        assert errors == [ex]
+
+    def test_controlled_request_from_observer(self):
+        source = rx.range(0, 1000).pipe(ops.controlled())
+        results = []
+
+        def on_next(value):
+            results.append(value)
+            source.request(1)
+
+        source.subscribe(on_next)
+        source.request(1)
+        assert results == list(range(1000))
+
+    def test_controlled_generate(self):
+        source = rx.generate(0, lambda x: x < 10, lambda x: x + 1).pipe(ops.controlled())
+        results = []
+        source.subscribe(results.append)
+
+        source.request(4)
+        assert results == [0, 1, 2, 3]
+
+    def test_controlled_propagates_demand_through_buffer(self):
+        pulled = []
+
+        def iterable():
+            n = 0
+            while True:
+                pulled.append(n)
+                yield n
+                n += 1
+
+        source = rx.from_iterable(iterable()).pipe(
+            ops.map(lambda x: x * 2),
+            ops.filter(lambda x: x % 3),
+            ops.buffer_with_count(2),
+            ops.controlled()
+        )
+        results = []
+        source.subscribe(results.append)
+
+        source.request(2)
+        assert results == [[2, 4], [8, 10]]
+        assert len(pulled) < 10
+
+    def test_controlled_dispose(self):
+        source = rx.range(0, 10).pipe(ops.controlled())
+        results = []
+        subscription = source.subscribe(results.append)
+
+        source.request(2)
+        subscription.dispose()
+        source.request(2)
+        assert results == [0, 1]
+
+    def test_controlled_buffered(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(220, 2),
+            on_next(230, 3),
+            on_next(240, 4),
+            on_completed(250)
+        )
+        controlled = xs.pipe(ops.controlled())
+
+        scheduler.schedule_absolute(225, lambda s, t: controlled.request(1))
+        scheduler.schedule_absolute(260, lambda s, t: controlled.request(5))
+
+        results = scheduler.start(lambda: controlled)
+        assert results.messages == [on_next(225, 1), on_next(260, 2), on_next(260, 3),
+                                    on_next(260, 4), on_completed(260)]
+        assert xs.subscriptions == [subscribe(200, 250)]
+
+    def test_controlled_request_negative(self):
+        source = rx.range(0, 10).pipe(ops.controlled())
+        with self.assertRaises(ValueError):
+            source.request(-1)
@@ -94,3 +94,57 @@ class TestDistinctUntilChanged(unittest.TestCase):
 
         assert results.messages == [on_next(280, 3), on_next(350, 1), on_error(380, ex)]
         assert xs.subscriptions == [subscribe(200, 380)]
+
+    def test_distinct_unhashable_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(280, [1]), on_next(300, [2]), on_next(350, [1]), on_completed(420))
+
+        def create():
+            return xs.pipe(ops.distinct())
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(280, [1]), on_next(300, [2]), on_completed(420)]
+
+    def test_distinct_comparer(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(280, 4), on_next(300, -4), on_next(350, 2), on_next(380, -2), on_completed(420))
+
+        def create():
+            return xs.pipe(ops.distinct(comparer=lambda x, y: abs(x) == abs(y)))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(280, 4), on_next(350, 2), on_completed(420)]
+
+    def test_distinct_max_keys_evicts_least_recent(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 1), on_next(240, 3),
+            on_next(250, 1), on_next(260, 2), on_completed(300))
+
+        def create():
+            return xs.pipe(ops.distinct(max_keys=2))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(210, 1), on_next(220, 2), on_next(240, 3),
+                                    on_next(260, 2), on_completed(300)]
+
+    def test_distinct_ttl_expires_keys(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(240, 1), on_next(290, 2),
+            on_next(300, 1), on_next(340, 1), on_completed(400))
+
+        def create():
+            return xs.pipe(ops.distinct(ttl=50.0))
+
+        results = scheduler.start(create)
+
+        assert results.messages == [on_next(210, 1), on_next(220, 2), on_next(290, 2),
+                                    on_next(300, 1), on_completed(400)]
+
+    def test_distinct_max_keys_invalid(self):
+        with self.assertRaises(ValueError):
+            ops.distinct(max_keys=0)
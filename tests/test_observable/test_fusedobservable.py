@@ -0,0 +1,106 @@
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.core.observable.fusedobservable import FusedObservable
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+
+
+class RxException(Exception):
+    pass
+
+
+class TestFusedObservable(unittest.TestCase):
+
+    def test_adjacent_operators_are_fused(self):
+        source = rx.never()
+        res = source.pipe(
+            ops.map(lambda x: x + 1),
+            ops.filter(lambda x: x % 2),
+            ops.pluck(0),
+            ops.do_action(print),
+        )
+
+        assert isinstance(res, FusedObservable)
+        assert res.source is source
+        assert len(res.stages) == 4
+
+    def test_fused_chain(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(220, 2), on_next(230, 3), on_next(240, 4), on_completed(250))
+        seen = []
+
+        def create():
+            return xs.pipe(
+                ops.map(lambda x: (x, x * 10)),
+                ops.filter(lambda t: t[0] % 2 == 0),
+                ops.do_action(seen.append),
+                ops.starmap(lambda x, y: x + y),
+            )
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(220, 22), on_next(240, 44), on_completed(250)]
+        assert seen == [(2, 20), (4, 40)]
+        assert xs.subscriptions == [subscribe(200, 250)]
+
+    def test_fused_mapper_error(self):
+        ex = RxException('ex')
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_next(230, 3), on_completed(250))
+        mapped = []
+
+        def mapper(x):
+            if x == 2:
+                raise ex
+            return x
+
+        def create():
+            return xs.pipe(ops.filter(lambda x: True), ops.map(mapper), ops.map(lambda x: mapped.append(x) or x))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_error(220, ex)]
+        assert mapped == [1]
+        assert xs.subscriptions == [subscribe(200, 220)]
+
+    def test_fused_do_action_error(self):
+        ex = RxException('ex')
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_completed(250))
+        mapped = []
+
+        def action(x):
+            if x == 2:
+                raise ex
+
+        def create():
+            return xs.pipe(ops.do_action(action), ops.map(lambda x: mapped.append(x) or x))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_error(220, ex)]
+        assert mapped == [1]
+
+    def test_fused_chain_on_iterable_can_be_pulled(self):
+        source = rx.range(10).pipe(ops.map(lambda x: x * 2), ops.filter(lambda x: x % 3 == 0)).pipe(
+            ops.controlled())
+        results = []
+        source.subscribe_(results.append)
+        source.request(2)
+        assert results == [0, 6]
+        source.request(10)
+        assert results == [0, 6, 12, 18]
+
+    def test_fused_observable_can_be_shared(self):
+        base = rx.of(1, 2, 3).pipe(ops.map(lambda x: x * 2))
+        left = base.pipe(ops.map(lambda x: x + 1))
+        right = base.pipe(ops.filter(lambda x: x > 2))
+
+        assert base.run() == 6
+        assert left.run() == 7
+        assert right.run() == 6
+        assert len(base.stages) == 1
@@ -2,6 +2,7 @@ import unittest
 
 import rx
 from rx import operators as ops
+from rx.scheduler import ImmediateScheduler
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -104,3 +105,40 @@ class TestGenerate(unittest.TestCase):
             on_next(200, 2),
             on_next(200, 3),
             on_completed(200)]
+
+    def test_generate_yield_every(self):
+        scheduler = TestScheduler()
+
+        def create():
+            return rx.merge(
+                rx.generate(0, lambda x: x < 3, lambda x: x + 1, yield_every=1),
+                rx.generate(10, lambda x: x < 13, lambda x: x + 1, yield_every=1)
+            )
+
+        results = scheduler.start(create)
+
+        assert results.messages == [
+            on_next(200, 0),
+            on_next(200, 10),
+            on_next(200, 1),
+            on_next(200, 11),
+            on_next(200, 2),
+            on_next(200, 12),
+            on_completed(200)]
+
+    def test_generate_stops_when_disposed(self):
+        emitted = []
+
+        rx.generate(0, lambda x: True, lambda x: x + 1).pipe(
+            ops.do_action(emitted.append),
+            ops.take(3)
+        ).subscribe()
+        assert emitted == [0, 1, 2]
+
+    def test_generate_immediate_scheduler_take(self):
+        results = []
+
+        rx.generate(0, lambda x: True, lambda x: x + 1).pipe(
+            ops.take(3)
+        ).subscribe(results.append, scheduler=ImmediateScheduler())
+        assert results == [0, 1, 2]
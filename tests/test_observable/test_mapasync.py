@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.scheduler.eventloop import AsyncIOScheduler, AsyncIOThreadSafeScheduler
+
+
+class RxException(Exception):
+    pass
+
+
+class TestMapAsync(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.running = 0
+        self.max_running = 0
+
+    def tearDown(self):
+        self.loop.close()
+
+    async def delayed(self, value):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.001 * (5 - value % 5))
+        finally:
+            self.running -= 1
+        return value * 10
+
+    def run_source(self, source, scheduler=None):
+        results = []
+        done = self.loop.create_future()
+
+        def on_error(error):
+            results.append(error)
+            done.set_result(None)
+
+        def on_completed():
+            done.set_result(None)
+
+        async def go():
+            source.subscribe_(results.append, on_error, on_completed, scheduler=scheduler)
+            await done
+
+        self.loop.run_until_complete(asyncio.wait_for(go(), 5))
+        return results
+
+    def test_map_async_ordered(self):
+        scheduler = AsyncIOScheduler(self.loop)
+        source = rx.range(10).pipe(ops.map_async(self.delayed, max_concurrency=3))
+        results = self.run_source(source, scheduler)
+        assert results == [x * 10 for x in range(10)]
+        assert self.max_running == 3
+
+    def test_map_async_unordered(self):
+        scheduler = AsyncIOScheduler(self.loop)
+        source = rx.range(5).pipe(ops.map_async(self.delayed, ordered=False))
+        results = self.run_source(source, scheduler)
+        assert results == [40, 30, 20, 10, 0]
+        assert self.max_running == 5
+
+    def test_map_async_error(self):
+        ex = RxException('ex')
+
+        async def mapper(value):
+            await asyncio.sleep(0)
+            if value == 2:
+                raise ex
+            return value
+
+        scheduler = AsyncIOScheduler(self.loop)
+        source = rx.range(5).pipe(ops.map_async(mapper, max_concurrency=1))
+        results = self.run_source(source, scheduler)
+        assert results == [0, 1, ex]
+
+    def test_map_async_not_awaitable(self):
+        def mapper(value):
+            if value == 2:
+                return value
+            return self.delayed(value)
+
+        scheduler = AsyncIOScheduler(self.loop)
+        source = rx.range(5).pipe(ops.map_async(mapper, max_concurrency=1))
+        results = self.run_source(source, scheduler)
+        assert results[:2] == [0, 10]
+        assert isinstance(results[2], TypeError)
+        assert len(results) == 3
+
+        source = rx.range(5).pipe(ops.map_async(lambda value: value))
+        results = self.run_source(source, scheduler)
+        assert len(results) == 1
+        assert isinstance(results[0], TypeError)
+
+    def test_map_async_dispose_cancels(self):
+        cancelled = []
+
+        async def mapper(value):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(value)
+                raise
+
+        async def go():
+            subscription = rx.range(3).pipe(ops.map_async(mapper)).subscribe(
+                scheduler=AsyncIOScheduler(self.loop))
+            await asyncio.sleep(0.01)
+            subscription.dispose()
+            await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(go())
+        assert sorted(cancelled) == [0, 1, 2]
+
+    def test_map_async_threadsafe(self):
+        scheduler = AsyncIOThreadSafeScheduler(self.loop)
+        source = rx.range(10).pipe(ops.map_async(self.delayed, max_concurrency=2, scheduler=scheduler))
+
+        results = []
+        done = threading.Event()
+
+        def produce():
+            source.subscribe_(results.append, None, done.set)
+
+        async def go():
+            threading.Thread(target=produce).start()
+            while not done.is_set():
+                await asyncio.sleep(0.001)
+
+        self.loop.run_until_complete(asyncio.wait_for(go(), 5))
+        assert results == [x * 10 for x in range(10)]
+        assert self.max_running <= 2
+
+    def test_map_async_invalid_max_concurrency(self):
+        with self.assertRaises(ValueError):
+            ops.map_async(self.delayed, max_concurrency=0)
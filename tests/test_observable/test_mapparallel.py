@@ -0,0 +1,124 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import rx
+from rx import operators as ops
+
+
+class RxException(Exception):
+    pass
+
+
+def square(value):
+    return value * value
+
+
+def slow_square(value):
+    time.sleep(0.001 * (value % 3))
+    return value * value
+
+
+def fail_on_five(value):
+    if value == 5:
+        raise RxException('ex')
+    return value
+
+
+class TestMapParallel(unittest.TestCase):
+
+    def run_source(self, source):
+        results = []
+        done = threading.Event()
+
+        def on_error(error):
+            results.append(error)
+            done.set()
+
+        source.subscribe_(results.append, on_error, done.set)
+        assert done.wait(10)
+        return results
+
+    def test_map_parallel_ordered(self):
+        with ThreadPoolExecutor(4) as executor:
+            source = rx.range(50).pipe(ops.map_parallel(slow_square, executor=executor, chunk_size=3))
+            assert self.run_source(source) == [x * x for x in range(50)]
+
+    def test_map_parallel_unordered(self):
+        with ThreadPoolExecutor(4) as executor:
+            source = rx.range(50).pipe(ops.map_parallel(slow_square, executor=executor, chunk_size=4,
+                                                        ordered=False))
+            assert sorted(self.run_source(source)) == [x * x for x in range(50)]
+
+    def test_map_parallel_chunks(self):
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, *args, **kwargs):
+                CountingExecutor.submitted += 1
+                return super().submit(*args, **kwargs)
+
+        with CountingExecutor(2) as executor:
+            source = rx.range(10).pipe(ops.map_parallel(square, executor=executor, chunk_size=4))
+            assert self.run_source(source) == [x * x for x in range(10)]
+        assert CountingExecutor.submitted == 3
+
+    def test_map_parallel_max_pending(self):
+        gate = threading.Event()
+        in_flight = []
+        emitted = []
+
+        def mapper(value):
+            gate.wait()
+            return value
+
+        def produce():
+            rx.range(20).pipe(
+                ops.do_action(lambda x: emitted.append(x)),
+                ops.map_parallel(mapper, executor=executor, max_pending=2)
+            ).subscribe_(in_flight.append, None, done.set)
+
+        done = threading.Event()
+        with ThreadPoolExecutor(4) as executor:
+            thread = threading.Thread(target=produce)
+            thread.start()
+            deadline = time.monotonic() + 10
+            while len(emitted) < 3 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            assert len(emitted) == 3  # Two in flight, one waiting for room
+            gate.set()
+            assert done.wait(10)
+            thread.join()
+        assert in_flight == list(range(20))
+
+    def test_map_parallel_error(self):
+        ex = RxException('ex')
+
+        def mapper(value):
+            if value == 5:
+                raise ex
+            return value
+
+        with ThreadPoolExecutor(2) as executor:
+            source = rx.range(10).pipe(ops.map_parallel(mapper, executor=executor, chunk_size=2))
+            results = self.run_source(source)
+        assert results[-1] is ex
+        assert results[:-1] == list(range(len(results) - 1))
+
+    def test_map_parallel_process_pool(self):
+        source = rx.range(20).pipe(ops.map_parallel(square, workers=2, chunk_size=5))
+        assert self.run_source(source) == [x * x for x in range(20)]
+
+    def test_map_parallel_process_pool_error(self):
+        source = rx.range(20).pipe(ops.map_parallel(fail_on_five, workers=2, chunk_size=2))
+        results = self.run_source(source)
+        assert isinstance(results[-1], RxException)
+
+    def test_map_parallel_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ops.map_parallel(square, chunk_size=0)
+        with self.assertRaises(ValueError):
+            ops.map_parallel(square, workers=0)
+        with self.assertRaises(ValueError):
+            ops.map_parallel(square, max_pending=0)
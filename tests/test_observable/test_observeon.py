@@ -1,8 +1,13 @@
+import threading
+import time
 import unittest
 
 import rx
 from rx import operators as ops
-from rx.scheduler import ImmediateScheduler
+from rx.core.observer import OverflowStats
+from rx.core.observer.scheduledobserver import DEFAULT_BUDGET
+from rx.internal import OverflowException
+from rx.scheduler import EventLoopScheduler, ImmediateScheduler
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -14,6 +19,18 @@ disposed = ReactiveTest.disposed
 created = ReactiveTest.created
 
 
+class CountingTestScheduler(TestScheduler):
+    __test__ = False
+
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def schedule(self, action, state=None):
+        self.count += 1
+        return super().schedule(action, state)
+
+
 class TestObserveOn(unittest.TestCase):
 
     def test_observe_on_normal(self):
@@ -94,3 +111,152 @@ class TestObserveOn(unittest.TestCase):
             scheduler=expected_subscribe_scheduler)
 
         assert expected_subscribe_scheduler == actual_subscribe_scheduler
+
+    def test_observe_on_drains_queue(self):
+        scheduler = CountingTestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(210, 2),
+            on_next(210, 3),
+            on_completed(210)
+        )
+
+        def create():
+            return xs.pipe(ops.observe_on(scheduler))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_next(210, 2), on_next(210, 3), on_completed(210)]
+        assert scheduler.count == 1
+
+    def test_observe_on_budget(self):
+        scheduler = CountingTestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(210, 2),
+            on_next(210, 3),
+            on_completed(210)
+        )
+
+        def create():
+            return xs.pipe(ops.observe_on(scheduler, budget=2))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(210, 1), on_next(210, 2), on_next(210, 3), on_completed(210)]
+        assert scheduler.count == 2
+
+    def test_observe_on_default_budget(self):
+        scheduler = CountingTestScheduler()
+        xs = scheduler.create_hot_observable(
+            [on_next(210, x) for x in range(DEFAULT_BUDGET * 2)] + [on_completed(210)]
+        )
+
+        def create():
+            return xs.pipe(ops.observe_on(scheduler))
+
+        results = scheduler.start(create)
+        values = [message.value.value for message in results.messages[:-1]]
+        assert values == list(range(DEFAULT_BUDGET * 2))
+        assert results.messages[-1].value.kind == 'C'
+        assert scheduler.count == 3
+
+    def test_observe_on_event_loop(self):
+        scheduler = EventLoopScheduler()
+        done = threading.Event()
+        result = []
+
+        rx.range(0, 10000).pipe(ops.observe_on(scheduler)).subscribe(
+            result.append, on_completed=done.set)
+
+        assert done.wait(5)
+        assert result == list(range(10000))
+        scheduler.dispose()
+
+    def _overflow(self, overflow):
+        scheduler = TestScheduler()
+        dropped = []
+        stats = OverflowStats()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(210, 2),
+            on_next(210, 3),
+            on_next(210, 4),
+            on_completed(220)
+        )
+
+        def create():
+            return xs.pipe(ops.observe_on(scheduler, capacity=2, overflow=overflow,
+                                          on_drop=dropped.append, stats=stats))
+
+        results = scheduler.start(create)
+        assert stats.dropped == len(dropped)
+        self.subscriptions = xs.subscriptions
+        return results.messages, dropped
+
+    def test_observe_on_overflow_drop_oldest(self):
+        messages, dropped = self._overflow('drop_oldest')
+        assert messages == [on_next(210, 3), on_next(210, 4), on_completed(220)]
+        assert dropped == [1, 2]
+
+    def test_observe_on_overflow_drop_newest(self):
+        messages, dropped = self._overflow('drop_newest')
+        assert messages == [on_next(210, 1), on_next(210, 2), on_completed(220)]
+        assert dropped == [3, 4]
+
+    def test_observe_on_overflow_latest_only(self):
+        messages, dropped = self._overflow('latest_only')
+        assert messages == [on_next(210, 4), on_completed(220)]
+        assert dropped == [1, 2, 3]
+
+    def test_observe_on_overflow_error(self):
+        messages, dropped = self._overflow('error')
+        assert len(messages) == 3
+        assert messages[:2] == [on_next(210, 1), on_next(210, 2)]
+        assert isinstance(messages[2].value.exception, OverflowException)
+        assert dropped == [3]
+        assert self.subscriptions == [subscribe(200, 210)]
+
+    def test_observe_on_overflow_stats_shared(self):
+        scheduler = TestScheduler()
+        stats = OverflowStats()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1),
+            on_next(210, 2),
+            on_next(210, 3),
+            on_completed(220)
+        )
+
+        def create():
+            return xs.pipe(
+                ops.observe_on(scheduler, capacity=1, stats=stats),
+                ops.merge(xs.pipe(ops.observe_on(scheduler, capacity=2, stats=stats)))
+            )
+
+        scheduler.start(create)
+        assert stats.dropped == 3
+
+    def test_observe_on_overflow_invalid(self):
+        with self.assertRaises(ValueError):
+            rx.of(1).pipe(ops.observe_on(ImmediateScheduler(), capacity=2, overflow='nope')).subscribe()
+
+    def test_observe_on_overflow_block_producer(self):
+        scheduler = EventLoopScheduler()
+        done = threading.Event()
+        result = []
+        ahead = []
+        dropped = []
+
+        def on_next(x):
+            time.sleep(0.0001)
+            result.append(x)
+
+        rx.range(0, 200).pipe(
+            ops.do_action(lambda x: ahead.append(x - len(result))),
+            ops.observe_on(scheduler, capacity=4, overflow='block_producer', on_drop=dropped.append)
+        ).subscribe(on_next, on_completed=done.set)
+
+        assert done.wait(5)
+        assert result == list(range(200))
+        assert dropped == []
+        # Queued values plus the one being forwarded
+        assert max(ahead) <= 5
+        scheduler.dispose()
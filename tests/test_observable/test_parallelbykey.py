@@ -0,0 +1,92 @@
+import threading
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.scheduler import EventLoopScheduler
+
+
+class RxException(Exception):
+    pass
+
+
+class TestParallelByKey(unittest.TestCase):
+
+    def run_source(self, source):
+        results = []
+        done = threading.Event()
+
+        def on_error(error):
+            results.append(error)
+            done.set()
+
+        source.subscribe_(results.append, on_error, done.set)
+        assert done.wait(10)
+        return results
+
+    def test_parallel_by_key_preserves_order_per_key(self):
+        values = [(x % 7, x) for x in range(500)]
+        source = rx.from_(values).pipe(
+            ops.parallel_by_key(lambda v: v[0], shards=4, pipeline=ops.map(lambda v: (v[0], v[1] * 2))))
+        results = self.run_source(source)
+
+        assert sorted(results) == sorted((k, x * 2) for k, x in values)
+        for key in range(7):
+            assert [x for k, x in results if k == key] == [x * 2 for k, x in values if k == key]
+
+    def test_parallel_by_key_runs_shards_on_own_threads(self):
+        threads = {}
+        lock = threading.Lock()
+
+        def record(value):
+            with lock:
+                threads.setdefault(value % 4, set()).add(threading.current_thread())
+            return value
+
+        source = rx.range(100).pipe(ops.parallel_by_key(lambda x: x % 4, shards=4, pipeline=ops.map(record)))
+        assert sorted(self.run_source(source)) == list(range(100))
+
+        # Every key stays on one thread, and shards do not share threads.
+        assert all(len(shard_threads) == 1 for shard_threads in threads.values())
+        assert len(set.union(*threads.values())) == 4
+
+    def test_parallel_by_key_scheduler_factory(self):
+        schedulers = []
+
+        def factory():
+            scheduler = EventLoopScheduler(exit_if_empty=True)
+            schedulers.append(scheduler)
+            return scheduler
+
+        source = rx.range(10).pipe(ops.parallel_by_key(lambda x: x, shards=3, scheduler_factory=factory))
+        assert sorted(self.run_source(source)) == list(range(10))
+        assert len(schedulers) == 3
+
+    def test_parallel_by_key_key_mapper_error(self):
+        ex = RxException('ex')
+
+        def key_mapper(value):
+            if value == 3:
+                raise ex
+            return value
+
+        source = rx.range(10).pipe(ops.parallel_by_key(key_mapper, shards=2))
+        results = self.run_source(source)
+        assert results[-1] is ex
+
+    def test_parallel_by_key_pipeline_error(self):
+        ex = RxException('ex')
+
+        def mapper(value):
+            if value == 5:
+                raise ex
+            return value
+
+        source = rx.range(10).pipe(ops.parallel_by_key(lambda x: x, shards=2, pipeline=ops.map(mapper)))
+        results = self.run_source(source)
+        assert results[-1] is ex
+        assert results.count(ex) == 1
+
+    def test_parallel_by_key_invalid_shards(self):
+        with self.assertRaises(ValueError):
+            ops.parallel_by_key(lambda x: x, shards=0)
@@ -0,0 +1,102 @@
+import unittest
+
+from rx import operators as ops
+from rx.subject import Subject
+from rx.testing import TestScheduler, ReactiveTest
+
+on_next = ReactiveTest.on_next
+on_completed = ReactiveTest.on_completed
+on_error = ReactiveTest.on_error
+subscribe = ReactiveTest.subscribe
+subscribed = ReactiveTest.subscribed
+disposed = ReactiveTest.disposed
+created = ReactiveTest.created
+
+
+class TestPausable(unittest.TestCase):
+
+    def test_pausable_no_pause(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(220, 2), on_completed(230))
+        pauser = scheduler.create_hot_observable()
+
+        results = scheduler.start(lambda: xs.pipe(ops.pausable(pauser)))
+        assert results.messages == [on_next(210, 1), on_next(220, 2), on_completed(230)]
+
+    def test_pausable_drops_while_paused(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(230, 2), on_next(240, 3), on_next(260, 4), on_completed(270))
+        pauser = scheduler.create_hot_observable(on_next(220, False), on_next(250, True))
+
+        results = scheduler.start(lambda: xs.pipe(ops.pausable(pauser)))
+        assert results.messages == [on_next(210, 1), on_next(260, 4), on_completed(270)]
+        assert xs.subscriptions == [subscribe(200, 270)]
+
+    def test_pausable_pauser_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(210, 1), on_next(230, 2), on_completed(270))
+        pauser = scheduler.create_hot_observable(on_error(220, ex))
+
+        results = scheduler.start(lambda: xs.pipe(ops.pausable(pauser)))
+        assert results.messages == [on_next(210, 1), on_error(220, ex)]
+
+    def test_pausable_buffered_emits_on_resume(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(210, 1), on_next(230, 2), on_next(240, 3), on_next(260, 4), on_completed(270))
+        pauser = scheduler.create_hot_observable(on_next(220, False), on_next(250, True))
+
+        results = scheduler.start(lambda: xs.pipe(ops.pausable_buffered(pauser)))
+        assert results.messages == [on_next(210, 1), on_next(250, 2), on_next(250, 3),
+                                    on_next(260, 4), on_completed(270)]
+
+    def test_pausable_buffered_delays_completion(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(230, 2), on_completed(240))
+        pauser = scheduler.create_hot_observable(on_next(220, False), on_next(250, True))
+
+        results = scheduler.start(lambda: xs.pipe(ops.pausable_buffered(pauser)))
+        assert results.messages == [on_next(250, 2), on_completed(250)]
+
+    def test_pausable_buffered_max_buffer(self):
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(
+            on_next(230, 1), on_next(231, 2), on_next(232, 3), on_next(233, 4), on_completed(300))
+        pauser = scheduler.create_hot_observable(on_next(220, False), on_next(250, True))
+
+        results = scheduler.start(lambda: xs.pipe(ops.pausable_buffered(pauser, max_buffer=2)))
+        assert results.messages == [on_next(250, 3), on_next(250, 4), on_completed(300)]
+
+    def test_pausable_buffered_error(self):
+        ex = 'ex'
+        scheduler = TestScheduler()
+        xs = scheduler.create_hot_observable(on_next(230, 1), on_error(240, ex))
+        pauser = scheduler.create_hot_observable(on_next(220, False), on_next(250, True))
+
+        results = scheduler.start(lambda: xs.pipe(ops.pausable_buffered(pauser)))
+        assert results.messages == [on_error(240, ex)]
+
+    def test_pausable_buffered_pause_while_draining(self):
+        pauser = Subject()
+        source = Subject()
+        results = []
+
+        def on_next(value):
+            results.append(value)
+            if value == 2:
+                pauser.on_next(False)
+
+        source.pipe(ops.pausable_buffered(pauser)).subscribe(on_next)
+        pauser.on_next(False)
+        for value in range(1, 5):
+            source.on_next(value)
+        pauser.on_next(True)
+        assert results == [1, 2]
+        pauser.on_next(True)
+        assert results == [1, 2, 3, 4]
+
+    def test_pausable_buffered_invalid_max_buffer(self):
+        with self.assertRaises(ValueError):
+            ops.pausable_buffered(Subject(), max_buffer=0)
@@ -2,6 +2,7 @@ import unittest
 
 import rx
 from rx import operators as ops
+from rx.scheduler import ImmediateScheduler
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -93,3 +94,40 @@ class TestRange(unittest.TestCase):
                                     on_next(200, 6),
                                     on_next(200, 8),
                                     on_completed(200)]
+
+    def test_range_yield_every(self):
+        scheduler = TestScheduler()
+
+        def create():
+            return rx.merge(rx.range(0, 4, yield_every=2), rx.range(10, 14, yield_every=2))
+
+        results = scheduler.start(create)
+        assert results.messages == [on_next(200, 0),
+                                    on_next(200, 1),
+                                    on_next(200, 10),
+                                    on_next(200, 11),
+                                    on_next(200, 2),
+                                    on_next(200, 3),
+                                    on_next(200, 12),
+                                    on_next(200, 13),
+                                    on_completed(200)]
+
+    def test_range_stops_when_disposed(self):
+        emitted = []
+
+        rx.range(10 ** 12).pipe(
+            ops.do_action(emitted.append),
+            ops.take(3)
+        ).subscribe()
+        assert emitted == [0, 1, 2]
+
+    def test_range_immediate_scheduler_take(self):
+        emitted = []
+
+        results = rx.range(10 ** 12, scheduler=ImmediateScheduler()).pipe(
+            ops.do_action(emitted.append),
+            ops.take(3),
+            ops.to_list()
+        ).run()
+        assert results == [0, 1, 2]
+        assert emitted == [0, 1, 2]
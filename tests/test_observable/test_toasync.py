@@ -1,6 +1,8 @@
+import threading
 import unittest
 
 import rx
+from rx import operators as ops
 from rx.testing import TestScheduler, ReactiveTest
 
 on_next = ReactiveTest.on_next
@@ -181,3 +183,14 @@ class TestToAsync(unittest.TestCase):
 
         assert res.messages == [
             on_error(200, ex)]
+
+    def test_to_async_default_scheduler_concurrent(self):
+        barrier = threading.Barrier(2, timeout=1)
+
+        def func(x):
+            barrier.wait()
+            return x
+
+        func_async = rx.to_async(func)
+        result = rx.merge(func_async(1), func_async(2)).pipe(ops.to_list()).run()
+        assert sorted(result) == [1, 2]
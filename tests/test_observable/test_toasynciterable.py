@@ -0,0 +1,195 @@
+import asyncio
+import threading
+import unittest
+
+import rx
+from rx import operators as ops
+from rx.internal.exceptions import OverflowException
+from rx.subject import Subject
+
+
+class TestToAsyncIterable(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_async_for(self):
+        result = []
+
+        async def go():
+            async for x in rx.from_([1, 2, 3]):
+                result.append(x)
+
+        self.loop.run_until_complete(go())
+        assert result == [1, 2, 3]
+
+    def test_async_for_empty(self):
+        result = []
+
+        async def go():
+            async for x in rx.empty():
+                result.append(x)
+
+        self.loop.run_until_complete(go())
+        assert result == []
+
+    def test_async_for_error(self):
+        ex = Exception('ex')
+        result = []
+
+        async def go():
+            async for x in rx.from_([1, 2]).pipe(ops.concat(rx.throw(ex))):
+                result.append(x)
+
+        with self.assertRaises(Exception) as context:
+            self.loop.run_until_complete(go())
+        assert context.exception is ex
+        assert result == [1, 2]
+
+    def test_pulls_iterable_within_maxsize(self):
+        pulled = []
+        result = []
+
+        def numbers():
+            for x in range(100):
+                pulled.append(x)
+                yield x
+
+        async def go():
+            async for x in rx.from_iterable(numbers()).pipe(ops.to_async_iterable(maxsize=10)):
+                result.append(x)
+                assert len(pulled) - len(result) <= 10
+                if x == 24:
+                    break
+
+        self.loop.run_until_complete(go())
+        assert result == list(range(25))
+        assert len(pulled) <= 35
+
+    def test_break_disposes_subscription(self):
+        disposed = []
+        source = Subject()
+
+        def subscribe(observer, scheduler=None):
+            subscription = source.subscribe(observer)
+
+            def dispose():
+                disposed.append(True)
+                subscription.dispose()
+            return dispose
+
+        async def produce():
+            for x in range(10):
+                source.on_next(x)
+                await asyncio.sleep(0)
+
+        async def go():
+            self.loop.create_task(produce())
+            async for x in rx.create(subscribe).pipe(ops.to_async_iterable()):
+                if x == 3:
+                    break
+            # Disposed right away, not when the loop gets to finalize it
+            assert disposed == [True]
+
+        self.loop.run_until_complete(go())
+        assert disposed == [True]
+
+    def test_aclose_disposes_subscription(self):
+        disposed = []
+        source = Subject()
+
+        def subscribe(observer, scheduler=None):
+            subscription = source.subscribe(observer)
+
+            def dispose():
+                disposed.append(True)
+                subscription.dispose()
+            return dispose
+
+        async def go():
+            iterator = rx.create(subscribe).pipe(ops.to_async_iterable()).__aiter__()
+            self.loop.call_soon(source.on_next, 1)
+            assert await iterator.__anext__() == 1
+            await iterator.aclose()
+            assert disposed == [True]
+            with self.assertRaises(StopAsyncIteration):
+                await iterator.__anext__()
+            await iterator.aclose()
+
+        self.loop.run_until_complete(go())
+        assert disposed == [True]
+        assert not source.observers
+
+    def test_from_other_thread_blocks_producer(self):
+        source = Subject()
+        result = []
+        max_backlog = 0
+
+        def produce():
+            for x in range(200):
+                source.on_next(x)
+                backlog = x + 1 - len(result)
+                nonlocal max_backlog
+                max_backlog = max(max_backlog, backlog)
+            source.on_completed()
+
+        async def go():
+            iterator = source.pipe(ops.to_async_iterable(maxsize=5)).__aiter__()
+            first = self.loop.create_task(iterator.__anext__())
+            await asyncio.sleep(0)
+            thread = threading.Thread(target=produce)
+            thread.start()
+            result.append(await first)
+            async for x in iterator:
+                result.append(x)
+                await asyncio.sleep(0)
+            thread.join()
+
+        self.loop.run_until_complete(go())
+        assert result == list(range(200))
+        assert max_backlog <= 7
+
+    def test_drop_oldest(self):
+        source = Subject()
+        result = []
+
+        async def go():
+            iterator = source.pipe(ops.to_async_iterable(maxsize=2, overflow='drop_oldest')).__aiter__()
+            first = self.loop.create_task(iterator.__anext__())
+            await asyncio.sleep(0)
+            for x in range(5):
+                source.on_next(x)
+            source.on_completed()
+            result.append(await first)
+            async for x in iterator:
+                result.append(x)
+
+        self.loop.run_until_complete(go())
+        assert result == [3, 4]
+
+    def test_overflow_error(self):
+        source = Subject()
+        result = []
+
+        async def go():
+            iterator = source.pipe(ops.to_async_iterable(maxsize=2, overflow='error')).__aiter__()
+            first = self.loop.create_task(iterator.__anext__())
+            await asyncio.sleep(0)
+            for x in range(5):
+                source.on_next(x)
+            result.append(await first)
+            async for x in iterator:
+                result.append(x)
+
+        with self.assertRaises(OverflowException):
+            self.loop.run_until_complete(go())
+        assert result == [0, 1]
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            ops.to_async_iterable(maxsize=0)
+        with self.assertRaises(ValueError):
+            ops.to_async_iterable(overflow='unknown')
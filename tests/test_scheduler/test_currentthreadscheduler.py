@@ -179,3 +179,80 @@ class TestCurrentThreadScheduler(unittest.TestCase):
         scheduler.ensure_trampoline(outer_action)
         assert ran1 is True
         assert ran2 is False
+
+    def test_currentthread_monotonic_clock(self):
+        scheduler = CurrentThreadScheduler()
+        result = []
+
+        def inner(scheduler, state):
+            result.append(state)
+
+        def outer(scheduler, state):
+            scheduler.schedule_relative(0.02, inner, 3)
+            scheduler.schedule(inner, 2)
+            result.append(1)
+
+        CurrentThreadScheduler.monotonic_clock = True
+        try:
+            scheduler.schedule(outer)
+        finally:
+            CurrentThreadScheduler.monotonic_clock = False
+        assert result == [1, 2, 3]
+
+    def test_currentthread_schedule_fifo(self):
+        scheduler = CurrentThreadScheduler()
+        result = []
+
+        def inner(scheduler, state):
+            result.append(state)
+            if state < 3:
+                scheduler.schedule(inner, state + 10)
+
+        def outer(scheduler, state):
+            for i in range(3):
+                scheduler.schedule(inner, i)
+            result.append('outer')
+
+        scheduler.schedule(outer)
+        assert result == ['outer', 0, 1, 2, 10, 11, 12]
+
+    def test_currentthread_schedule_due_after_immediate(self):
+        scheduler = CurrentThreadScheduler()
+        result = []
+
+        def inner(scheduler, state):
+            result.append(state)
+
+        def outer(scheduler, state):
+            scheduler.schedule_relative(0.02, inner, 'delayed')
+            scheduler.schedule_relative(0.01, inner, 'sooner')
+            scheduler.schedule(inner, 'immediate')
+            d = scheduler.schedule(inner, 'cancelled')
+            d.dispose()
+
+        scheduler.schedule(outer)
+        assert result == ['immediate', 'sooner', 'delayed']
+
+    def test_currentthread_delayed_not_starved(self):
+        scheduler = CurrentThreadScheduler()
+        delayed_ran = False
+        count = 0
+
+        def delayed(scheduler, state):
+            nonlocal delayed_ran
+            delayed_ran = True
+
+        def recursive(scheduler, state):
+            nonlocal count
+            count += 1
+            if not delayed_ran and count < 1000000:
+                sleep(0.0001)
+                scheduler.schedule(recursive)
+
+        def outer(scheduler, state):
+            scheduler.schedule_relative(0.01, delayed)
+            scheduler.schedule(recursive)
+
+        scheduler.schedule(outer)
+        assert delayed_ran is True
+        assert count < 1000000
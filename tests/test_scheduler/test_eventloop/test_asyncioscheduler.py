@@ -3,6 +3,7 @@ import unittest
 import asyncio
 from datetime import datetime, timedelta
 
+from rx.disposable import Disposable
 from rx.scheduler.eventloop import AsyncIOScheduler
 
 
@@ -82,3 +83,55 @@ class TestAsyncIOScheduler(unittest.TestCase):
             assert ran is False
 
         loop.run_until_complete(go())
+
+    def test_asyncio_schedule_handle_dispose(self):
+        loop = asyncio.new_event_loop()
+        scheduler = AsyncIOScheduler(loop)
+        result = []
+        inner_disposed = []
+
+        def action(scheduler, state):
+            result.append(state)
+
+            def dispose():
+                inner_disposed.append(state)
+            return Disposable(dispose)
+
+        async def go():
+            scheduler.schedule(action, 1)
+            scheduler.schedule(action, 2).dispose()
+            d3 = scheduler.schedule(action, 3)
+            scheduler.schedule_relative(0.01, action, 4).dispose()
+            await asyncio.sleep(0.05)
+            d3.dispose()
+            d3.dispose()
+
+        try:
+            loop.run_until_complete(go())
+        finally:
+            loop.close()
+
+        assert result == [1, 3]
+        assert inner_disposed == [3]
+
+    def test_asyncio_schedule_absolute_float(self):
+        loop = asyncio.new_event_loop()
+        scheduler = AsyncIOScheduler(loop)
+        endtime = None
+
+        def action(scheduler, state):
+            nonlocal endtime
+            endtime = loop.time()
+
+        async def go():
+            starttime = loop.time()
+            scheduler.schedule_absolute(starttime + 0.05, action)
+            scheduler.schedule_absolute(scheduler.now + timedelta(seconds=0.05), action)
+            await asyncio.sleep(0.2)
+            assert endtime is not None
+            assert 0.04 < endtime - starttime < 0.18
+
+        try:
+            loop.run_until_complete(go())
+        finally:
+            loop.close()
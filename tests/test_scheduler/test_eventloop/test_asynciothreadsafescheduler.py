@@ -92,3 +92,93 @@ class TestAsyncIOThreadSafeScheduler(unittest.TestCase):
             assert ran is False
 
         loop.run_until_complete(go())
+
+    def test_asyncio_threadsafe_schedule_batched(self):
+        loop = asyncio.new_event_loop()
+        scheduler = AsyncIOThreadSafeScheduler(loop, batch=True)
+        result = []
+        wakeups = 0
+
+        call_soon_threadsafe = loop.call_soon_threadsafe
+
+        def counting_call_soon_threadsafe(*args, **kwargs):
+            nonlocal wakeups
+            wakeups += 1
+            return call_soon_threadsafe(*args, **kwargs)
+
+        loop.call_soon_threadsafe = counting_call_soon_threadsafe
+
+        def action(scheduler, state):
+            result.append((state, threading.current_thread()))
+
+        def produce():
+            for i in range(1000):
+                scheduler.schedule(action, i)
+
+        async def go():
+            thread = threading.Thread(target=produce)
+            thread.start()
+            while len(result) < 1000:
+                await asyncio.sleep(0.01)
+            thread.join()
+
+        try:
+            loop.run_until_complete(go())
+        finally:
+            loop.close()
+
+        assert [state for state, _ in result] == list(range(1000))
+        assert all(thread is threading.main_thread() for _, thread in result)
+        assert wakeups < 1000
+
+    def test_asyncio_threadsafe_schedule_batched_cancel(self):
+        loop = asyncio.new_event_loop()
+        scheduler = AsyncIOThreadSafeScheduler(loop, batch=True)
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+
+        async def go():
+            def produce():
+                scheduler.schedule(action, 1)
+                scheduler.schedule(action, 2).dispose()
+                scheduler.schedule(action, 3)
+
+            thread = threading.Thread(target=produce)
+            thread.start()
+            thread.join()
+            await asyncio.sleep(0.05)
+
+        try:
+            loop.run_until_complete(go())
+        finally:
+            loop.close()
+
+        assert result == [1, 3]
+
+    def test_asyncio_threadsafe_schedule_batched_error(self):
+        loop = asyncio.new_event_loop()
+        scheduler = AsyncIOThreadSafeScheduler(loop, batch=True)
+        errors = []
+        result = []
+
+        loop.set_exception_handler(lambda loop, context: errors.append(context['exception']))
+
+        def action(scheduler, state):
+            if state == 2:
+                raise ValueError(state)
+            result.append(state)
+
+        async def go():
+            for i in range(4):
+                scheduler.schedule(action, i)
+            await asyncio.sleep(0.05)
+
+        try:
+            loop.run_until_complete(go())
+        finally:
+            loop.close()
+
+        assert result == [0, 1, 3]
+        assert len(errors) == 1 and isinstance(errors[0], ValueError)
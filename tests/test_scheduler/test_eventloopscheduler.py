@@ -226,3 +226,22 @@ class TestEventLoopScheduler(unittest.TestCase):
 
         assert ran is False
         assert scheduler._has_thread() is False
+
+    def test_event_loop_monotonic_clock(self):
+        class MonotonicEventLoopScheduler(EventLoopScheduler):
+            monotonic_clock = True
+
+        scheduler = MonotonicEventLoopScheduler(exit_if_empty=True)
+        gate = threading.Semaphore(0)
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+            if len(result) == 3:
+                gate.release()
+
+        scheduler.schedule_relative(0.05, action, 3)
+        scheduler.schedule_absolute(scheduler.now + timedelta(milliseconds=20), action, 2)
+        scheduler.schedule(action, 1)
+        gate.acquire()
+        assert result == [1, 2, 3]
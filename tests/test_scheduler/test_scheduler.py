@@ -1,6 +1,7 @@
 import unittest
 from datetime import timedelta
 
+from rx.internal.basic import default_now
 from rx.internal.constants import DELTA_ZERO, UTC_ZERO
 from rx.scheduler.scheduler import Scheduler
 
@@ -30,3 +31,24 @@ class TestScheduler(unittest.TestCase):
         assert val == DELTA_ZERO
         val = Scheduler.to_timedelta(UTC_ZERO)
         assert val == DELTA_ZERO
+
+    def test_base_monotonic_clock(self):
+        class MonotonicScheduler(Scheduler):
+            monotonic_clock = True
+
+            def schedule(self, action, state=None):
+                pass
+
+            def schedule_relative(self, duetime, action, state=None):
+                pass
+
+            def schedule_absolute(self, duetime, action, state=None):
+                pass
+
+        scheduler = MonotonicScheduler()
+        assert isinstance(scheduler._internal_now(), float)
+        assert abs(scheduler.now - default_now()) < timedelta(milliseconds=10)
+        assert scheduler._internal_time(UTC_ZERO) == 0.0
+        due = scheduler._internal_due(timedelta(seconds=-1))
+        assert isinstance(due, float)
+        assert due <= scheduler._internal_now()
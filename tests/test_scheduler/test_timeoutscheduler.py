@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 from datetime import timedelta
@@ -63,3 +64,117 @@ class TestTimeoutScheduler(unittest.TestCase):
 
         sleep(0.1)
         assert ran is False
+
+    def test_timeout_schedule_action_order(self):
+        scheduler = TimeoutScheduler()
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+
+        scheduler.schedule_relative(timedelta(milliseconds=60), action, 3)
+        scheduler.schedule_relative(timedelta(milliseconds=20), action, 1)
+        scheduler.schedule_relative(timedelta(milliseconds=40), action, 2)
+
+        sleep(0.2)
+        assert result == [1, 2, 3]
+
+    def test_timeout_schedule_reuses_threads(self):
+        scheduler = TimeoutScheduler()
+        threads = set()
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            threads.add(threading.current_thread())
+            gate.release()
+
+        for _ in range(10):
+            scheduler.schedule_relative(0.001, action)
+            assert gate.acquire(timeout=1)
+
+        assert threading.current_thread() not in threads
+        assert len(threads) < 10
+
+    def test_timeout_schedule_concurrent(self):
+        scheduler = TimeoutScheduler()
+        barrier = threading.Barrier(3, timeout=1)
+        passed = []
+
+        def action(scheduler, state):
+            barrier.wait()
+            passed.append(state)
+
+        for i in range(3):
+            scheduler.schedule(action, i)
+
+        sleep(0.2)
+        assert sorted(passed) == [0, 1, 2]
+
+    def test_timeout_schedule_blocking_action(self):
+        scheduler = TimeoutScheduler()
+        release = threading.Event()
+        ran = threading.Event()
+
+        def blocking(scheduler, state):
+            # Blocks on another timeout scheduled action.
+            scheduler.schedule_relative(0.02, lambda scheduler, state: release.set())
+            release.wait(timeout=1)
+
+        def action(scheduler, state):
+            ran.set()
+
+        scheduler.schedule(blocking)
+        scheduler.schedule_relative(0.01, action)
+        assert ran.wait(timeout=0.5)
+        assert release.wait(timeout=0.5)
+
+    def test_timeout_schedule_bounded_pool(self):
+        scheduler = TimeoutScheduler()
+        max_workers = TimeoutScheduler._max_workers
+        lock = threading.Lock()
+        release = threading.Event()
+        done = threading.Semaphore(0)
+        running = [0]
+        peak = [0]
+
+        def action(scheduler, state):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            release.wait(timeout=5)
+            with lock:
+                running[0] -= 1
+            done.release()
+
+        for _ in range(max_workers * 2):
+            scheduler.schedule(action)
+
+        deadline = default_now() + timedelta(seconds=5)
+        while peak[0] < max_workers and default_now() < deadline:
+            sleep(0.001)
+        sleep(0.05)
+        assert peak[0] == max_workers
+        release.set()
+        for _ in range(max_workers * 2):
+            assert done.acquire(timeout=5)
+        assert peak[0] == max_workers
+
+    def test_timeout_schedule_mixed_clock_modes(self):
+        class MonotonicTimeoutScheduler(TimeoutScheduler):
+            monotonic_clock = True
+
+        result = []
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            result.append(state)
+            gate.release()
+
+        TimeoutScheduler().schedule_relative(timedelta(milliseconds=60), action, 3)
+        MonotonicTimeoutScheduler().schedule_relative(0.02, action, 1)
+        TimeoutScheduler().schedule_absolute(default_now() + timedelta(milliseconds=40), action, 2)
+        MonotonicTimeoutScheduler().schedule_absolute(default_now() + timedelta(milliseconds=80), action, 4)
+
+        for _ in range(4):
+            assert gate.acquire(timeout=1)
+        assert result == [1, 2, 3, 4]
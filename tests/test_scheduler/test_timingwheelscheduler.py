@@ -0,0 +1,127 @@
+import unittest
+
+import threading
+from datetime import timedelta
+from time import sleep
+
+import rx
+from rx import operators as ops
+from rx.scheduler import TimingWheelScheduler
+from rx.internal import DisposedException
+from rx.internal.basic import default_now
+
+
+class TestTimingWheelScheduler(unittest.TestCase):
+
+    def test_timing_wheel_now(self):
+        scheduler = TimingWheelScheduler()
+        diff = scheduler.now - default_now()
+        assert abs(diff) < timedelta(milliseconds=1)
+
+    def test_timing_wheel_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TimingWheelScheduler(resolution=0)
+        with self.assertRaises(ValueError):
+            TimingWheelScheduler(wheel_size=1)
+        with self.assertRaises(ValueError):
+            TimingWheelScheduler(levels=0)
+
+    def test_timing_wheel_schedule_action(self):
+        scheduler = TimingWheelScheduler()
+        gate = threading.Semaphore(0)
+        thread_id = None
+
+        def action(scheduler, state):
+            nonlocal thread_id
+            thread_id = threading.current_thread().ident
+            gate.release()
+
+        scheduler.schedule(action)
+        assert gate.acquire(timeout=1)
+        assert thread_id != threading.current_thread().ident
+        scheduler.dispose()
+
+    def test_timing_wheel_schedule_action_due(self):
+        scheduler = TimingWheelScheduler(resolution=0.005)
+        starttime = default_now()
+        endtime = None
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            nonlocal endtime
+            endtime = default_now()
+            gate.release()
+
+        scheduler.schedule_relative(timedelta(milliseconds=100), action)
+        assert gate.acquire(timeout=1)
+        assert endtime - starttime >= timedelta(milliseconds=100)
+        scheduler.dispose()
+
+    def test_timing_wheel_schedule_ordered_actions(self):
+        scheduler = TimingWheelScheduler(resolution=0.005, wheel_size=4, levels=2)
+        gate = threading.Semaphore(0)
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+            if len(result) == 5:
+                gate.release()
+
+        # With 4 slots on 2 levels, these cover level 0, level 1 and the
+        # overflow slot.
+        for state, ms in [(5, 150), (3, 60), (1, 0), (4, 100), (2, 15)]:
+            scheduler.schedule_relative(timedelta(milliseconds=ms), action, state)
+
+        assert gate.acquire(timeout=2)
+        assert result == [1, 2, 3, 4, 5]
+        scheduler.dispose()
+
+    def test_timing_wheel_schedule_action_cancel(self):
+        scheduler = TimingWheelScheduler(resolution=0.005)
+        ran = False
+
+        def action(scheduler, state):
+            nonlocal ran
+            ran = True
+
+        d = scheduler.schedule_relative(timedelta(milliseconds=20), action)
+        d.dispose()
+        assert scheduler._count == 0
+
+        sleep(0.1)
+        assert ran is False
+        scheduler.dispose()
+
+    def test_timing_wheel_schedule_periodic(self):
+        scheduler = TimingWheelScheduler(resolution=0.005)
+        gate = threading.Semaphore(0)
+        counter = 3
+
+        def action(state):
+            nonlocal counter
+            counter -= 1
+            if not counter:
+                gate.release()
+            return state
+
+        disp = scheduler.schedule_periodic(0.02, action)
+        assert gate.acquire(timeout=1)
+        disp.dispose()
+        assert counter == 0
+        scheduler.dispose()
+
+    def test_timing_wheel_operator(self):
+        scheduler = TimingWheelScheduler(resolution=0.005)
+        result = rx.from_([1, 2, 3]).pipe(
+            ops.delay(0.02, scheduler=scheduler),
+            ops.to_list()
+        ).run()
+        assert result == [1, 2, 3]
+        scheduler.dispose()
+
+    def test_timing_wheel_dispose(self):
+        scheduler = TimingWheelScheduler()
+        scheduler.dispose()
+
+        with self.assertRaises(DisposedException):
+            scheduler.schedule(lambda s, t: None)
@@ -71,3 +71,25 @@ class TestVirtualTimeScheduler(unittest.TestCase):
 
         with pytest.raises(ArgumentOutOfRangeException):
             scheduler.advance_to(scheduler._clock - 1)
+
+    def test_virtual_schedule_cancel_compacts_queue(self):
+        scheduler = VirtualSchedulerTestScheduler()
+
+        disposables = [scheduler.schedule_relative(n + 1, lambda s, t: None) for n in range(100)]
+        for d in disposables[:80]:
+            d.dispose()
+
+        assert len(scheduler._queue) < 100
+        scheduler.start()
+        assert scheduler.clock == 100
+
+    def test_virtual_schedule_dispose_after_run_not_counted(self):
+        scheduler = VirtualSchedulerTestScheduler()
+
+        disposables = [scheduler.schedule_relative(n + 1, lambda s, t: None) for n in range(100)]
+        scheduler.advance_to(50)
+        for d in disposables[:50]:
+            d.dispose()
+
+        assert scheduler._queue.cancelled == 0
+        assert len(scheduler._queue) == 50
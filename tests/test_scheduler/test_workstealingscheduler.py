@@ -0,0 +1,232 @@
+import unittest
+
+import threading
+from datetime import timedelta
+from time import sleep
+
+import rx
+from rx import operators as ops
+from rx.scheduler import WorkStealingScheduler
+from rx.internal import DisposedException
+from rx.internal.basic import default_now
+
+
+class TestWorkStealingScheduler(unittest.TestCase):
+
+    def test_work_stealing_now(self):
+        scheduler = WorkStealingScheduler()
+        diff = scheduler.now - default_now()
+        assert abs(diff) < timedelta(milliseconds=1)
+
+    def test_work_stealing_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            WorkStealingScheduler(max_workers=0)
+
+    def test_work_stealing_schedule_action(self):
+        scheduler = WorkStealingScheduler()
+        gate = threading.Semaphore(0)
+        thread_id = None
+
+        def action(scheduler, state):
+            nonlocal thread_id
+            thread_id = threading.current_thread().ident
+            gate.release()
+
+        scheduler.schedule(action)
+        assert gate.acquire(timeout=1)
+        assert thread_id != threading.current_thread().ident
+        scheduler.dispose()
+
+    def test_work_stealing_schedule_action_due(self):
+        scheduler = WorkStealingScheduler()
+        starttime = default_now()
+        endtime = None
+        gate = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            nonlocal endtime
+            endtime = default_now()
+            gate.release()
+
+        scheduler.schedule_relative(timedelta(milliseconds=100), action)
+        assert gate.acquire(timeout=1)
+        assert endtime - starttime >= timedelta(milliseconds=100)
+        scheduler.dispose()
+
+    def test_work_stealing_schedule_ordered_timers(self):
+        scheduler = WorkStealingScheduler(max_workers=1)
+        gate = threading.Semaphore(0)
+        result = []
+
+        def action(scheduler, state):
+            result.append(state)
+            if len(result) == 4:
+                gate.release()
+
+        for state, ms in [(4, 80), (2, 20), (1, 0), (3, 50)]:
+            scheduler.schedule_relative(timedelta(milliseconds=ms), action, state)
+
+        assert gate.acquire(timeout=2)
+        assert result == [1, 2, 3, 4]
+        scheduler.dispose()
+
+    def test_work_stealing_schedule_action_cancel(self):
+        scheduler = WorkStealingScheduler()
+        ran = False
+
+        def action(scheduler, state):
+            nonlocal ran
+            ran = True
+
+        d = scheduler.schedule_relative(timedelta(milliseconds=20), action)
+        d.dispose()
+
+        sleep(0.1)
+        assert ran is False
+        scheduler.dispose()
+
+    def test_work_stealing_max_workers(self):
+        scheduler = WorkStealingScheduler(max_workers=3)
+        lock = threading.Lock()
+        threads = set()
+        running = 0
+        max_running = 0
+        done = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+                threads.add(threading.current_thread().ident)
+            sleep(0.01)
+            with lock:
+                running -= 1
+            done.release()
+
+        for _ in range(20):
+            scheduler.schedule(action)
+        for _ in range(20):
+            assert done.acquire(timeout=2)
+
+        assert len(threads) <= 3
+        assert max_running <= 3
+        scheduler.dispose()
+
+    def test_work_stealing_steals_nested_work(self):
+        scheduler = WorkStealingScheduler(max_workers=4)
+        lock = threading.Lock()
+        threads = set()
+        done = threading.Semaphore(0)
+
+        def inner(scheduler, state):
+            with lock:
+                threads.add(threading.current_thread().ident)
+            sleep(0.01)
+            done.release()
+
+        def outer(scheduler, state):
+            for _ in range(40):
+                scheduler.schedule(inner)
+
+        scheduler.schedule(outer)
+        for _ in range(40):
+            assert done.acquire(timeout=2)
+
+        # All nested work went to the queue of the first worker, so the
+        # other workers can only have run it by stealing.
+        assert len(threads) > 1
+        scheduler.dispose()
+
+    def test_work_stealing_periodic_does_not_hold_worker(self):
+        scheduler = WorkStealingScheduler(max_workers=1)
+        gate = threading.Semaphore(0)
+        ran = threading.Event()
+        counter = 3
+
+        def periodic(state):
+            nonlocal counter
+            counter -= 1
+            if not counter:
+                gate.release()
+            return state
+
+        def action(scheduler, state):
+            ran.set()
+
+        disp = scheduler.schedule_periodic(0.05, periodic)
+        scheduler.schedule(action)
+        assert ran.wait(timeout=0.04)
+        assert gate.acquire(timeout=1)
+        disp.dispose()
+        assert counter == 0
+        scheduler.dispose()
+
+    def test_work_stealing_dispose(self):
+        scheduler = WorkStealingScheduler()
+        scheduler.dispose()
+        with self.assertRaises(DisposedException):
+            scheduler.schedule(lambda scheduler, state: None)
+
+    def test_work_stealing_operator(self):
+        scheduler = WorkStealingScheduler()
+        result = rx.from_([1, 2, 3]).pipe(
+            ops.delay(0.02, scheduler=scheduler),
+            ops.to_list()
+        ).run()
+        assert result == [1, 2, 3]
+        scheduler.dispose()
+
+    def test_work_stealing_timer_with_busy_worker(self):
+        scheduler = WorkStealingScheduler(max_workers=4)
+        busy = threading.Event()
+        release = threading.Event()
+        gate = threading.Semaphore(0)
+        starttime = default_now()
+        endtime = None
+
+        def block(scheduler, state):
+            busy.set()
+            release.wait(timeout=2)
+
+        def action(scheduler, state):
+            nonlocal endtime
+            endtime = default_now()
+            gate.release()
+
+        scheduler.schedule(block)
+        assert busy.wait(timeout=1)
+        starttime = default_now()
+        scheduler.schedule_relative(0.01, action)
+        try:
+            assert gate.acquire(timeout=1)
+            assert endtime - starttime < timedelta(milliseconds=500)
+        finally:
+            release.set()
+            scheduler.dispose()
+
+    def test_work_stealing_released_timers_start_workers(self):
+        scheduler = WorkStealingScheduler(max_workers=3)
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+        done = threading.Semaphore(0)
+
+        def action(scheduler, state):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            sleep(0.1)
+            with lock:
+                running -= 1
+            done.release()
+
+        duetime = scheduler.now + timedelta(milliseconds=20)
+        for _ in range(3):
+            scheduler.schedule_absolute(duetime, action)
+        for _ in range(3):
+            assert done.acquire(timeout=2)
+
+        assert max_running == 3
+        scheduler.dispose()
@@ -0,0 +1,78 @@
+import asyncio
+import unittest
+
+from rx.internal import DisposedException
+from rx.subject import AsyncStream
+
+
+class TestAsyncStream(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_on_next_awaits_observers(self):
+        results = []
+
+        async def go():
+            stream = AsyncStream()
+
+            async def slow(value):
+                await asyncio.sleep(0.001)
+                results.append(('slow', value))
+
+            async def fast(value):
+                results.append(('fast', value))
+
+            await stream.subscribe_async(slow)
+            await stream.subscribe_async(fast)
+            await stream.on_next_async(1)
+            results.append('sent')
+            await stream.on_completed_async()
+
+        self.loop.run_until_complete(go())
+        assert results == [('slow', 1), ('fast', 1), 'sent']
+
+    def test_dispose_subscription(self):
+        results = []
+
+        async def go():
+            stream = AsyncStream()
+
+            async def on_next_async(value):
+                results.append(value)
+
+            subscription = await stream.subscribe_async(on_next_async)
+            await stream.on_next_async(1)
+            subscription.dispose()
+            await stream.on_next_async(2)
+
+        self.loop.run_until_complete(go())
+        assert results == [1]
+
+    def test_subscribe_after_error(self):
+        ex = Exception('ex')
+        results = []
+
+        async def go():
+            stream = AsyncStream()
+            await stream.on_error_async(ex)
+
+            async def on_error_async(error):
+                results.append(error)
+
+            await stream.subscribe_async(None, on_error_async)
+
+        self.loop.run_until_complete(go())
+        assert results == [ex]
+
+    def test_disposed(self):
+        async def go():
+            stream = AsyncStream()
+            stream.dispose()
+            await stream.on_next_async(1)
+
+        with self.assertRaises(DisposedException):
+            self.loop.run_until_complete(go())